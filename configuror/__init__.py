@@ -1,8 +1,40 @@
 __version__ = '0.1.3'
 
-from .exceptions import ConfigurorError, DecodeError, UnknownExtensionError
-from .main import ENV_TYPE, EXTENSIONS, INI_TYPE, JSON_TYPE, PYTHON_TYPE, TOML_TYPE, YAML_TYPE, Config
-from .utils import bool_converter, decimal_list, float_list, int_list, path_list, string_list
+from .columnar import RecordTable
+from .exceptions import (
+    BindError,
+    CaseCollisionError,
+    ConfigurorError,
+    DecodeError,
+    FetchError,
+    InterpolationError,
+    ResourceLimitError,
+    SecretError,
+    UnknownExtensionError,
+)
+from .history import ConfigHistory
+from .limits import Limits
+from .main import (
+    CBOR_TYPE,
+    ENV_TYPE,
+    EXTENSIONS,
+    INI_TYPE,
+    JSON_TYPE,
+    MEDIA_TYPES,
+    MSGPACK_TYPE,
+    PYTHON_TYPE,
+    TOML_TYPE,
+    YAML_TYPE,
+    Config,
+    register_loader,
+)
+from .objects import ConfigSection
+from .secrets import FileSecretProvider, SecretProvider, SecretResolver
+from .server import ConfigServer
+from .shared import ConfigSnapshot, SharedConfig
+from .sources import HttpFetcher
+from .utils import ChangeSet, bool_converter, decimal_list, float_list, int_list, path_list, string_list
+from .views import ConfigOverlay, NamespaceView
 
 __all__ = [
     # main
@@ -13,12 +45,45 @@ __all__ = [
     'TOML_TYPE',
     'PYTHON_TYPE',
     'INI_TYPE',
+    'MSGPACK_TYPE',
+    'CBOR_TYPE',
     'EXTENSIONS',
+    'MEDIA_TYPES',
+    'register_loader',
+    # columnar
+    'RecordTable',
+    # history
+    'ConfigHistory',
+    # limits
+    'Limits',
+    # objects
+    'ConfigSection',
+    # secrets
+    'SecretResolver',
+    'SecretProvider',
+    'FileSecretProvider',
+    # server
+    'ConfigServer',
+    # shared
+    'SharedConfig',
+    'ConfigSnapshot',
+    # sources
+    'HttpFetcher',
     # exceptions
     'ConfigurorError',
     'DecodeError',
+    'FetchError',
+    'InterpolationError',
+    'ResourceLimitError',
+    'SecretError',
+    'CaseCollisionError',
+    'BindError',
     'UnknownExtensionError',
+    # views
+    'ConfigOverlay',
+    'NamespaceView',
     # utils
+    'ChangeSet',
     'bool_converter',
     'string_list',
     'int_list',
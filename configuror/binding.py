@@ -0,0 +1,222 @@
+"""Module which binds configuration mappings to dataclasses and named tuples"""
+import dataclasses
+import typing
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple, Type, TypeVar
+
+from .exceptions import BindError
+from .utils import bool_converter, decimal_list, float_list, int_list, path_list, string_list
+
+T = TypeVar('T')
+Converter = Optional[Callable[[Any], Any]]
+
+_MISSING = object()
+# errors raised by converters, reported as BindError
+_CONVERSION_ERRORS = (TypeError, ValueError, ArithmeticError)
+
+# item type -> converter used when a list field is given a string, e.g. "1, 2, 3" in an ini file
+_LIST_CONVERTERS: Dict[Any, Callable[[str], list]] = {
+    str: string_list,
+    int: int_list,
+    float: float_list,
+    Decimal: decimal_list,
+    Path: path_list,
+}
+
+# target class -> function building an instance from a mapping, compiled on the first bind of the class
+_plans: Dict[type, Callable[[Mapping], Any]] = {}
+
+
+def _is_model(target: Any) -> bool:
+    return isinstance(target, type) and (
+        dataclasses.is_dataclass(target) or (issubclass(target, tuple) and hasattr(target, '_fields'))
+    )
+
+
+def _convert_bool(value: Any) -> bool:
+    if isinstance(value, bool):
+        return value
+    return bool_converter(value) if isinstance(value, str) else bool(value)
+
+
+def _class_converter(target: type) -> Converter:
+    if target is bool:
+        return _convert_bool
+
+    def convert(value: Any) -> Any:
+        return value if isinstance(value, target) else target(value)
+
+    return convert
+
+
+def _list_converter(item_type: Any, container: type) -> Converter:
+    convert_item = _converter(item_type)
+    split = _LIST_CONVERTERS.get(item_type)
+
+    def convert(value: Any) -> Any:
+        if isinstance(value, str):
+            if split is None:
+                raise ValueError(f'cannot convert string {value!r} to a list of {item_type}')
+            return container(split(value))
+        if convert_item is None:
+            return value if type(value) is container else container(value)
+        if container is list:
+            return [convert_item(item) for item in value]
+        return container(convert_item(item) for item in value)
+
+    return convert
+
+
+def _dict_converter(value_type: Any) -> Converter:
+    convert_value = _converter(value_type)
+    if convert_value is None:
+        return dict
+
+    def convert(value: Mapping) -> Dict[Any, Any]:
+        return {key: convert_value(item) for key, item in value.items()}
+
+    return convert
+
+
+def _optional_converter(convert: Callable[[Any], Any]) -> Converter:
+    def convert_optional(value: Any) -> Any:
+        return None if value is None else convert(value)
+
+    return convert_optional
+
+
+def _converter(annotation: Any) -> Converter:
+    """Returns the function converting a loaded value to the annotated type, or None if values are kept as they are."""
+    if _is_model(annotation):
+        return _plan(annotation)
+
+    origin = typing.get_origin(annotation)
+    arguments = typing.get_args(annotation)
+    if origin is typing.Union:
+        types = [argument for argument in arguments if argument is not type(None)]
+        if len(types) != 1:
+            return None
+        convert = _converter(types[0])
+        return None if convert is None else _optional_converter(convert)
+    if origin in (list, tuple, set, frozenset):
+        item_type = arguments[0] if arguments else Any
+        if origin is tuple and arguments[1:] != (Ellipsis,):
+            # items of fixed length tuples are not converted
+            return tuple
+        return _list_converter(item_type, origin)
+    if origin is dict:
+        return _dict_converter(arguments[1] if arguments else Any)
+    if origin is None and isinstance(annotation, type) and annotation is not object:
+        return _class_converter(annotation)
+    # Any, Literal, Callable and other typing constructs are not converted
+    return None
+
+
+def _model_fields(target: type) -> List[Tuple[str, str, Converter, bool]]:
+    """Returns (name, key, converter, required) for each field of a dataclass or named tuple."""
+    hints = typing.get_type_hints(target)
+    fields = []
+    if dataclasses.is_dataclass(target):
+        for field in dataclasses.fields(target):
+            if not field.init:
+                continue
+            convert = field.metadata.get('converter', _converter(hints.get(field.name, Any)))
+            required = field.default is dataclasses.MISSING and field.default_factory is dataclasses.MISSING
+            fields.append((field.name, field.metadata.get('key', field.name), convert, required))
+    else:
+        for name in target._fields:
+            fields.append((name, name, _converter(hints.get(name, Any)), name not in target._field_defaults))
+    return fields
+
+
+def _checked_builder(target: Type[T], fields: Tuple[Tuple[str, str, Converter, bool], ...]) -> Callable[[Mapping], T]:
+    """Returns a function building target field by field, raising BindError with the path of the invalid value."""
+
+    def build(data: Mapping) -> T:
+        if not isinstance(data, Mapping):
+            reason = f'expected a mapping, got {type(data).__name__}'
+            raise BindError('', reason, f'cannot bind {target.__name__}: {reason}')
+        kwargs = {}
+        for name, key, convert, required in fields:
+            value = data.get(key, _MISSING)
+            if value is _MISSING:
+                if required:
+                    raise BindError(key, 'missing value')
+                # the default value of the field is applied by the class
+                continue
+            if convert is None:
+                kwargs[name] = value
+                continue
+            try:
+                kwargs[name] = convert(value)
+            except BindError as e:
+                raise BindError(f'{key}.{e.path}' if e.path else key, e.reason) from None
+            except _CONVERSION_ERRORS as e:
+                raise BindError(key, f'{e}') from e
+        return target(**kwargs)
+
+    return build
+
+
+def _compile(target: Type[T]) -> Callable[[Mapping], T]:
+    """
+    Generates the source of a function building target with a single call, like a hand-written constructor call, and
+    compiles it. When a value is missing or cannot be converted, the checked builder is called to report the error.
+    """
+    fields = tuple(_model_fields(target))
+    namespace: Dict[str, Any] = {
+        'target': target,
+        'checked_build': _checked_builder(target, fields),
+        'errors': (KeyError, AttributeError, BindError, *_CONVERSION_ERRORS),
+    }
+    lines = ['def build(data):', '    try:']
+    arguments = []
+    for index, (name, key, convert, required) in enumerate(fields):
+        namespace[f'key_{index}'] = key
+        namespace[f'convert_{index}'] = convert
+        value = f'data[key_{index}]' if convert is None else f'convert_{index}(data[key_{index}])'
+        if required:
+            lines.append(f'        value_{index} = {value}')
+            arguments.append(f'{name}=value_{index}')
+        else:
+            if '**kwargs' not in arguments:
+                lines.append('        kwargs = {}')
+                arguments.append('**kwargs')
+            lines.append(f'        if key_{index} in data:')
+            lines.append(f'            kwargs[{name!r}] = {value}')
+    lines.append('    except errors:')
+    lines.append('        return checked_build(data)')
+    # errors raised by the class itself, e.g. in __post_init__, are not caught so that it is only called once
+    lines.append(f'    return target({", ".join(arguments)})')
+    # the source only contains field names, which are identifiers, the other values are passed in the namespace, so no
+    # untrusted input is executed
+    exec('\n'.join(lines), namespace)  # noqa: S102  # nosec B102
+    return namespace['build']
+
+
+def _plan(target: Type[T]) -> Callable[[Mapping], T]:
+    build = _plans.get(target)
+    if build is None:
+        # the placeholder is used by fields of classes referencing target while it is compiled
+        _plans[target] = lambda data: _plans[target](data)
+        try:
+            build = _plans[target] = _compile(target)
+        except BaseException:
+            del _plans[target]
+            raise
+    return build
+
+
+def bind(data: Mapping, target: Type[T]) -> T:
+    """
+    Builds an instance of a dataclass or named tuple from a mapping. Values are converted to the annotated types of the
+    fields and nested mappings are bound to nested dataclasses or named tuples. The conversion plan of a class is
+    compiled the first time it is bound and cached, so binding again only costs the conversions.
+    :param data: the mapping holding the values of the fields.
+    :param target: a dataclass or named tuple class.
+    :return: an instance of target.
+    """
+    if target not in _plans and not _is_model(target):
+        raise TypeError(f'{target!r} is not a dataclass or a named tuple class')
+    return _plan(target)(data)
@@ -0,0 +1,75 @@
+"""Module which holds the case-insensitive index of the keys of a Config"""
+import warnings
+from typing import Any, Dict, Iterable, List, Optional
+
+from .exceptions import CaseCollisionError
+
+CASE_COLLISION_POLICIES = ('warn', 'error', 'ignore')
+
+
+class CaseFoldIndex:
+    """
+    Maps case-folded string keys to the keys of a Config having this folded form. It is updated by each mutation of the
+    Config, so a case-insensitive lookup is a dict lookup whatever the size of the configuration. When several keys only
+    differ by case, the one created last is returned, setting again an existing key does not change it.
+    """
+
+    __slots__ = ('_keys', 'policy')
+
+    def __init__(self, policy: str = 'warn'):
+        if policy not in CASE_COLLISION_POLICIES:
+            raise ValueError(f'case collision policy must be one of {list(CASE_COLLISION_POLICIES)}, not {policy!r}')
+        self.policy = policy
+        # folded key -> keys of the config having this folded form, in the order they were added
+        self._keys: Dict[str, List[str]] = {}
+
+    def _report_collisions(self, keys: Iterable[Any]) -> None:
+        # all keys are checked before the index and the config are modified, so that an error leaves them unchanged
+        added: Dict[str, List[str]] = {}
+        for key in keys:
+            if not isinstance(key, str):
+                continue
+            folded = key.casefold()
+            others = added.setdefault(folded, list(self._keys.get(folded, ())))
+            if not others or key in others:
+                others.append(key)
+                continue
+            if self.policy == 'error':
+                raise CaseCollisionError(others[-1], key)
+            warnings.warn(str(CaseCollisionError(others[-1], key)), stacklevel=2)
+            others.append(key)
+
+    def add(self, keys: Iterable[Any]) -> None:
+        """Registers keys which are about to be set, reporting those only differing by case from other keys."""
+        if self.policy != 'ignore':
+            self._report_collisions(keys)
+        for key in keys:
+            if not isinstance(key, str):
+                continue
+            folded_keys = self._keys.setdefault(key.casefold(), [])
+            if key not in folded_keys:
+                folded_keys.append(key)
+
+    def remove(self, key: Any) -> None:
+        """Unregisters a key which was removed from the config."""
+        if not isinstance(key, str):
+            return
+        folded = key.casefold()
+        folded_keys = self._keys[folded]
+        folded_keys.remove(key)
+        if not folded_keys:
+            del self._keys[folded]
+
+    def clear(self) -> None:
+        self._keys.clear()
+
+    def copy(self) -> 'CaseFoldIndex':
+        """Returns an index which can be updated independently of this one, e.g. for a copy of the config."""
+        index = CaseFoldIndex(self.policy)
+        index._keys = {folded: list(keys) for folded, keys in self._keys.items()}
+        return index
+
+    def get(self, key: str) -> Optional[str]:
+        """Returns the key of the config matching key whatever its case, or None."""
+        folded_keys = self._keys.get(key.casefold())
+        return folded_keys[-1] if folded_keys else None
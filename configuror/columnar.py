@@ -0,0 +1,237 @@
+"""Module which holds a column-oriented storage for long lists of records sharing the same keys"""
+import sys
+from array import array
+from collections.abc import Mapping, Sequence
+from functools import partial
+from itertools import compress
+from operator import eq
+from typing import Any, Callable, Dict, Iterator, List, Union
+
+# typecodes of the arrays storing the indexes of dictionary encoded columns, from the smallest to the biggest
+_CODE_TYPECODES = ('B', 'H', 'L', 'Q')
+
+
+def _code_typecode(count: int) -> str:
+    for typecode in _CODE_TYPECODES:
+        if count <= 1 << (8 * array(typecode).itemsize):
+            return typecode
+    raise ValueError(f'too many distinct values: {count}')
+
+
+class _ArrayColumn(Sequence):
+    """Column of ints or floats stored in a typed array."""
+
+    __slots__ = ('_values',)
+
+    def __init__(self, values: array):
+        self._values = values
+
+    def __getitem__(self, index: int) -> Any:
+        return self._values[index]
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __iter__(self) -> Iterator:
+        return iter(self._values)
+
+    def __sizeof__(self) -> int:
+        return object.__sizeof__(self) + sys.getsizeof(self._values)
+
+    def take(self, indexes: Sequence) -> '_ArrayColumn':
+        return _ArrayColumn(array(self._values.typecode, map(self._values.__getitem__, indexes)))
+
+    def select(self, indexes: Sequence, predicate: Callable[[Any], bool]) -> List[int]:
+        return list(compress(indexes, map(predicate, map(self._values.__getitem__, indexes))))
+
+
+class _DictionaryColumn(Sequence):
+    """Column of strings or booleans where each distinct value is stored once and records hold its index."""
+
+    __slots__ = ('_codes', '_values')
+
+    def __init__(self, codes: array, values: List[Any]):
+        self._codes = codes
+        self._values = values
+
+    def __getitem__(self, index: int) -> Any:
+        return self._values[self._codes[index]]
+
+    def __len__(self) -> int:
+        return len(self._codes)
+
+    def __iter__(self) -> Iterator:
+        return map(self._values.__getitem__, self._codes)
+
+    def __sizeof__(self) -> int:
+        values_size = sys.getsizeof(self._values) + sum(map(sys.getsizeof, self._values))
+        return object.__sizeof__(self) + sys.getsizeof(self._codes) + values_size
+
+    def take(self, indexes: Sequence) -> '_DictionaryColumn':
+        return _DictionaryColumn(array(self._codes.typecode, map(self._codes.__getitem__, indexes)), self._values)
+
+    def select(self, indexes: Sequence, predicate: Callable[[Any], bool]) -> List[int]:
+        # the predicate is only called once per distinct value
+        results = [bool(predicate(value)) for value in self._values]
+        if self._codes.typecode != 'B':
+            return list(compress(indexes, map(results.__getitem__, map(self._codes.__getitem__, indexes))))
+        # one byte codes are translated to a mask of 0 and 1 bytes in a single C call
+        mask = self._codes.tobytes().translate(bytes(results).ljust(256, b'\0'))
+        if indexes == range(len(mask)):
+            return list(compress(indexes, mask))
+        return list(compress(indexes, map(mask.__getitem__, indexes)))
+
+
+class _ListColumn(Sequence):
+    """Column of values of mixed or complex types stored as they are."""
+
+    __slots__ = ('_values',)
+
+    def __init__(self, values: List[Any]):
+        self._values = values
+
+    def __getitem__(self, index: int) -> Any:
+        return self._values[index]
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __iter__(self) -> Iterator:
+        return iter(self._values)
+
+    def __sizeof__(self) -> int:
+        return object.__sizeof__(self) + sys.getsizeof(self._values)
+
+    def take(self, indexes: Sequence) -> '_ListColumn':
+        return _ListColumn(list(map(self._values.__getitem__, indexes)))
+
+    def select(self, indexes: Sequence, predicate: Callable[[Any], bool]) -> List[int]:
+        return list(compress(indexes, map(predicate, map(self._values.__getitem__, indexes))))
+
+
+Column = Union[_ArrayColumn, _DictionaryColumn, _ListColumn]
+
+
+def _make_column(values: List[Any]) -> Column:
+    types = set(map(type, values))
+    if types == {int}:
+        try:
+            return _ArrayColumn(array('q', values))
+        except OverflowError:
+            return _ListColumn(values)
+    if types == {float}:
+        return _ArrayColumn(array('d', values))
+    if types == {bool}:
+        # False and True are the distinct values of indexes 0 and 1
+        return _DictionaryColumn(array('B', values), [False, True])
+    if types == {str}:
+        table: Dict[str, int] = {}
+        codes = [table.setdefault(value, len(table)) for value in values]
+        return _DictionaryColumn(array(_code_typecode(len(table)), codes), list(table))
+    return _ListColumn(values)
+
+
+class Record(Mapping):
+    """Read-only view of a row of a RecordTable."""
+
+    __slots__ = ('_columns', '_row')
+
+    def __init__(self, columns: Dict[str, Column], row: int):
+        self._columns = columns
+        self._row = row
+
+    def __getitem__(self, key: str) -> Any:
+        return self._columns[key][self._row]
+
+    def __iter__(self) -> Iterator:
+        return iter(self._columns)
+
+    def __len__(self) -> int:
+        return len(self._columns)
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({dict(self)!r})'
+
+
+class RecordTable(Sequence):
+    """
+    Read-only list of records sharing the same keys, stored column by column. Integers and floats are stored in typed
+    arrays, strings and booleans are stored once per distinct value, which takes a fraction of the memory used by a
+    list of dicts. Items are Record views built on access. Slices and filtered tables share the columns of the table
+    they come from and only store the positions of their rows.
+    """
+
+    __slots__ = ('_columns', '_rows')
+
+    def __init__(self, columns: Dict[str, Column], rows: Sequence):
+        self._columns = columns
+        self._rows = rows
+
+    @classmethod
+    def from_records(cls, records: List[Mapping]) -> 'RecordTable':
+        """
+        :param records: a non empty list of dicts having the same keys.
+        :return: a RecordTable holding the values of the records.
+        """
+        if not records or not all(isinstance(record, dict) for record in records):
+            raise ValueError('records must be a non empty list of dicts')
+        fields = records[0].keys()
+        if any(record.keys() != fields for record in records):
+            raise ValueError('records must all have the same keys')
+        columns = {field: _make_column([record[field] for record in records]) for field in fields}
+        return cls(columns, range(len(records)))
+
+    @property
+    def fields(self) -> List[str]:
+        return list(self._columns)
+
+    def column(self, field: str) -> Sequence:
+        """
+        :param field: the name of a field of the records.
+        :return: a read-only sequence of the values of this field.
+        """
+        column = self._columns[field]
+        return column if self._rows == range(len(column)) else column.take(self._rows)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Record, 'RecordTable']:
+        if isinstance(index, slice):
+            return RecordTable(self._columns, self._rows[index])
+        return Record(self._columns, self._rows[index])
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, (RecordTable, list, tuple)):
+            return len(self) == len(other) and all(record == item for record, item in zip(self, other))
+        return NotImplemented
+
+    __hash__ = None
+
+    def __sizeof__(self) -> int:
+        columns_size = sys.getsizeof(self._columns) + sum(map(sys.getsizeof, self._columns.values()))
+        return object.__sizeof__(self) + columns_size + sys.getsizeof(self._rows)
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}(fields={self.fields!r}, length={len(self)})'
+
+    def filter(self, **conditions: Any) -> 'RecordTable':
+        """
+        Selects the records matching all the conditions. Each condition is evaluated on a whole column in one pass,
+        without building records, and the values are not copied.
+        :param conditions: field=value pairs. The value can be a callable, it is then called with the values of the
+        field and the records for which it returns True are selected. Otherwise, the records whose field is equal to
+        the value are selected.
+        :return: a new RecordTable with the selected records.
+        """
+        selected = self._rows
+        for field, condition in conditions.items():
+            predicate = condition if callable(condition) else partial(eq, condition)
+            # each condition is only evaluated on the records selected by the previous ones
+            selected = self._columns[field].select(selected, predicate)
+        return self if selected is self._rows else RecordTable(self._columns, array('q', selected))
+
+    def to_list(self) -> List[Dict[str, Any]]:
+        """Returns the records as a list of dicts."""
+        columns = [self.column(field) for field in self._columns]
+        return [dict(zip(self._columns, values)) for values in zip(*columns)]
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Any, Optional
 
 
 class ConfigurorError(Exception):
@@ -15,3 +15,39 @@ class UnknownExtensionError(ConfigurorError):
     def __init__(self, extension: str = '', message: Optional[str] = None):
         error_message = message or f'extension "{extension}" is not supported'
         super().__init__(error_message)
+
+
+class FetchError(ConfigurorError):
+    def __init__(self, url: str = '', status: int = 0, message: Optional[str] = None):
+        error_message = message or f'unable to fetch {url}, server responded with status {status}'
+        super().__init__(error_message)
+
+
+class InterpolationError(ConfigurorError):
+    """Raised when a reference of a value cannot be resolved"""
+
+
+class ResourceLimitError(ConfigurorError):
+    def __init__(self, source: str = 'the file', limit: str = '', value: Any = None, message: Optional[str] = None):
+        error_message = message or f'{source} exceeds the {limit} limit of {value}'
+        super().__init__(error_message)
+
+
+class CaseCollisionError(ConfigurorError):
+    def __init__(self, key: str = '', other_key: str = '', message: Optional[str] = None):
+        error_message = message or f'keys "{key}" and "{other_key}" only differ by case'
+        super().__init__(error_message)
+
+
+class BindError(ConfigurorError):
+    def __init__(self, path: str = '', reason: str = '', message: Optional[str] = None):
+        self.path = path
+        self.reason = reason
+        error_message = message or f'cannot bind "{path}": {reason}'
+        super().__init__(error_message)
+
+
+class SecretError(ConfigurorError):
+    def __init__(self, reference: str = '', message: Optional[str] = None):
+        error_message = message or f'secret {reference} cannot be resolved'
+        super().__init__(error_message)
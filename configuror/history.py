@@ -0,0 +1,117 @@
+"""Module which keeps the successive versions of a configuration, sharing what did not change between them"""
+from types import MappingProxyType
+from typing import Any, List, Mapping, Optional, OrderedDict
+
+from .utils import ChangeSet, diff_mappings
+
+_MISSING = object()
+
+
+def share(old: Any, new: Any) -> Any:
+    """
+    Returns a read-only copy of new where the values equal to the ones of old at the same place are old values. Dicts
+    are copied to mappingproxy objects and lists to tuples, so shared values cannot be modified through any version.
+    Containers whose values are all shared are old themselves, so a new version only allocates the containers leading
+    to changes.
+    :param old: the previous version of the value, _MISSING if there is none.
+    :param new: the new version of the value.
+    """
+    if isinstance(new, Mapping):
+        old_mapping = old if isinstance(old, MappingProxyType) else {}
+        items = {key: share(old_mapping.get(key, _MISSING), value) for key, value in new.items()}
+        if (
+            old_mapping is old
+            and len(old_mapping) == len(items)
+            and all(old_mapping.get(key, _MISSING) is value for key, value in items.items())
+        ):
+            return old
+        return MappingProxyType(items)
+    if isinstance(new, list) or type(new) is tuple:
+        old_tuple = old if type(old) is tuple else ()
+        items = tuple(
+            share(old_tuple[index] if index < len(old_tuple) else _MISSING, value) for index, value in enumerate(new)
+        )
+        if (
+            old_tuple is old
+            and len(old_tuple) == len(items)
+            and all(item is value for item, value in zip(old_tuple, items))
+        ):
+            return old
+        return items
+    if type(old) is type(new) and old == new:
+        return old
+    return new
+
+
+def freeze(data: Mapping) -> Mapping[Any, Any]:
+    """Returns a deeply read-only copy of a mapping, its dicts being copied to mappingproxy objects and lists to tuples."""
+    return share(_MISSING, data)
+
+
+class ConfigHistory:
+    """
+    Keeps the last versions of a configuration, e.g. one per reload. Each version shares the values which did not
+    change with the previous one, like persistent data structures, so the memory used grows with the changes between
+    versions instead of the number of versions times the size of the configuration. Versions are deeply read-only:
+    nested dicts are mappingproxy objects and lists are tuples.
+    """
+
+    def __init__(self, max_versions: int = 10):
+        """
+        :param max_versions: the number of versions retained, the oldest ones are dropped.
+        """
+        if max_versions < 1:
+            raise ValueError('max_versions must be greater than 0')
+        self.max_versions = max_versions
+        self._versions: OrderedDict[int, Mapping[Any, Any]] = OrderedDict()
+        self._last_version = 0
+        self._current: Optional[int] = None
+
+    @property
+    def versions(self) -> List[int]:
+        """The retained versions, from the oldest to the newest."""
+        return list(self._versions)
+
+    @property
+    def current_version(self) -> Optional[int]:
+        """The version last recorded or rolled back to, None if nothing was recorded."""
+        return self._current
+
+    def record(self, config: Mapping) -> int:
+        """
+        Records a new version, sharing its unchanged values with the current version.
+        :param config: the new configuration, it is not referenced by the history.
+        :return: the number of the new version.
+        """
+        current = _MISSING if self._current is None else self._versions.get(self._current, _MISSING)
+        data = share(current, config)
+        self._last_version += 1
+        self._versions[self._last_version] = data
+        self._current = self._last_version
+        while len(self._versions) > self.max_versions:
+            self._versions.popitem(last=False)
+        return self._last_version
+
+    def get(self, version: int) -> Mapping[Any, Any]:
+        """Returns a retained version, a KeyError is raised if it is not retained."""
+        if version not in self._versions:
+            raise KeyError(f'version {version} is not retained')
+        return self._versions[version]
+
+    def rollback(self, version: int) -> Mapping[Any, Any]:
+        """
+        Makes a retained version the current one, the next recorded version shares its values with it. Newer versions
+        are kept, so it is possible to roll forward again.
+        :param version: the version to roll back to.
+        :return: the version.
+        """
+        data = self.get(version)
+        self._current = version
+        return data
+
+    def diff(self, old_version: int, new_version: int) -> ChangeSet:
+        """
+        Returns the key paths changed between two retained versions. Values shared by the versions are skipped without
+        being compared, so the cost depends on the changes, not on the size of the configuration.
+        """
+        return diff_mappings(self.get(old_version), self.get(new_version))
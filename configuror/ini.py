@@ -0,0 +1,242 @@
+"""
+Module which parses ini files directly into dicts, with the same syntax and interpolation rules as ConfigParser
+used with its default options. Values are only interpolated when they contain a reference.
+"""
+import io
+from configparser import (
+    MAX_INTERPOLATION_DEPTH,
+    DuplicateOptionError,
+    DuplicateSectionError,
+    InterpolationDepthError,
+    InterpolationMissingOptionError,
+    InterpolationSyntaxError,
+    MissingSectionHeaderError,
+    ParsingError,
+)
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple, Union
+
+DEFAULT_SECTION = 'DEFAULT'
+COMMENT_PREFIXES = ('#', ';')
+
+Section = Dict[str, str]
+
+
+class IniParser:
+    """
+    Reads ini files in a single pass over their lines into a dict per section, then interpolates the values of the
+    requested sections. Like ConfigParser, sections found in several files are merged, options are lowercased, the
+    values of the DEFAULT section are added to every section and errors are reported with configparser exceptions.
+    """
+
+    def __init__(self, interpolation: str = 'basic'):
+        """
+        :param interpolation: "basic" for %(name)s references or "extended" for ${name} and ${section:name} ones.
+        """
+        self.extended = interpolation == 'extended'
+        self.defaults: Section = {}
+        self.sections: Dict[str, Section] = {}
+        # section -> source of the last file defining it, so that merged sections can be attributed to a file
+        self.section_sources: Dict[str, str] = {}
+        # section -> raw values of the section including the defaults, built when they are interpolated
+        self._options: Dict[str, Section] = {DEFAULT_SECTION: self.defaults}
+
+    def read(self, lines: Iterable[str], source: str = '<string>') -> None:
+        """
+        Parses the lines of a file, adding its sections and options to the ones already read.
+        :param lines: the lines of the file, e.g. a file object.
+        :param source: the name of the file used in error messages.
+        """
+        section: Optional[Section] = None
+        section_name = ''
+        option: Optional[str] = None
+        indent_level = 0
+        # empty lines following the current option, they belong to its value if a continuation line comes next
+        empty_lines = 0
+        # sections and options of this file, they cannot be defined twice in the same file
+        added: Set[Union[str, Tuple[str, str]]] = set()
+
+        for line_number, line in enumerate(lines, start=1):
+            value = line.strip()
+            if not value:
+                if option is not None:
+                    empty_lines += 1
+                continue
+            if value.startswith(COMMENT_PREFIXES):
+                continue
+
+            indent = len(line) - len(line.lstrip())
+            if option is not None and indent > indent_level:
+                section[option] += '\n' * (empty_lines + 1) + value
+                empty_lines = 0
+                continue
+            indent_level = indent
+            empty_lines = 0
+
+            end = value.rfind(']')
+            if value[0] == '[' and end > 1:
+                section_name = value[1:end]
+                section = self._start_section(section_name, added, source, line_number)
+                option = None
+                continue
+            if section is None:
+                raise MissingSectionHeaderError(source, line_number, line)
+
+            option, option_value = self._split_option(value, source, line_number, line)
+            if (section_name, option) in added:
+                raise DuplicateOptionError(section_name, option, source, line_number)
+            added.add((section_name, option))
+            section[option] = option_value
+
+    def _start_section(self, name: str, added: Set, source: str, line_number: int) -> Section:
+        """Returns the dict of the section whose header was read, it is shared with the files read before."""
+        self.section_sources[name] = source
+        if name == DEFAULT_SECTION:
+            return self.defaults
+        if name in added:
+            raise DuplicateSectionError(name, source, line_number)
+        added.add(name)
+        return self.sections.setdefault(name, {})
+
+    @staticmethod
+    def _split_option(value: str, source: str, line_number: int, line: str) -> Tuple[str, str]:
+        """Returns the lowercased option and the value of an option line, split on the first "=" or ":"."""
+        equal_position = value.find('=')
+        colon_position = value.find(':')
+        if colon_position < 0 or 0 <= equal_position < colon_position:
+            position = equal_position
+        else:
+            position = colon_position
+        option = value[:position].rstrip().lower() if position > 0 else ''
+        if not option:
+            error = ParsingError(source)
+            error.append(line_number, repr(line))
+            raise error
+        return option, value[position + 1 :].strip()
+
+    def read_string(self, content: str, source: str = '<string>') -> None:
+        self.read(io.StringIO(content), source)
+
+    def _section_options(self, name: str) -> Section:
+        """Returns the raw values of a section followed by the defaults it does not override."""
+        options = self._options.get(name)
+        if options is None:
+            section = self.sections[name]
+            options = dict(section)
+            for option, value in self.defaults.items():
+                options.setdefault(option, value)
+            self._options[name] = options
+        return options
+
+    def _interpolate_basic(
+        self, section: str, option: str, value: str, options: Section, parts: List[str], depth: int
+    ) -> None:
+        if depth > MAX_INTERPOLATION_DEPTH:
+            raise InterpolationDepthError(option, section, options.get(option, value))
+        rest = value
+        while rest:
+            position = rest.find('%')
+            if position < 0:
+                parts.append(rest)
+                return
+            if position > 0:
+                parts.append(rest[:position])
+                rest = rest[position:]
+            character = rest[1:2]
+            if character == '%':
+                parts.append('%')
+                rest = rest[2:]
+            elif character == '(':
+                end = rest.find(')', 2)
+                if end <= 2 or rest[end + 1 : end + 2] != 's':
+                    raise InterpolationSyntaxError(option, section, f'bad interpolation variable reference {rest!r}')
+                name = rest[2:end].lower()
+                rest = rest[end + 2 :]
+                if name not in options:
+                    raise InterpolationMissingOptionError(option, section, options.get(option, value), name)
+                referenced = options[name]
+                if '%' in referenced:
+                    self._interpolate_basic(section, option, referenced, options, parts, depth + 1)
+                else:
+                    parts.append(referenced)
+            else:
+                raise InterpolationSyntaxError(option, section, f"'%' must be followed by '%' or '(', found: {rest!r}")
+
+    def _find_extended_reference(
+        self, section: str, option: str, value: str, options: Section, reference: str, rest: str
+    ) -> Tuple[str, str, Section]:
+        """Returns the section, option and section options referenced by ${option} or ${section:option}."""
+        path = reference.split(':')
+        if len(path) > 2:
+            raise InterpolationSyntaxError(option, section, f"More than one ':' found: {rest!r}")
+        referenced_section, referenced_options = section, options
+        if len(path) == 2:
+            referenced_section = path[0]
+            if referenced_section != DEFAULT_SECTION and referenced_section not in self.sections:
+                raise InterpolationMissingOptionError(option, section, options.get(option, value), reference)
+            referenced_options = self._section_options(referenced_section)
+        referenced_option = path[-1].lower()
+        if referenced_option not in referenced_options:
+            raise InterpolationMissingOptionError(option, section, options.get(option, value), reference)
+        return referenced_section, referenced_option, referenced_options
+
+    def _interpolate_extended(
+        self, section: str, option: str, value: str, options: Section, parts: List[str], depth: int
+    ) -> None:
+        if depth > MAX_INTERPOLATION_DEPTH:
+            raise InterpolationDepthError(option, section, options.get(option, value))
+        rest = value
+        while rest:
+            position = rest.find('$')
+            if position < 0:
+                parts.append(rest)
+                return
+            if position > 0:
+                parts.append(rest[:position])
+                rest = rest[position:]
+            character = rest[1:2]
+            if character == '$':
+                parts.append('$')
+                rest = rest[2:]
+            elif character == '{':
+                end = rest.find('}', 2)
+                if end <= 2:
+                    raise InterpolationSyntaxError(option, section, f'bad interpolation variable reference {rest!r}')
+                reference = rest[2:end]
+                rest = rest[end + 1 :]
+                referenced_section, referenced_option, referenced_options = self._find_extended_reference(
+                    section, option, value, options, reference, rest
+                )
+                referenced = referenced_options[referenced_option]
+                if '$' in referenced:
+                    self._interpolate_extended(
+                        referenced_section, referenced_option, referenced, referenced_options, parts, depth + 1
+                    )
+                else:
+                    parts.append(referenced)
+            else:
+                raise InterpolationSyntaxError(option, section, f"'$' must be followed by '$' or '{{', found: {rest!r}")
+
+    def _interpolate(self, section: str, option: str, value: str, options: Section) -> str:
+        parts: List[str] = []
+        if self.extended:
+            self._interpolate_extended(section, option, value, options, parts, 1)
+        else:
+            self._interpolate_basic(section, option, value, options, parts, 1)
+        return ''.join(parts)
+
+    def to_dict(self, sections: Optional[FrozenSet[str]] = None) -> Dict[str, Section]:
+        """
+        :param sections: if given, only these sections are returned, they can still reference the other ones.
+        :return: a dict of sections, the DEFAULT section first, whose values are interpolated.
+        """
+        marker = '$' if self.extended else '%'
+        result = {}
+        for name in (DEFAULT_SECTION, *self.sections):
+            if sections is not None and name not in sections:
+                continue
+            options = self._section_options(name)
+            result[name] = {
+                option: self._interpolate(name, option, value, options) if marker in value else value
+                for option, value in options.items()
+            }
+        return result
@@ -0,0 +1,115 @@
+"""Module which holds the interpolation engine resolving references between values of a configuration"""
+import os
+import re
+from typing import Any, Dict, List, Mapping, Tuple
+
+from .exceptions import InterpolationError
+
+# $$ is an escaped dollar sign, ${path.to.key} and ${ENV:NAME} are references
+REFERENCE_EXPRESSION = re.compile(r'\$\$|\$\{([^}]+)\}')
+ENV_PREFIX = 'ENV:'
+
+Path = Tuple[Any, ...]
+
+
+def _is_plain(value: Any) -> bool:
+    """Returns True if the value cannot contain references, such values are neither resolved nor memoized."""
+    if isinstance(value, str):
+        return '$' not in value
+    return not isinstance(value, (Mapping, list))
+
+
+class Interpolator:
+    """
+    Resolves ${path.to.key} and ${ENV:NAME} references in the string values of a nested mapping. Each value is
+    resolved at most once whatever the number of values referencing it, so resolution is linear in the size of the
+    mapping, and circular references are detected.
+    """
+
+    def __init__(self, data: Mapping):
+        self._data = data
+        self._resolved: Dict[Path, Any] = {}
+        # reference -> (path, raw value), so that each distinct reference is looked up once
+        self._references: Dict[str, Tuple[Path, Any]] = {}
+        # paths being resolved, used to detect circular references
+        self._resolving: List[Path] = []
+
+    def _find(self, reference: str) -> Tuple[Path, Any]:
+        """Returns the path and the raw value of a reference, keys containing dots (e.g. ini sections) are supported."""
+        parts = reference.split('.')
+        node = self._data
+        path = ()
+        while parts:
+            if isinstance(node, Mapping):
+                for size in range(len(parts), 0, -1):
+                    key = '.'.join(parts[:size])
+                    if key in node:
+                        break
+                else:
+                    raise InterpolationError(f'reference ${{{reference}}} cannot be resolved')
+            elif isinstance(node, list) and parts[0].isdigit() and int(parts[0]) < len(node):
+                key, size = int(parts[0]), 1
+            else:
+                raise InterpolationError(f'reference ${{{reference}}} cannot be resolved')
+            node = node[key]
+            path = (*path, key)
+            parts = parts[size:]
+        return path, node
+
+    def _resolve_reference(self, reference: str) -> Any:
+        reference = reference.strip()
+        if reference.startswith(ENV_PREFIX):
+            name = reference[len(ENV_PREFIX):]  # fmt: skip
+            if name not in os.environ:
+                raise InterpolationError(f'environment variable {name} referenced by ${{{reference}}} is not defined')
+            return os.environ[name]
+        found = self._references.get(reference)
+        if found is None:
+            found = self._references[reference] = self._find(reference)
+        return self.resolve(*found)
+
+    def _resolve_string(self, value: str) -> Any:
+        if '$' not in value:
+            return value
+        match = REFERENCE_EXPRESSION.fullmatch(value)
+        if match is not None and match.group(1) is not None:
+            # a value made of a single reference keeps the type of the referenced value
+            return self._resolve_reference(match.group(1))
+
+        def replace(reference_match: re.Match) -> str:
+            if reference_match.group(1) is None:
+                return '$'
+            return f'{self._resolve_reference(reference_match.group(1))}'
+
+        return REFERENCE_EXPRESSION.sub(replace, value)
+
+    def resolve(self, path: Path, value: Any) -> Any:
+        """
+        :param path: the keys leading to the value.
+        :param value: the raw value.
+        :return: the value with all its references resolved, containers are copied.
+        """
+        if path in self._resolved:
+            return self._resolved[path]
+        if path in self._resolving:
+            cycle = ' -> '.join('.'.join(f'{key}' for key in item) for item in [*self._resolving, path] if item)
+            raise InterpolationError(f'circular reference detected: {cycle}')
+
+        self._resolving.append(path)
+        try:
+            if isinstance(value, str):
+                result = self._resolve_string(value)
+            elif isinstance(value, Mapping):
+                result = {
+                    key: item if _is_plain(item) else self.resolve((*path, key), item) for key, item in value.items()
+                }
+            elif isinstance(value, list):
+                result = [
+                    item if _is_plain(item) else self.resolve((*path, index), item) for index, item in enumerate(value)
+                ]
+            else:
+                result = value
+        finally:
+            self._resolving.pop()
+        self._resolved[path] = result
+        return result
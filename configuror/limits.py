@@ -0,0 +1,113 @@
+"""Budgets protecting loaders against oversized or malicious files"""
+import time
+from typing import Any, Dict, FrozenSet, NamedTuple, Optional
+
+import yaml
+from yaml.events import AliasEvent, CollectionStartEvent
+
+from .exceptions import ResourceLimitError
+from .selective import SelectiveYamlLoader, select_keys
+
+
+class Limits(NamedTuple):
+    """
+    Budgets enforced while loading a file, None disables a limit.
+    max_bytes is checked for every file type before parsing and max_depth is also checked for json files. The other
+    limits are checked while composing yaml documents, the only format parsed in Python whose aliases can expand a
+    small file into a huge structure.
+    """
+
+    max_bytes: Optional[int] = None
+    # nesting level of collections, the top-level mapping is at level 1
+    max_depth: Optional[int] = None
+    # number of nodes, aliases count as many nodes as the value they reference
+    max_nodes: Optional[int] = None
+    max_seconds: Optional[float] = None
+
+
+def check_size(size: int, source: str, limits: Optional[Limits]) -> None:
+    """Raises ResourceLimitError if size is greater than the max_bytes limit."""
+    if limits is not None and limits.max_bytes is not None and size > limits.max_bytes:
+        raise ResourceLimitError(source, 'max_bytes', limits.max_bytes)
+
+
+def check_depth(data: Any, source: str, limits: Optional[Limits]) -> None:
+    """Raises ResourceLimitError if the collections of parsed data are nested deeper than the max_depth limit."""
+    if limits is None or limits.max_depth is None:
+        return
+    # (collection, level) pairs, walked without recursion since the data may be very deep
+    stack = [(data, 1)]
+    while stack:
+        value, level = stack.pop()
+        if isinstance(value, dict):
+            value = value.values()
+        elif not isinstance(value, list):
+            continue
+        if level > limits.max_depth:
+            raise ResourceLimitError(source, 'max_depth', limits.max_depth)
+        stack.extend((item, level + 1) for item in value)
+
+
+class LimitedYamlLoader(yaml.FullLoader):
+    """Yaml loader which raises ResourceLimitError as soon as a limit is exceeded while composing the document."""
+
+    def __init__(self, stream: Any, limits: Optional[Limits] = None, **kwargs: Any):
+        super().__init__(stream, **kwargs)
+        limits = Limits() if limits is None else limits
+        self.limits = limits
+        self._nodes = 0
+        self._depth = 0
+        # anchor -> number of nodes of the anchored value, aliases included
+        self._anchor_sizes: Dict[str, int] = {}
+        self._deadline = None if limits.max_seconds is None else time.monotonic() + limits.max_seconds
+
+    def _count_nodes(self, count: int) -> None:
+        self._nodes += count
+        if self.limits.max_nodes is not None and self._nodes > self.limits.max_nodes:
+            raise ResourceLimitError(self.name, 'max_nodes', self.limits.max_nodes)
+        if self._deadline is not None and time.monotonic() > self._deadline:
+            raise ResourceLimitError(self.name, 'max_seconds', self.limits.max_seconds)
+
+    def compose_node(self, parent: Optional[yaml.Node], index: Any) -> yaml.Node:
+        event = self.peek_event()
+        if isinstance(event, AliasEvent):
+            # an alias referencing its own anchor, which is still being composed, counts as one node
+            self._count_nodes(self._anchor_sizes.get(event.anchor, 1))
+            return super().compose_node(parent, index)
+
+        collection = isinstance(event, CollectionStartEvent)
+        if collection:
+            self._depth += 1
+            if self.limits.max_depth is not None and self._depth > self.limits.max_depth:
+                raise ResourceLimitError(self.name, 'max_depth', self.limits.max_depth)
+        first_node = self._nodes
+        self._count_nodes(1)
+        node = super().compose_node(parent, index)
+        if collection:
+            self._depth -= 1
+        if event.anchor is not None:
+            self._anchor_sizes[event.anchor] = self._nodes - first_node
+        return node
+
+
+class _SelectiveLimitedYamlLoader(SelectiveYamlLoader, LimitedYamlLoader):
+    """Yaml loader only composing the requested top-level keys within limits."""
+
+
+def load_yaml_with_limits(stream: Any, limits: Limits, keys: Optional[FrozenSet[str]] = None) -> Any:
+    """
+    Parses a yaml document, raising ResourceLimitError if one of the limits is exceeded.
+    :param stream: a string or a file object.
+    :param limits: the budgets of the parsing.
+    :param keys: if given, only these top-level keys are built.
+    :return: the document.
+    """
+    if keys is None:
+        loader = LimitedYamlLoader(stream, limits)
+    else:
+        loader = _SelectiveLimitedYamlLoader(stream, keys=keys, limits=limits)
+    try:
+        data = loader.get_single_data()
+    finally:
+        loader.dispose()
+    return select_keys(data, keys) if isinstance(data, dict) else data
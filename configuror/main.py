@@ -1,24 +1,75 @@
 """Module which holds the Config class"""
+import copy
 import importlib.util as import_util
+import io
 import json
 import os
+import socket
+import sys
 
 # noinspection PyProtectedMember
-from configparser import BasicInterpolation, ConfigParser, ExtendedInterpolation
 from configparser import Error as IniDecodeError
+from fnmatch import fnmatch
 from importlib import import_module
 from itertools import chain
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, TypeVar, Union
+from stat import S_ISDIR
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
+from urllib.parse import urlsplit
 
 import toml
 import yaml
 from yaml.parser import ParserError as YamlParserError
 
-from .exceptions import DecodeError, UnknownExtensionError
-from .utils import convert_ini_config_to_dict, get_dict_from_dotenv_file
+from .binding import bind
+from .casefold import CaseFoldIndex
+from .columnar import RecordTable
+from .exceptions import DecodeError, ResourceLimitError, UnknownExtensionError
+from .ini import IniParser
+from .interpolation import Interpolator
+from .limits import Limits, check_depth, check_size, load_yaml_with_limits
+from .objects import ConfigSection, to_object
+from .secrets import SecretResolver
+from .selective import load_yaml_keys, normalize_keys, parse_json_keys, select_keys
+from .sources import HttpFetcher
+from .utils import (
+    ChangeSet,
+    deduplicate_strings,
+    deep_size,
+    diff_mappings,
+    expand_variables,
+    get_dict_from_dotenv_lines,
+    import_optional,
+)
+from .views import ConfigOverlay, NamespaceView
+from .writers import (
+    Writer,
+    write_cbor,
+    write_dotenv,
+    write_ini,
+    write_json,
+    write_msgpack,
+    write_toml,
+    write_yaml,
+)
 
 Object = TypeVar('Object')
+Model = TypeVar('Model')
 
 JSON_TYPE = 'json'
 
@@ -32,6 +83,10 @@ PYTHON_TYPE = 'python'
 
 ENV_TYPE = 'env'
 
+MSGPACK_TYPE = 'msgpack'
+
+CBOR_TYPE = 'cbor'
+
 EXTENSIONS = {
     JSON_TYPE: ['json'],
     YAML_TYPE: ['yml', 'yaml'],
@@ -39,24 +94,228 @@ EXTENSIONS = {
     TOML_TYPE: ['toml'],
     PYTHON_TYPE: ['py'],
     ENV_TYPE: ['env'],
+    MSGPACK_TYPE: ['msgpack', 'mpk'],
+    CBOR_TYPE: ['cbor'],
 }
 # we create a list with all available extensions supported by configuror, it comes in handy
 # for the implementation of load_from_files method
 AVAILABLE_EXTENSIONS = list(chain(*[value for value in EXTENSIONS.values()]))
+# reverse mapping of EXTENSIONS to find the type of a file from its extension in constant time
+EXTENSION_TYPES = {extension: file_type for file_type, extensions in EXTENSIONS.items() for extension in extensions}
+
+# media types sent by http servers for file types, used when a remote file type cannot be guessed from its url
+MEDIA_TYPES = {
+    'application/json': JSON_TYPE,
+    'application/yaml': YAML_TYPE,
+    'application/x-yaml': YAML_TYPE,
+    'text/yaml': YAML_TYPE,
+    'text/x-yaml': YAML_TYPE,
+    'application/toml': TOML_TYPE,
+    'application/msgpack': MSGPACK_TYPE,
+    'application/x-msgpack': MSGPACK_TYPE,
+    'application/cbor': CBOR_TYPE,
+}
+
+
+def _decode_ini_content(content: str) -> dict:
+    parser = IniParser()
+    parser.read_string(content)
+    return parser.to_dict()
+
+
+def _decode_msgpack_content(content: bytes) -> Any:
+    msgpack = import_optional('msgpack')
+    # all unpacking errors are ValueError subclasses
+    return msgpack.unpackb(content, raw=False, strict_map_key=False, timestamp=3)
+
+
+def _decode_cbor_content(content: bytes) -> Any:
+    cbor2 = import_optional('cbor2')
+    try:
+        return cbor2.loads(content)
+    except cbor2.CBORDecodeError as e:
+        # cbor2 is an optional dependency, so its error cannot be referenced in CONTENT_DECODERS
+        raise ValueError(str(e)) from e
+
+
+class ContentDecoder(NamedTuple):
+    """A function decoding an in-memory content of a given type."""
+
+    decode: Callable[[Union[str, bytes]], Any]
+    # the error raised by the decode function on malformed content
+    error: Type[Exception]
+    # if True, the decode function takes bytes instead of a string
+    binary: bool
+
+
+# decoder of each file type which can be loaded from an in-memory content
+CONTENT_DECODERS = {
+    JSON_TYPE: ContentDecoder(json.loads, json.JSONDecodeError, binary=False),
+    YAML_TYPE: ContentDecoder(yaml.full_load, YamlParserError, binary=False),
+    TOML_TYPE: ContentDecoder(toml.loads, toml.TomlDecodeError, binary=False),
+    INI_TYPE: ContentDecoder(_decode_ini_content, IniDecodeError, binary=False),
+    MSGPACK_TYPE: ContentDecoder(_decode_msgpack_content, ValueError, binary=True),
+    CBOR_TYPE: ContentDecoder(_decode_cbor_content, ValueError, binary=True),
+}
+
+# file type -> function writing a configuration in this format, used by Config.dump
+WRITERS = {
+    JSON_TYPE: Writer(write_json, binary=False),
+    YAML_TYPE: Writer(write_yaml, binary=False),
+    TOML_TYPE: Writer(write_toml, binary=False),
+    INI_TYPE: Writer(write_ini, binary=False),
+    ENV_TYPE: Writer(write_dotenv, binary=False),
+    MSGPACK_TYPE: Writer(write_msgpack, binary=True),
+    CBOR_TYPE: Writer(write_cbor, binary=True),
+}
+
+# fetcher shared by all Config objects when none is given to load_from_url, so that connections are reused
+_default_fetcher = HttpFetcher()
 
 
 class Config(dict):
+    # incremented by each mutation of the top-level keys, views compare it to know if their caches are still valid.
+    # It is a class attribute so that it exists even when an object is built without __init__ (e.g. unpickled)
+    _mutations = 0
+    # case-insensitive index of the keys, only maintained when the object is created with case_insensitive=True
+    _case_index: Optional[CaseFoldIndex] = None
+    # top-level key -> file (or other source) which last set its value, used by memory_report. Like the attributes
+    # above, it has a class default since unpickling sets the items before restoring the attributes of the object
+    _sources: Optional[Dict[Any, str]] = None
+
     def __init__(
         self,
         mapping_files: Optional[Dict[str, List[str]]] = None,
         files: Optional[List[str]] = None,
         ignore_file_absence: bool = False,
+        keys: Optional[Iterable[str]] = None,
+        limits: Optional[Limits] = None,
+        case_insensitive: bool = False,
+        case_collision: str = 'warn',
+        secret_resolver: Optional[SecretResolver] = None,
         **kwargs,
     ):
         super().__init__(**kwargs)
+        if case_insensitive:
+            self._case_index = CaseFoldIndex(case_collision)
+            self._case_index.add(self)
         self._type_error_message = '{filename} is not a string representing a path'
-        self.load_from_mapping_files(mapping_files, ignore_file_absence)
-        self.load_from_files(files, ignore_file_absence)
+        # number of bytes released by string deduplication when loaders are called with intern_strings=True
+        self.interned_bytes = 0
+        # caches used by load_from_directory: (directory, pattern) -> (directory mtime, sorted files)
+        # and file -> (file mtime, file size, parsed values)
+        self._directory_listings: Dict[Tuple[str, str], Tuple[int, List[str]]] = {}
+        self._fragments: Dict[str, Tuple[int, int, Dict[str, Any]]] = {}
+        self._sources = {}
+        self.load_from_mapping_files(mapping_files, ignore_file_absence, keys, limits)
+        self.load_from_files(files, ignore_file_absence, keys, limits)
+        if secret_resolver is not None:
+            self.resolve_secrets(secret_resolver)
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        if self._case_index is not None:
+            self._case_index.add((key,))
+        super().__setitem__(key, value)
+        self._forget_sources((key,))
+        self._mutations += 1
+
+    def __delitem__(self, key: Any) -> None:
+        super().__delitem__(key)
+        if self._case_index is not None:
+            self._case_index.remove(key)
+        self._forget_sources((key,))
+        self._mutations += 1
+
+    def __ior__(self, other: Any) -> 'Config':
+        self.update(other)
+        return self
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        # the dicts given by the loaders are not copied, the keys are needed to maintain the index and the sources
+        data = args[0] if len(args) == 1 and not kwargs and isinstance(args[0], dict) else dict(*args, **kwargs)
+        if self._case_index is not None:
+            self._case_index.add(data)
+        super().update(data)
+        self._forget_sources(data)
+        self._mutations += 1
+
+    def setdefault(self, key: Any, default: Any = None) -> Any:
+        if key not in self:
+            if self._case_index is not None:
+                self._case_index.add((key,))
+            self._mutations += 1
+        return super().setdefault(key, default)
+
+    def pop(self, *args: Any) -> Any:
+        present = self._case_index is not None and args[0] in self
+        value = super().pop(*args)
+        if present:
+            self._case_index.remove(args[0])
+        self._forget_sources(args[:1])
+        self._mutations += 1
+        return value
+
+    def popitem(self) -> Tuple[Any, Any]:
+        item = super().popitem()
+        if self._case_index is not None:
+            self._case_index.remove(item[0])
+        self._forget_sources(item[:1])
+        self._mutations += 1
+        return item
+
+    def clear(self) -> None:
+        super().clear()
+        if self._case_index is not None:
+            self._case_index.clear()
+        if self._sources:
+            self._sources.clear()
+        self._mutations += 1
+
+    def _forget_sources(self, keys: Iterable[Any]) -> None:
+        """Forgets the sources of keys set or removed outside of a loader, they are reported under None."""
+        if self._sources:
+            for key in keys:
+                self._sources.pop(key, None)
+
+    def __copy__(self) -> 'Config':
+        config = self.__class__.__new__(self.__class__)
+        config.__dict__.update(self.__dict__)
+        # the bookkeeping of the keys is copied so that mutating one object does not alter the other one
+        if self._case_index is not None:
+            config._case_index = self._case_index.copy()
+        for name in ('_sources', '_directory_listings', '_fragments'):
+            if name in self.__dict__:
+                setattr(config, name, dict(self.__dict__[name]))
+        dict.update(config, self)
+        return config
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> 'Config':
+        config = self.__class__.__new__(self.__class__)
+        memo[id(self)] = config
+        config.__dict__.update(copy.deepcopy(self.__dict__, memo))
+        # the items are not set with __setitem__, which would forget the sources copied with the attributes
+        dict.update(config, {copy.deepcopy(key, memo): copy.deepcopy(value, memo) for key, value in self.items()})
+        return config
+
+    def copy(self) -> 'Config':
+        """Returns a shallow copy of the object, values are shared but keys can be set or removed independently."""
+        return self.__copy__()
+
+    def get_ignore_case(self, key: str, default: Any = None) -> Any:
+        """
+        Returns the value of a key whatever its case, e.g. "debug" matches "DEBUG" and "Debug". When several keys only
+        differ by case, the value of the one created last is returned, setting again an existing key does not change
+        it. The lookup uses the case-insensitive index if the object was created with case_insensitive=True, otherwise
+        all the keys are compared.
+        :param key: the key to look for.
+        :param default: the value returned if no key matches.
+        """
+        if self._case_index is not None:
+            matching_key = self._case_index.get(key)
+            return default if matching_key is None else self[matching_key]
+        folded = key.casefold()
+        matching_keys = [other for other in self if isinstance(other, str) and other.casefold() == folded]
+        return self[matching_keys[-1]] if matching_keys else default
 
     @staticmethod
     def _path_is_ok(filename: str, ignore_file_absence: bool = False) -> bool:
@@ -82,6 +341,59 @@ class Config(dict):
                 raise TypeError(self._type_error_message.format(filename=filename))
         return [filename for filename in filenames if self._path_is_ok(filename, ignore_file_absence)]
 
+    @staticmethod
+    def _open_file(filename: str, ignore_file_absence: bool = False, mode: str = 'r') -> Optional[IO]:
+        """
+        Opens a file directly instead of checking its existence first, so that only one filesystem round trip is made.
+        :param filename: the file to open.
+        :param ignore_file_absence: boolean flag to know if we raised an error if the file doesn't exist.
+        :param mode: the mode used to open the file.
+        :return: the opened file or None if the file doesn't exist and ignore_file_absence is True.
+        """
+        try:
+            return open(filename, mode)
+        except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+            pass
+        except PermissionError:
+            # this is what windows raises when opening a directory
+            if not os.path.isdir(filename):
+                raise
+        if ignore_file_absence:
+            return None
+        raise FileNotFoundError(f'file {filename} not found on the filesystem')
+
+    def _update_from_source(self, data: Dict[Any, Any], source: Union[str, Mapping[Any, str]]) -> None:
+        """
+        Updates the configuration and remembers where the values come from.
+        :param data: the values loaded.
+        :param source: the source of all the values, or a mapping giving the source of each key of data.
+        """
+        self.update(data)
+        if self._sources is None:
+            self._sources = {}
+        if isinstance(source, str):
+            self._sources.update(dict.fromkeys(data, source))
+        else:
+            self._sources.update((key, source[key]) for key in data)
+
+    @staticmethod
+    def _check_file_size(file: Union[IO, str], filename: str, limits: Optional[Limits]) -> None:
+        if limits is not None and limits.max_bytes is not None:
+            size = os.path.getsize(file) if isinstance(file, str) else os.fstat(file.fileno()).st_size
+            check_size(size, filename, limits)
+
+    @staticmethod
+    def _parse_yaml(stream: IO, keys: Optional[FrozenSet[str]], limits: Optional[Limits]) -> Any:
+        if limits is not None:
+            return load_yaml_with_limits(stream, limits, keys)
+        return yaml.full_load(stream) if keys is None else load_yaml_keys(stream, keys)
+
+    def _deduplicate(self, data: Any, shared_containers: bool = False) -> Any:
+        """Deduplicates strings of freshly parsed data and keeps track of the memory saved."""
+        data, saved_bytes = deduplicate_strings(data, shared_containers=shared_containers)
+        self.interned_bytes += saved_bytes
+        return data
+
     @staticmethod
     def getenv(key: str, default: Any = None, converter: Optional[Callable] = None) -> Any:
         value = os.getenv(key, default)
@@ -92,74 +404,292 @@ class Config(dict):
             raise TypeError('cast must be a callable')
         return converter(value)
 
-    def load_from_object(self, obj: Union[Object, str]) -> None:
+    def load_from_environ(
+        self,
+        prefix: str,
+        separator: str = '__',
+        converters: Optional[Dict[str, Callable]] = None,
+        lowercase: bool = True,
+    ) -> bool:
+        """
+        Loads environment variables starting with a prefix, the separator in their names defines nested keys.
+        E.g. with prefix "APP" APP__DB__HOST=localhost gives {'db': {'host': 'localhost'}}.
+        :param prefix: the prefix of the environment variables to load.
+        :param separator: the string separating nested keys and the prefix, the prefix may already end with it.
+        :param converters: a mapping of environment variable names to callables used to convert their value.
+        :param lowercase: boolean flag to know if keys are lowercased.
+        :return: True if at least one environment variable was loaded, False otherwise.
+        """
+        converters = converters or {}
+        # the prefix may already end with the separator or its first characters, e.g. "APP_" with "__"
+        overlap = next(size for size in range(len(separator), -1, -1) if prefix.endswith(separator[:size]))
+        full_prefix = prefix + separator[overlap:]
+        # nested dicts may be shared with other objects, so they are copied before their first modification
+        copied_ids = set()
+        loaded = False
+        for name, value in os.environ.items():
+            if not name.startswith(full_prefix):
+                continue
+            remainder = name[len(full_prefix):]  # fmt: skip
+            if lowercase:
+                remainder = remainder.lower()
+            keys = [key for key in remainder.split(separator) if key]
+            if not keys:
+                continue
+
+            target = self
+            for key in keys[:-1]:
+                child = target.get(key)
+                if not isinstance(child, dict):
+                    child = {}
+                elif id(child) not in copied_ids:
+                    child = dict(child)
+                copied_ids.add(id(child))
+                target[key] = child
+                target = child
+            converter = converters.get(name)
+            target[keys[-1]] = value if converter is None else converter(value)
+            # recorded once the value is set, since setting a key outside of _update_from_source forgets its source
+            self._sources[keys[0]] = 'environment'
+            loaded = True
+        return loaded
+
+    def load_from_server(self, socket_path: str, timeout: float = 1.0) -> bool:
+        """
+        Loads the configuration served by a ConfigServer on the same host.
+        :param socket_path: the path of the unix domain socket of the server.
+        :param timeout: the maximum number of seconds to wait for the server.
+        :return: True if values were loaded, False if no server is available.
+        """
+        if not hasattr(socket, 'AF_UNIX'):
+            return False
+        chunks = []
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+                client.settimeout(timeout)
+                client.connect(socket_path)
+                while chunk := client.recv(65536):
+                    chunks.append(chunk)
+        except (FileNotFoundError, ConnectionRefusedError, socket.timeout):
+            return False
+        try:
+            self._update_from_source(json.loads(b''.join(chunks)), socket_path)
+        except json.JSONDecodeError as e:
+            raise DecodeError(socket_path, JSON_TYPE) from e
+        return True
+
+    @classmethod
+    def from_server(cls, socket_path: str, timeout: float = 1.0, **kwargs) -> 'Config':
+        """
+        :param socket_path: the path of the unix domain socket of a ConfigServer.
+        :param timeout: the maximum number of seconds to wait for the server.
+        :param kwargs: the arguments used to build the configuration locally if no server is available.
+        :return: the configuration of the server or the one built locally.
+        """
+        config = cls()
+        if config.load_from_server(socket_path, timeout):
+            return config
+        return cls(**kwargs)
+
+    def load_from_object(self, obj: Union[Object, str], keys: Optional[Iterable[str]] = None) -> None:
         if isinstance(obj, str):
             obj = import_module(obj)
-        for key in dir(obj):
-            if key.isupper():
-                self[key] = getattr(obj, key)
+        source = getattr(obj, '__file__', None) or getattr(obj, '__name__', None) or type(obj).__name__
+        keys = normalize_keys(keys)
+        names = [key for key in dir(obj) if key.isupper() and (keys is None or key in keys)]
+        self._update_from_source({key: getattr(obj, key) for key in names}, source)
 
-    def load_from_python_file(self, filename: str, ignore_file_absence: bool = False) -> bool:
+    def load_from_python_file(
+        self,
+        filename: str,
+        ignore_file_absence: bool = False,
+        keys: Optional[Iterable[str]] = None,
+        limits: Optional[Limits] = None,
+    ) -> bool:
         if not isinstance(filename, str):
             raise TypeError(self._type_error_message.format(filename=filename))
 
         if not self._path_is_ok(filename, ignore_file_absence):
             return False
         else:
+            self._check_file_size(filename, filename, limits)
             try:
                 spec = import_util.spec_from_file_location(Path(filename).stem, filename)
                 module = import_util.module_from_spec(spec)
                 spec.loader.exec_module(module)
-                self.load_from_object(module)
+                self.load_from_object(module, keys)
                 return True
             except AttributeError as e:
                 raise DecodeError(filename, PYTHON_TYPE) from e
 
-    def load_from_json(self, filename: str, ignore_file_absence: bool = False) -> bool:
-        if not self._path_is_ok(filename, ignore_file_absence):
+    def load_from_json(
+        self,
+        filename: str,
+        ignore_file_absence: bool = False,
+        intern_strings: bool = False,
+        keys: Optional[Iterable[str]] = None,
+        limits: Optional[Limits] = None,
+    ) -> bool:
+        keys = normalize_keys(keys)
+        f = self._open_file(filename, ignore_file_absence)
+        if f is None:
             return False
 
         try:
-            with open(filename) as f:
-                self.update(json.load(f))
+            with f:
+                self._check_file_size(f, filename, limits)
+                data = json.load(f) if keys is None else parse_json_keys(f.read(), keys)
+                check_depth(data, filename, limits)
+                if intern_strings:
+                    data = self._deduplicate(data)
+                self._update_from_source(data, filename)
         except json.JSONDecodeError as e:
             raise DecodeError(filename, JSON_TYPE) from e
+        except RecursionError as e:
+            raise ResourceLimitError(message=f'{filename} is too deeply nested to be parsed') from e
         return True
 
-    def load_from_yaml(self, filename: str, ignore_file_absence: bool = False) -> bool:
-        if not self._path_is_ok(filename, ignore_file_absence):
+    def load_from_yaml(
+        self,
+        filename: str,
+        ignore_file_absence: bool = False,
+        intern_strings: bool = False,
+        keys: Optional[Iterable[str]] = None,
+        limits: Optional[Limits] = None,
+    ) -> bool:
+        keys = normalize_keys(keys)
+        f = self._open_file(filename, ignore_file_absence)
+        if f is None:
             return False
 
         try:
-            with open(filename) as f:
-                data = yaml.full_load(f)
+            with f:
+                self._check_file_size(f, filename, limits)
+                data = self._parse_yaml(f, keys, limits)
                 if not isinstance(data, dict):
                     return False
-                self.update(data)
+                if intern_strings:
+                    # aliases make several keys reference the same container, which can even contain itself
+                    data = self._deduplicate(data, shared_containers=True)
+                self._update_from_source(data, filename)
         except YamlParserError as e:
             raise DecodeError(filename, YAML_TYPE) from e
         return True
 
-    def load_from_toml(self, filenames: Union[str, List[str]], ignore_file_absence: bool = False) -> bool:
+    def load_from_msgpack(
+        self,
+        filename: str,
+        ignore_file_absence: bool = False,
+        keys: Optional[Iterable[str]] = None,
+        limits: Optional[Limits] = None,
+    ) -> bool:
+        keys = normalize_keys(keys)
+        msgpack = import_optional('msgpack')
+        f = self._open_file(filename, ignore_file_absence, 'rb')
+        if f is None:
+            return False
+
+        try:
+            with f:
+                self._check_file_size(f, filename, limits)
+                data = msgpack.unpack(f, raw=False, strict_map_key=False, timestamp=3)
+        except (ValueError, msgpack.UnpackException) as e:
+            raise DecodeError(filename, MSGPACK_TYPE) from e
+        if not isinstance(data, dict):
+            return False
+        self._update_from_source(select_keys(data, keys), filename)
+        return True
+
+    def load_from_cbor(
+        self,
+        filename: str,
+        ignore_file_absence: bool = False,
+        keys: Optional[Iterable[str]] = None,
+        limits: Optional[Limits] = None,
+    ) -> bool:
+        keys = normalize_keys(keys)
+        cbor2 = import_optional('cbor2')
+        f = self._open_file(filename, ignore_file_absence, 'rb')
+        if f is None:
+            return False
+
+        try:
+            with f:
+                self._check_file_size(f, filename, limits)
+                data = cbor2.load(f)
+        except cbor2.CBORDecodeError as e:
+            raise DecodeError(filename, CBOR_TYPE) from e
+        if not isinstance(data, dict):
+            return False
+        self._update_from_source(select_keys(data, keys), filename)
+        return True
+
+    def _read_files(
+        self, filenames: List[str], ignore_file_absence: bool, limits: Optional[Limits]
+    ) -> List[Tuple[str, str]]:
+        """
+        Reads files by opening them directly, so that each file costs a single filesystem round trip.
+        :param filenames: the files to read.
+        :param ignore_file_absence: boolean flag to know if we raised an error if a file doesn't exist.
+        :param limits: the limits whose max_bytes is checked before reading a file.
+        :return: a list of (filename, content) tuples for the files which exist.
+        """
+        contents = []
+        for filename in filenames:
+            if not isinstance(filename, str):
+                raise TypeError(self._type_error_message.format(filename=filename))
+            f = self._open_file(filename, ignore_file_absence)
+            if f is None:
+                continue
+            with f:
+                self._check_file_size(f, filename, limits)
+                contents.append((filename, f.read()))
+        return contents
+
+    def load_from_toml(
+        self,
+        filenames: Union[str, List[str]],
+        ignore_file_absence: bool = False,
+        intern_strings: bool = False,
+        keys: Optional[Iterable[str]] = None,
+        limits: Optional[Limits] = None,
+    ) -> bool:
+        keys = normalize_keys(keys)
         if not isinstance(filenames, (str, list)):
             raise TypeError('filenames must represent a path or list of paths')
-        if isinstance(filenames, str):
-            if not self._path_is_ok(filenames, ignore_file_absence):
+        paths = [filenames] if isinstance(filenames, str) else filenames
+        files = self._read_files(paths, ignore_file_absence, limits)
+        if not files:
+            # the given files are missing and ignored, only an empty list is an error
+            if paths:
                 return False
-            filenames = [filenames]
+            raise FileNotFoundError(f'the list does not contain one {TOML_TYPE} valid file')
 
-        filtered_filenames = self._filter_paths(filenames, ignore_file_absence)
         try:
-            self.update(toml.load(filtered_filenames))
-            return True
+            data = {}
+            # key -> file which set its value last
+            sources = {}
+            for filename, content in files:
+                file_data = toml.loads(content)
+                data.update(file_data)
+                sources.update(dict.fromkeys(file_data, filename))
         except toml.TomlDecodeError as e:
             raise DecodeError(message=f'one of your files is not well {TOML_TYPE} formatted') from e
-        except FileNotFoundError as e:  # This occurs when the list is empty, I just changed the error message to return
-            raise FileNotFoundError(f'the list does not contain one {TOML_TYPE} valid file') from e
+        data = select_keys(data, keys)
+        if intern_strings:
+            data = self._deduplicate(data)
+        self._update_from_source(data, sources)
+        return True
 
     def load_from_ini(
-        self, filenames: Union[str, List], ignore_file_absence: bool = False, interpolation_method: str = 'basic'
+        self,
+        filenames: Union[str, List],
+        ignore_file_absence: bool = False,
+        interpolation_method: str = 'basic',
+        keys: Optional[Iterable[str]] = None,
+        limits: Optional[Limits] = None,
     ) -> bool:
+        keys = normalize_keys(keys)
         # we check interpolation method
         interpolation_error_message = 'interpolation_method must be either "basic" or "extended"'
         if not isinstance(interpolation_method, str):
@@ -170,112 +700,413 @@ class Config(dict):
         # we check filenames
         if not isinstance(filenames, (str, list)):
             raise TypeError('filenames must represent a path or list of paths')
-        if isinstance(filenames, str):
-            if not self._path_is_ok(filenames, ignore_file_absence):
-                return False
-            filenames = [filenames]
+        paths = [filenames] if isinstance(filenames, str) else filenames
+        files = self._read_files(paths, ignore_file_absence, limits)
+        if not files and paths:
+            # the given files are missing and ignored
+            return False
 
-        filtered_filenames = self._filter_paths(filenames, ignore_file_absence)
         try:
-            interpolation = (
-                ExtendedInterpolation() if interpolation_method.lower() == 'extended' else BasicInterpolation()
-            )
-            config = ConfigParser(interpolation=interpolation)
-            config.read(filtered_filenames)
-            self.update(convert_ini_config_to_dict(config))
+            parser = IniParser(interpolation_method.lower())
+            for filename, content in files:
+                parser.read_string(content, filename)
+            data = parser.to_dict(keys)
+            # the DEFAULT section is always returned, it is attributed to the last file if none of them defines it
+            last_filename = files[-1][0] if files else None
+            self._update_from_source(data, {name: parser.section_sources.get(name, last_filename) for name in data})
             return True
         except IniDecodeError as e:
             raise DecodeError(message=f'one of your files is not well {INI_TYPE} formatted') from e
 
-    def load_from_dotenv(self, filename: str, ignore_file_absence: bool = False) -> bool:
-        if not self._path_is_ok(filename, ignore_file_absence):
+    def load_from_dotenv(
+        self,
+        filename: str,
+        ignore_file_absence: bool = False,
+        export: bool = True,
+        keys: Optional[Iterable[str]] = None,
+        limits: Optional[Limits] = None,
+    ) -> bool:
+        f = self._open_file(filename, ignore_file_absence)
+        if f is None:
             return False
 
-        data = get_dict_from_dotenv_file(filename)
+        with f:
+            self._check_file_size(f, filename, limits)
+            data = get_dict_from_dotenv_lines(f, filename)
         if not data:
             return False
 
+        self._load_dotenv_data(data, export, filename, normalize_keys(keys))
+        return True
+
+    def _load_dotenv_data(
+        self,
+        data: Dict[str, str],
+        export: bool = True,
+        source: str = 'the stream',
+        keys: Optional[FrozenSet[str]] = None,
+    ) -> None:
+        values = {}
+        # values can reference keys defined earlier in the same file, so the environment is only updated at the end
         for key, value in data.items():
-            new_value = os.path.expandvars(value)
-            os.environ[key] = new_value
-            self[key] = new_value
+            values[key] = expand_variables(value, values)
+        # values are filtered after expansion since selected values may reference the other ones
+        values = select_keys(values, keys)
+        self._update_from_source(values, source)
+        if export:
+            os.environ.update(values)
+
+    def _load_from_content(
+        self, content: Union[str, bytes], file_type: str, source_name: str, export: bool = True
+    ) -> bool:
+        decoder = CONTENT_DECODERS.get(file_type)
+        if decoder is not None and decoder.binary:
+            if not isinstance(content, bytes):
+                raise TypeError(f'{file_type} content must be read from a binary stream')
+        elif isinstance(content, bytes):
+            content = content.decode()
+
+        if file_type == ENV_TYPE:
+            data = get_dict_from_dotenv_lines(content.splitlines(), source_name)
+            if not data:
+                return False
+            self._load_dotenv_data(data, export, source_name)
+            return True
+
+        try:
+            data = decoder.decode(content)
+        except decoder.error as e:
+            raise DecodeError(source_name, file_type) from e
+        if not isinstance(data, dict):
+            return False
+        self._update_from_source(data, source_name)
         return True
 
-    def _load_from_mapping_file(self, file_type: str, existing_files: List[str]) -> None:
-        mapping = {
-            JSON_TYPE: self.load_from_json,
-            YAML_TYPE: self.load_from_yaml,
-            TOML_TYPE: self.load_from_toml,
-            INI_TYPE: self.load_from_ini,
-            PYTHON_TYPE: self.load_from_python_file,
-            ENV_TYPE: self.load_from_dotenv,
-        }
-        if (load_callable := mapping.get(file_type)) is not None:
-            if file_type in (INI_TYPE, TOML_TYPE):
-                load_callable(existing_files)
-            else:
-                for file in existing_files:
-                    load_callable(file)
+    @staticmethod
+    def _check_content_file_type(file_type: str) -> str:
+        if not isinstance(file_type, str):
+            raise TypeError('file_type must be a string')
+        file_type = file_type.lower()
+        if file_type != ENV_TYPE and file_type not in CONTENT_DECODERS:
+            raise UnknownExtensionError(message=f'{file_type} content cannot be loaded from a stream')
+        return file_type
+
+    def load_from_stream(self, stream: IO, file_type: str, export: bool = True) -> bool:
+        file_type = self._check_content_file_type(file_type)
+        return self._load_from_content(stream.read(), file_type, getattr(stream, 'name', 'the stream'), export)
+
+    def load_from_url(
+        self,
+        url: str,
+        file_type: Optional[str] = None,
+        fetcher: Optional[HttpFetcher] = None,
+        export: bool = True,
+    ) -> bool:
+        body, content_type = (fetcher or _default_fetcher).fetch(url)
+        if file_type is None:
+            extension = urlsplit(url).path.split('.')[-1]
+            file_type = EXTENSION_TYPES.get(extension) or MEDIA_TYPES.get(content_type)
+            if file_type is None:
+                raise UnknownExtensionError(
+                    message=f'unable to guess the file type of {url}, please provide the file_type argument'
+                )
+        file_type = self._check_content_file_type(file_type)
+        return self._load_from_content(body, file_type, url, export)
+
+    def _load_from_mapping_file(
+        self, file_type: str, files: List[str], ignore_file_absence: bool = False, **options: Any
+    ) -> bool:
+        loader = LOADERS[file_type]
+        if loader.checks_existence:
+            # files are not checked beforehand, the loader reports missing files when opening them
+            for file in files:
+                if not isinstance(file, str):
+                    raise TypeError(self._type_error_message.format(filename=file))
+            if loader.multiple_files:
+                return bool(files) and loader.load(self, files, ignore_file_absence=ignore_file_absence, **options)
+            loaded = False
+            for file in files:
+                loaded = loader.load(self, file, ignore_file_absence=ignore_file_absence, **options) or loaded
+            return loaded
+
+        existing_files = self._filter_paths(files, ignore_file_absence)
+        if not existing_files:
+            return False
+        if loader.multiple_files:
+            loader.load(self, existing_files, **options)
+        else:
+            for file in existing_files:
+                loader.load(self, file, **options)
+        return True
 
     def load_from_mapping_files(
-        self, mapping_files: Optional[Dict[str, List[str]]] = None, ignore_file_absence: bool = False
+        self,
+        mapping_files: Optional[Dict[str, List[str]]] = None,
+        ignore_file_absence: bool = False,
+        keys: Optional[Iterable[str]] = None,
+        limits: Optional[Limits] = None,
     ) -> bool:
         if mapping_files is None:
             return False
 
         file_added = False
+        options = _loader_options(keys, limits)
         for key, files in mapping_files.items():
             file_type = key.lower()
-            if file_type not in EXTENSIONS.keys():
+            if file_type not in LOADERS:
                 raise UnknownExtensionError(key)
             if not isinstance(files, list):
                 raise TypeError(f'{files} is not a list of files')
 
-            existing_files = self._filter_paths(files, ignore_file_absence)
-            if existing_files:  # if at least one file is added, the operation is considered realized
-                file_added = True
-                self._load_from_mapping_file(file_type, existing_files)
+            # if at least one file is added, the operation is considered realized
+            file_added = self._load_from_mapping_file(file_type, files, ignore_file_absence, **options) or file_added
 
         return file_added
 
-    def _load_from_files(self, file: str, extension: str) -> None:
-        if extension in EXTENSIONS[PYTHON_TYPE]:
-            self.load_from_python_file(file)
+    def _load_from_files(self, file: str, extension: str, **options: Any) -> bool:
+        return LOADERS[EXTENSION_TYPES[extension]].load(self, file, **options)
 
-        elif extension in EXTENSIONS[JSON_TYPE]:
-            self.load_from_json(file)
-
-        elif extension in EXTENSIONS[TOML_TYPE]:
-            self.load_from_toml(file)
-
-        elif extension in EXTENSIONS[INI_TYPE]:
-            self.load_from_ini(file)
-
-        elif extension in EXTENSIONS[YAML_TYPE]:
-            self.load_from_yaml(file)
-        else:
-            self.load_from_dotenv(file)
-
-    def load_from_files(self, filenames: Optional[List[str]] = None, ignore_file_absence: bool = False) -> bool:
+    def load_from_files(
+        self,
+        filenames: Optional[List[str]] = None,
+        ignore_file_absence: bool = False,
+        keys: Optional[Iterable[str]] = None,
+        limits: Optional[Limits] = None,
+    ) -> bool:
         if filenames is None:
             return False
         if not isinstance(filenames, list):
             raise TypeError(f'{filenames} is not a list of files')
 
-        files = self._filter_paths(filenames, ignore_file_absence)
-        if not files:
-            return False
-        else:
-            for file in files:
-                extension = file.split('.')[-1]
-                if extension not in AVAILABLE_EXTENSIONS:
+        options = _loader_options(keys, limits)
+        loaded = False
+        for file in filenames:
+            if not isinstance(file, str):
+                raise TypeError(self._type_error_message.format(filename=file))
+            extension = file.split('.')[-1]
+            loader = LOADERS.get(EXTENSION_TYPES.get(extension))
+            if loader is None or not loader.checks_existence:
+                # the existence is only checked beforehand when the loader cannot report missing files itself
+                if not self._path_is_ok(file, ignore_file_absence):
+                    continue
+                if loader is None:
                     raise UnknownExtensionError(
                         message=f'{file} does not have a correct extension,'
                         f' supported extensions are: {AVAILABLE_EXTENSIONS}'
                     )
+                self._load_from_files(file, extension, **options)
+                loaded = True
+            else:
+                loaded = (
+                    self._load_from_files(file, extension, ignore_file_absence=ignore_file_absence, **options) or loaded
+                )
+        return loaded
 
-                self._load_from_files(file, extension)
-            return True
+    def _list_directory(self, directory: str, pattern: str, directory_mtime: int) -> List[str]:
+        """Returns the sorted files of the directory matching the pattern, the listing is cached until it changes."""
+        cached = self._directory_listings.get((directory, pattern))
+        if cached is not None and cached[0] == directory_mtime:
+            return cached[1]
+
+        with os.scandir(directory) as entries:
+            files = sorted(
+                entry.path
+                for entry in entries
+                if fnmatch(entry.name, pattern) and entry.name.split('.')[-1] in EXTENSION_TYPES and entry.is_file()
+            )
+        self._directory_listings[(directory, pattern)] = (directory_mtime, files)
+        if cached is not None:
+            # values of removed files must not stay in memory
+            for file in set(cached[1]).difference(files):
+                self._fragments.pop(file, None)
+        return files
+
+    def _load_fragment(self, file: str) -> Dict[str, Any]:
+        """
+        Returns a copy of the values of a file, the file is parsed again only if its modification time or size changed.
+        The cached values are never given to the configuration, so modifying it does not change the next reload.
+        """
+        stat = os.stat(file)
+        cached = self._fragments.get(file)
+        if cached is None or cached[:2] != (stat.st_mtime_ns, stat.st_size):
+            fragment = Config()
+            fragment._load_from_files(file, file.split('.')[-1])
+            cached = self._fragments[file] = (stat.st_mtime_ns, stat.st_size, dict(fragment))
+        return copy.deepcopy(cached[2])
+
+    def load_from_directory(self, directory: str, pattern: str = '*', ignore_directory_absence: bool = False) -> bool:
+        if not isinstance(directory, str):
+            raise TypeError(f'{directory} is not a string representing a directory')
+        try:
+            stat = os.stat(directory)
+        except FileNotFoundError:
+            stat = None
+        if stat is None or not S_ISDIR(stat.st_mode):
+            if ignore_directory_absence:
+                return False
+            raise FileNotFoundError(f'directory {directory} not found on the filesystem')
+
+        files = self._list_directory(directory, pattern, stat.st_mtime_ns)
+        for file in files:
+            self._update_from_source(self._load_fragment(file), file)
+        return bool(files)
+
+    @staticmethod
+    def _get_writer(file_type: str) -> Writer:
+        writer = WRITERS.get(file_type.lower())
+        if writer is None:
+            raise UnknownExtensionError(message=f'configuror cannot write {file_type} files')
+        return writer
+
+    def dump(self, filename: str, file_type: Optional[str] = None) -> None:
+        """
+        Writes the configuration to a file.
+        :param filename: the path of the file to write.
+        :param file_type: the format of the file, if not given, it is guessed from the file extension.
+        """
+        if file_type is None:
+            file_type = EXTENSION_TYPES.get(f'{filename}'.split('.')[-1])
+            if file_type is None:
+                raise UnknownExtensionError(
+                    message=f'unable to guess the file type of {filename}, please provide the file_type argument'
+                )
+        writer = self._get_writer(file_type)
+        with open(filename, 'wb' if writer.binary else 'w') as f:
+            writer.write(self, f)
+
+    def dumps(self, file_type: str) -> Union[str, bytes]:
+        """
+        :param file_type: the format of the output.
+        :return: the configuration serialized in the given format, as bytes for binary formats.
+        """
+        writer = self._get_writer(file_type)
+        stream = io.BytesIO() if writer.binary else io.StringIO()
+        writer.write(self, stream)
+        return stream.getvalue()
+
+    def interpolate(self) -> None:
+        """
+        Resolves ${path.to.key} and ${ENV:NAME} references in all string values of the configuration, whatever the
+        files they come from. Use $$ to write a literal dollar sign.
+        """
+        self.update(Interpolator(self).resolve((), self))
+
+    def resolve_secrets(self, resolver: SecretResolver) -> List[str]:
+        """
+        Replaces values which are secret references, e.g. "file:/run/secrets/db_password", by the secrets retrieved by
+        the providers of the resolver. All the references are collected first, so each provider is called once.
+        :param resolver: the SecretResolver holding the providers and the cache of the secrets.
+        :return: the references resolved.
+        """
+        return resolver.resolve(self)
+
+    def columnarize(self, *paths: str, min_records: int = 1000) -> List[Tuple[str, ...]]:
+        """
+        Replaces lists of dicts sharing the same keys by RecordTable objects storing their values column by column.
+        :param paths: dotted paths of the lists to convert, like "gateway.routes". A ValueError is raised if one of
+        them is not a list of dicts sharing the same keys. If no path is given, all lists of at least min_records dicts
+        sharing the same keys found in nested dicts are converted.
+        :param min_records: the minimum length of the lists converted when no path is given.
+        :return: the key paths of the converted lists.
+        """
+        converted = []
+        if paths:
+            for path in paths:
+                keys = tuple(path.split('.'))
+                parent = self
+                for key in keys[:-1]:
+                    parent = parent[key]
+                parent[keys[-1]] = RecordTable.from_records(parent[keys[-1]])
+                converted.append(keys)
+            return converted
+
+        mappings = [((), self)]
+        # mappings found while iterating are appended to the list and visited by the same loop
+        for path, mapping in mappings:
+            for key, value in mapping.items():
+                if isinstance(value, dict):
+                    mappings.append(((*path, key), value))
+                elif isinstance(value, list) and len(value) >= min_records:
+                    try:
+                        mapping[key] = RecordTable.from_records(value)
+                    except ValueError:
+                        continue
+                    converted.append((*path, key))
+        return converted
+
+    def as_object(self) -> ConfigSection:
+        """
+        Returns a copy of the configuration where dicts are replaced by objects whose attributes are the keys, like
+        config.as_object().database.port. Keys which are not valid identifiers are converted, "max-size" becomes
+        max_size. The classes of the objects define __slots__ and are shared by all dicts having the same keys, so they
+        are only created once even if the configuration is reloaded.
+        """
+        return to_object(self)
+
+    def overlay(self, overrides: Optional[Dict[str, Any]] = None, **kwargs) -> ConfigOverlay:
+        """
+        :param overrides: values overriding the ones of the configuration, nested dicts override nested keys.
+        :param kwargs: other values overriding the ones of the configuration.
+        :return: a read-only view of the configuration with the overrides applied, the configuration is not copied.
+        """
+        return ConfigOverlay(self, {**(overrides or {}), **kwargs})
+
+    def diff(self, other: Dict[str, Any]) -> ChangeSet:
+        """
+        :param other: the new version of the configuration.
+        :return: the key paths added, removed and changed to go from this configuration to the other one.
+        """
+        return diff_mappings(self, other)
+
+    def memory_report(self) -> Dict[str, Any]:
+        """
+        Walks the configuration once to compute its deep memory size. Objects shared between keys are counted once,
+        for the first key which references them.
+        :return: a dict with the following keys:
+            - total_bytes: the memory used by the configuration, the dict itself included.
+            - keys: a dict mapping each top-level key to its deep size (key included).
+            - sources: a dict mapping each source (file, url, module, etc...) to the deep size of the top-level keys
+            it set last. Keys set or modified after loading without a load_from_* method are reported under None.
+            - containers: the number of dicts, lists, tuples and sets.
+            - strings: the number of strings (keys included).
+        """
+        seen = {id(self)}
+        total_bytes = sys.getsizeof(self)
+        containers = 1
+        strings = 0
+        keys = {}
+        sources = {}
+        for key, value in self.items():
+            key_size = deep_size(key, seen)
+            value_size = deep_size(value, seen)
+            keys[key] = key_size.bytes + value_size.bytes
+            source = self._sources.get(key) if self._sources else None
+            sources[source] = sources.get(source, 0) + keys[key]
+            total_bytes += keys[key]
+            containers += key_size.containers + value_size.containers
+            strings += key_size.strings + value_size.strings
+        return {
+            'total_bytes': total_bytes,
+            'keys': keys,
+            'sources': sources,
+            'containers': containers,
+            'strings': strings,
+        }
+
+    def bind(self, target: Type[Model]) -> Model:
+        """
+        Builds an instance of a dataclass or named tuple from the configuration, see configuror.binding.bind.
+        :param target: a dataclass or named tuple class whose fields are top-level keys of the configuration.
+        :return: an instance of target.
+        """
+        return bind(self, target)
+
+    def namespace_view(self, namespace: str, lowercase: bool = True, trim_namespace: bool = True) -> NamespaceView:
+        """
+        Same as get_dict_from_namespace but returns a read-only view instead of a new dict. The view does not copy
+        values, it translates keys on first access and reflects later changes of the configuration.
+        """
+        return NamespaceView(self, namespace, lowercase, trim_namespace)
 
     def get_dict_from_namespace(
         self, namespace: str, lowercase: bool = True, trim_namespace: bool = True
@@ -291,3 +1122,75 @@ class Config(dict):
             result_dict[key] = value
 
         return result_dict
+
+
+def _loader_options(keys: Optional[Iterable[str]], limits: Optional[Limits]) -> Dict[str, Any]:
+    """Keyword arguments forwarded to loaders, only the given ones so that loaders not supporting them still work."""
+    options = {'keys': keys, 'limits': limits}
+    return {name: value for name, value in options.items() if value is not None}
+
+
+class Loader(NamedTuple):
+    """A function loading files of a given type in a Config object."""
+
+    load: Callable[[Config, Union[str, List[str]]], bool]
+    # if True, load receives the whole list of files of the type when loading mapping files
+    multiple_files: bool
+    # if True, load accepts an ignore_file_absence keyword argument and the existence of files is not checked beforehand
+    checks_existence: bool = False
+
+
+# file type -> loader, built once at import and extended with register_loader
+LOADERS: Dict[str, Loader] = {}
+
+
+def register_loader(
+    file_type: str, extensions: List[str], multiple_files: bool = False, checks_existence: bool = False
+) -> Callable[[Callable[[Config, Any], bool]], Callable[[Config, Any], bool]]:
+    """
+    Decorator registering a function as the loader of a file type. The function receives the Config object to update
+    and a path, it returns True if values were loaded.
+    :param file_type: the name of the file type, it can be used as a key of mapping files.
+    :param extensions: the extensions of the files of this type, used by load_from_files and load_from_directory.
+    :param multiple_files: if True, the function also accepts a list of paths, all the files of this type given in
+    mapping files are passed to it in one call.
+    :param checks_existence: if True, the function accepts an ignore_file_absence keyword argument and reports missing
+    files when opening them, so that load_from_files and mapping files do not check the existence of the files
+    beforehand. With multiple_files, it returns False when all the files of the list are missing.
+    When keys or limits are given to Config or load_from_* methods handling many files, they are passed to the
+    function as keys and limits keyword arguments.
+    """
+
+    def decorator(func: Callable[[Config, Any], bool]) -> Callable[[Config, Any], bool]:
+        normalized_type = file_type.lower()
+        LOADERS[normalized_type] = Loader(func, multiple_files, checks_existence)
+        EXTENSIONS[normalized_type] = list(extensions)
+        EXTENSION_TYPES.update((extension, normalized_type) for extension in extensions)
+        AVAILABLE_EXTENSIONS[:] = chain(*EXTENSIONS.values())
+        return func
+
+    return decorator
+
+
+def _method_loader(method_name: str) -> Callable[[Config, Any], bool]:
+    """Returns a loader calling a Config method, looked up at call time so that subclasses can override it."""
+
+    def load(config: Config, filenames: Union[str, List[str]], **kwargs: Any) -> bool:
+        return getattr(config, method_name)(filenames, **kwargs)
+
+    return load
+
+
+for _file_type, _method_name, _multiple_files in [
+    (JSON_TYPE, 'load_from_json', False),
+    (YAML_TYPE, 'load_from_yaml', False),
+    (INI_TYPE, 'load_from_ini', True),
+    (TOML_TYPE, 'load_from_toml', True),
+    (PYTHON_TYPE, 'load_from_python_file', False),
+    (ENV_TYPE, 'load_from_dotenv', False),
+    (MSGPACK_TYPE, 'load_from_msgpack', False),
+    (CBOR_TYPE, 'load_from_cbor', False),
+]:
+    register_loader(_file_type, EXTENSIONS[_file_type], _multiple_files, checks_existence=True)(
+        _method_loader(_method_name)
+    )
@@ -0,0 +1,83 @@
+"""Module which builds objects with attribute access from configuration mappings"""
+import keyword
+import re
+from typing import Any, Dict, Iterator, Mapping, Tuple, Type
+
+_NON_IDENTIFIER_CHARACTERS = re.compile(r'\W', flags=re.ASCII)
+
+
+class ConfigSection:
+    """
+    Base class of the classes generated by to_object. Each generated class declares the attributes of a section in its
+    __slots__, so instances have no __dict__ and attributes are read with a slot descriptor.
+    """
+
+    __slots__ = ()
+
+    def __iter__(self) -> Iterator[Tuple[str, Any]]:
+        for name in self.__slots__:
+            yield name, getattr(self, name)
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, ConfigSection):
+            return NotImplemented
+        return type(self) is type(other) and all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        attributes = ', '.join(f'{name}={value!r}' for name, value in self)
+        return f'{self.__class__.__name__}({attributes})'
+
+
+# attribute names -> generated class, classes are shared by all sections having the same keys
+_classes: Dict[Tuple[str, ...], Type[ConfigSection]] = {}
+
+
+def attribute_name(key: Any) -> str:
+    """
+    Converts a key to a valid attribute name: characters which are not allowed are replaced by underscores, keywords
+    get a trailing underscore and names starting with a digit get a leading underscore. Leading underscores of names
+    starting with two of them are replaced by a single one, since such names are mangled in __slots__ or may shadow
+    special attributes and methods like __dict__ or __iter__.
+    """
+    name = _NON_IDENTIFIER_CHARACTERS.sub('_', f'{key}')
+    if name.startswith('__'):
+        name = f'_{name.lstrip("_")}'
+    if not name or name[0].isdigit():
+        name = f'_{name}'
+    if keyword.iskeyword(name):
+        name = f'{name}_'
+    return name
+
+
+def section_class(names: Tuple[str, ...]) -> Type[ConfigSection]:
+    """
+    :param names: the attribute names of the section.
+    :return: the class of the sections having these attributes, generated on the first call.
+    """
+    cls = _classes.get(names)
+    if cls is None:
+        cls = _classes[names] = type('ConfigSection', (ConfigSection,), {'__slots__': names})
+    return cls
+
+
+def to_object(data: Any) -> Any:
+    """
+    Converts nested mappings to ConfigSection instances. Lists are copied with their items converted, other values are
+    returned as is.
+    :param data: the value to convert.
+    :return: the converted value.
+    """
+    if isinstance(data, Mapping):
+        names = tuple(attribute_name(key) for key in data)
+        if len(set(names)) != len(names):
+            raise ValueError(f'keys {list(data)} cannot be converted to distinct attribute names')
+        cls = section_class(names)
+        section = object.__new__(cls)
+        for name, value in zip(names, data.values()):
+            object.__setattr__(section, name, to_object(value))
+        return section
+    if isinstance(data, list):
+        return [to_object(item) for item in data]
+    return data
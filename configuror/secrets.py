@@ -0,0 +1,168 @@
+"""Module which resolves secret references like file:/run/secrets/db_password found in configuration values"""
+import threading
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Mapping, MutableMapping, Optional, Tuple
+
+from .exceptions import SecretError
+
+
+class SecretProvider(ABC):
+    """
+    Retrieves the secrets of a reference scheme. Subclasses implement fetch, which receives all the names needed by a
+    configuration at once, so that a provider backed by a remote service can retrieve them in a single request.
+    """
+
+    @abstractmethod
+    def fetch(self, names: List[str]) -> Dict[str, Any]:
+        """
+        :param names: the distinct names to retrieve, a name is the part of a reference following the scheme.
+        :return: a mapping of names to secret values, missing names are reported as SecretError.
+        """
+
+
+class FileSecretProvider(SecretProvider):
+    """Reads secrets from files, like the ones mounted by docker or kubernetes in /run/secrets."""
+
+    def fetch(self, names: List[str]) -> Dict[str, Any]:
+        secrets = {}
+        for name in names:
+            try:
+                with open(name) as f:
+                    secrets[name] = f.read().rstrip('\r\n')
+            except FileNotFoundError:
+                continue
+        return secrets
+
+
+class SecretResolver:
+    """
+    Replaces string values made of a secret reference, "<scheme>:<name>", by the value returned by the provider of the
+    scheme. All the references of a configuration are collected first and each provider is called once with all its
+    missing names, providers being called concurrently. Values are cached for ttl seconds and concurrent resolutions
+    needing the same expired or missing reference wait for a single fetch.
+    """
+
+    def __init__(self, providers: Mapping[str, SecretProvider], ttl: float = 300.0):
+        """
+        :param providers: a mapping of reference schemes, e.g. "file", to the providers retrieving their secrets.
+        :param ttl: the number of seconds a secret is cached.
+        """
+        self.providers = dict(providers)
+        self.ttl = ttl
+        # reference -> (value, expiration time)
+        self._cache: Dict[str, Tuple[Any, float]] = {}
+        # reference -> future of the fetch in progress, shared by the resolutions needing it
+        self._pending: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    def _scheme(self, value: Any) -> Optional[str]:
+        if not isinstance(value, str):
+            return None
+        scheme, separator, _ = value.partition(':')
+        return scheme if separator and scheme in self.providers else None
+
+    def collect(self, data: Any) -> List[str]:
+        """Returns the distinct secret references found in the string values of a nested structure."""
+        references = {}
+        containers = [data]
+        # containers found while iterating are appended to the list and visited by the same loop
+        for container in containers:
+            values = container.values() if isinstance(container, Mapping) else container
+            for value in values:
+                if isinstance(value, (Mapping, list)):
+                    containers.append(value)
+                elif self._scheme(value) is not None:
+                    references[value] = None
+        return list(references)
+
+    def _fetch(self, scheme: str, references: List[str], futures: List[Future]) -> None:
+        """Fetches a batch of references of a scheme, the values or the error are set on the futures."""
+        offset = len(scheme) + 1
+        try:
+            secrets = self.providers[scheme].fetch([reference[offset:] for reference in references])
+        except BaseException as e:
+            with self._lock:
+                for reference in references:
+                    del self._pending[reference]
+            for future in futures:
+                future.set_exception(e)
+            return
+
+        expiration = time.monotonic() + self.ttl
+        with self._lock:
+            for reference in references:
+                name = reference[offset:]
+                if name in secrets:
+                    self._cache[reference] = (secrets[name], expiration)
+                del self._pending[reference]
+        for reference, future in zip(references, futures):
+            name = reference[offset:]
+            if name in secrets:
+                future.set_result(secrets[name])
+            else:
+                future.set_exception(SecretError(reference))
+
+    def resolve_references(self, references: Iterable[str]) -> Dict[str, Any]:
+        """
+        :param references: secret references, e.g. "file:/run/secrets/db_password".
+        :return: a mapping of the references to their secret values.
+        """
+        values = {}
+        waiting: Dict[str, Future] = {}
+        # scheme -> (references, futures) this call is in charge of fetching
+        batches: Dict[str, Tuple[List[str], List[Future]]] = {}
+        now = time.monotonic()
+        with self._lock:
+            for reference in references:
+                cached = self._cache.get(reference)
+                if cached is not None and cached[1] > now:
+                    values[reference] = cached[0]
+                    continue
+                future = self._pending.get(reference)
+                if future is None:
+                    future = self._pending[reference] = Future()
+                    batch = batches.setdefault(self._scheme(reference), ([], []))
+                    batch[0].append(reference)
+                    batch[1].append(future)
+                waiting[reference] = future
+
+        if len(batches) == 1:
+            for scheme, (batch_references, futures) in batches.items():
+                self._fetch(scheme, batch_references, futures)
+        elif batches:
+            # providers usually wait for remote services, so they are called concurrently
+            with ThreadPoolExecutor(max_workers=len(batches)) as executor:
+                for scheme, (batch_references, futures) in batches.items():
+                    executor.submit(self._fetch, scheme, batch_references, futures)
+
+        for reference, future in waiting.items():
+            values[reference] = future.result()
+        return values
+
+    def _replace(self, value: Any, secrets: Dict[str, Any]) -> Any:
+        """Returns value with its references replaced, containers without references are returned as they are."""
+        if isinstance(value, str):
+            return secrets.get(value, value)
+        if isinstance(value, Mapping):
+            items = {key: self._replace(item, secrets) for key, item in value.items()}
+            return value if all(items[key] is item for key, item in value.items()) else items
+        if isinstance(value, list):
+            items = [self._replace(item, secrets) for item in value]
+            return value if all(new is old for new, old in zip(items, value)) else items
+        return value
+
+    def resolve(self, data: MutableMapping) -> List[str]:
+        """
+        Replaces the secret references of a nested mapping by their values. Nested containers holding references are
+        copied, the other ones are left untouched.
+        :param data: the mapping to update.
+        :return: the references resolved.
+        """
+        references = self.collect(data)
+        if references:
+            secrets = self.resolve_references(references)
+            replaced = {key: self._replace(value, secrets) for key, value in data.items()}
+            data.update({key: value for key, value in replaced.items() if value is not data[key]})
+        return references
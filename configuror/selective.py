@@ -0,0 +1,146 @@
+"""Parsers keeping only the requested top-level keys of a document"""
+import json
+import re
+from typing import Any, Dict, FrozenSet, Iterable, Optional
+
+import yaml
+from yaml.events import AliasEvent, CollectionEndEvent, CollectionStartEvent, NodeEvent
+from yaml.nodes import MappingNode, ScalarNode
+
+# keys always composed by the yaml loader because their value is merged in the top-level mapping
+YAML_MERGE_KEY = '<<'
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+_json_decoder = json.JSONDecoder()
+
+
+def normalize_keys(keys: Optional[Iterable[str]]) -> Optional[FrozenSet[str]]:
+    """Converts the keys given to a loader to a set, None means all keys are loaded."""
+    if keys is None:
+        return None
+    if isinstance(keys, str):
+        raise TypeError('keys must be an iterable of strings, not a string')
+    return frozenset(keys)
+
+
+def select_keys(data: Dict[Any, Any], keys: Optional[FrozenSet[str]]) -> Dict[Any, Any]:
+    """Returns the items of data whose key is in keys, or data itself if keys is None."""
+    if keys is None:
+        return data
+    return {key: value for key, value in data.items() if key in keys}
+
+
+def _expect(text: str, index: int, char: str, message: str) -> int:
+    """Skips whitespace and char at index, returns the position after them."""
+    index = _WHITESPACE.match(text, index).end()
+    if text[index : index + 1] != char:
+        raise json.JSONDecodeError(message, text, index)
+    return index + 1
+
+
+def parse_json_keys(text: str, keys: FrozenSet[str]) -> Dict[str, Any]:
+    """
+    Parses a json object, only keeping the values of the given top-level keys. Other values are decoded one at a time
+    and dropped right away, so the memory peak is the size of the biggest top-level value instead of the whole
+    document. They are not skipped without being decoded because the C scanner of the json module decodes a value
+    faster than a Python loop can find where it ends.
+    :param text: the json document.
+    :param keys: the top-level keys to decode.
+    :return: a dict with the requested keys found in the document.
+    """
+    data = {}
+    index = _expect(text, 0, '{', 'Expecting object')
+    index = _WHITESPACE.match(text, index).end()
+    if text[index : index + 1] == '}':
+        index += 1
+    else:
+        while True:
+            index = _expect(text, index, '"', 'Expecting property name enclosed in double quotes')
+            key, index = json.decoder.scanstring(text, index)
+            index = _expect(text, index, ':', "Expecting ':' delimiter")
+            index = _WHITESPACE.match(text, index).end()
+            value, index = _json_decoder.raw_decode(text, index)
+            if key in keys:
+                data[key] = value
+            # released before decoding the next value
+            del value
+            index = _WHITESPACE.match(text, index).end()
+            separator = text[index : index + 1]
+            index += 1
+            if separator == '}':
+                break
+            if separator != ',':
+                raise json.JSONDecodeError("Expecting ',' delimiter", text, index - 1)
+
+    if _WHITESPACE.match(text, index).end() != len(text):
+        raise json.JSONDecodeError('Extra data', text, index)
+    return data
+
+
+class SelectiveYamlLoader(yaml.FullLoader):
+    """
+    Yaml loader which only composes the values of the requested top-level keys. Events of the other values are
+    consumed without building nodes, except anchored ones which may be referenced by aliases later in the document.
+    """
+
+    def __init__(self, stream: Any, keys: FrozenSet[str], **kwargs: Any):
+        super().__init__(stream, **kwargs)
+        self.selected_keys = keys | {YAML_MERGE_KEY}
+        self._composing_root = False
+
+    def compose_node(self, parent: Optional[yaml.Node], index: Any) -> yaml.Node:
+        # only the document root is composed without parent
+        self._composing_root = parent is None
+        return super().compose_node(parent, index)
+
+    def compose_mapping_node(self, anchor: Optional[str]) -> MappingNode:
+        if not self._composing_root:
+            return super().compose_mapping_node(anchor)
+
+        self._composing_root = False
+        start_event = self.get_event()
+        tag = start_event.tag
+        if tag is None or tag == '!':
+            tag = self.resolve(MappingNode, None, start_event.implicit)
+        node = MappingNode(tag, [], start_event.start_mark, None, flow_style=start_event.flow_style)
+        if anchor is not None:
+            self.anchors[anchor] = node
+        while not self.check_event(yaml.MappingEndEvent):
+            item_key = self.compose_node(node, None)
+            if isinstance(item_key, ScalarNode) and item_key.value in self.selected_keys:
+                node.value.append((item_key, self.compose_node(node, item_key)))
+            else:
+                self._skip_node(node)
+        node.end_mark = self.get_event().end_mark
+        return node
+
+    def _skip_node(self, parent: MappingNode) -> None:
+        """Consumes the events of the next node."""
+        depth = 0
+        while True:
+            event = self.peek_event()
+            if isinstance(event, NodeEvent) and not isinstance(event, AliasEvent) and event.anchor is not None:
+                self.compose_node(parent, None)
+            else:
+                self.get_event()
+                if isinstance(event, CollectionStartEvent):
+                    depth += 1
+                elif isinstance(event, CollectionEndEvent):
+                    depth -= 1
+            if depth == 0:
+                return
+
+
+def load_yaml_keys(stream: Any, keys: FrozenSet[str]) -> Any:
+    """
+    Parses a yaml document, only building the values of the given top-level keys.
+    :param stream: a string or a file object.
+    :param keys: the top-level keys to build.
+    :return: a dict with the requested keys found in the document or the document itself if it is not a mapping.
+    """
+    loader = SelectiveYamlLoader(stream, keys)
+    try:
+        data = loader.get_single_data()
+    finally:
+        loader.dispose()
+    # values merged with "<<" may bring keys which were not requested
+    return select_keys(data, keys) if isinstance(data, dict) else data
@@ -0,0 +1,95 @@
+"""Module which holds a local server sharing a parsed configuration with other processes of the same host"""
+import os
+import socket
+import socketserver
+import stat
+import threading
+from typing import Callable, Optional
+
+from .main import JSON_TYPE, Config
+
+
+class _SnapshotHandler(socketserver.BaseRequestHandler):
+    def handle(self) -> None:
+        try:
+            self.request.sendall(self.server.payload)
+        except (BrokenPipeError, ConnectionResetError):
+            # the client disconnected before reading the snapshot, e.g. a server checking that the socket is in use
+            pass
+
+
+class ConfigServer:
+    """
+    Parses a configuration once and serves it as a pre-serialized json snapshot over a unix domain socket, so that
+    processes of the same host calling Config.from_server do not parse the same files again.
+    """
+
+    def __init__(self, socket_path: str, factory: Callable[[], Config]):
+        """
+        :param socket_path: the path of the unix domain socket to create.
+        :param factory: a callable building the configuration, e.g. lambda: Config(files=['settings.yaml']).
+        """
+        if not hasattr(socket, 'AF_UNIX'):
+            raise OSError('unix domain sockets are not supported on this platform')
+        if not callable(factory):
+            raise TypeError('factory must be a callable')
+        self.socket_path = socket_path
+        self._factory = factory
+        self._server: Optional[socketserver.ThreadingUnixStreamServer] = None
+        self._thread: Optional[threading.Thread] = None
+        self._payload = self._serialize(factory())
+
+    @staticmethod
+    def _serialize(config: Config) -> bytes:
+        return config.dumps(JSON_TYPE).encode()
+
+    def reload(self) -> None:
+        """Builds the configuration again, the next clients will receive the new snapshot."""
+        self._payload = self._serialize(self._factory())
+        if self._server is not None:
+            self._server.payload = self._payload
+
+    def _remove_stale_socket(self) -> None:
+        try:
+            mode = os.lstat(self.socket_path).st_mode
+        except FileNotFoundError:
+            return
+        if not stat.S_ISSOCK(mode):
+            raise FileExistsError(f'{self.socket_path} already exists and is not a socket')
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            try:
+                client.connect(self.socket_path)
+            except ConnectionRefusedError:
+                # nobody listens on the socket, it was left by a server which did not stop properly
+                os.unlink(self.socket_path)
+                return
+        raise OSError(f'a server is already listening on {self.socket_path}')
+
+    def start(self) -> None:
+        """Starts serving the configuration in a background thread."""
+        self._remove_stale_socket()
+        self._server = socketserver.ThreadingUnixStreamServer(self.socket_path, _SnapshotHandler)
+        self._server.daemon_threads = True
+        self._server.payload = self._payload
+        # only processes of the same user can read the configuration
+        os.chmod(self.socket_path, 0o600)
+        self._thread = threading.Thread(target=self._server.serve_forever, kwargs={'poll_interval': 0.1}, daemon=True)
+        self._thread.start()
+
+    def close(self) -> None:
+        """Stops the server and removes the socket file."""
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+        self._server = self._thread = None
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+
+    def __enter__(self) -> 'ConfigServer':
+        self.start()
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
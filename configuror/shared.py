@@ -0,0 +1,81 @@
+"""Module which holds a container publishing configuration snapshots to concurrent readers"""
+import threading
+from typing import Any, Callable, Mapping, NamedTuple, Optional
+
+from .history import ConfigHistory, freeze
+from .main import Config
+
+
+class ConfigSnapshot(NamedTuple):
+    """A read-only configuration and the number of reloads which produced it."""
+
+    generation: int
+    config: Mapping[str, Any]
+
+
+class SharedConfig:
+    """
+    Holds the configuration of an application which is reloaded while other threads read it. A reload builds a brand
+    new Config and publishes it with a single reference assignment, so readers never take a lock and always see the
+    values of one reload, never a mix of two.
+    """
+
+    def __init__(self, factory: Callable[[], Config], history: Optional[ConfigHistory] = None):
+        """
+        :param factory: a callable building the configuration, e.g. lambda: Config(files=['settings.yaml']).
+        :param history: if given, each configuration loaded is recorded in it and rollback can publish one of them.
+        """
+        if not callable(factory):
+            raise TypeError('factory must be a callable')
+        self._factory = factory
+        self.history = history
+        # only reloads are serialized, readers never wait
+        self._reload_lock = threading.Lock()
+        self._snapshot = ConfigSnapshot(0, self._read_only(factory()))
+
+    def _read_only(self, config: Config) -> Mapping[str, Any]:
+        """
+        Returns the deeply read-only mapping published for a new configuration, the version recorded in the history
+        if any, so readers cannot modify values seen by other threads.
+        """
+        if self.history is None:
+            return freeze(config)
+        return self.history.get(self.history.record(config))
+
+    @property
+    def snapshot(self) -> ConfigSnapshot:
+        """The current snapshot, keep a reference to it to read several values of the same generation."""
+        return self._snapshot
+
+    @property
+    def config(self) -> Mapping[str, Any]:
+        """The current configuration, nested dicts are read-only mappings and lists are tuples."""
+        return self._snapshot.config
+
+    @property
+    def generation(self) -> int:
+        """The number of successful reloads, handy to invalidate caches built from the configuration."""
+        return self._snapshot.generation
+
+    def reload(self) -> ConfigSnapshot:
+        """
+        Builds a new configuration and publishes it. If the factory raises an error, the current snapshot is kept.
+        :return: the new snapshot.
+        """
+        with self._reload_lock:
+            config = self._read_only(self._factory())
+            self._snapshot = ConfigSnapshot(self._snapshot.generation + 1, config)
+            return self._snapshot
+
+    def rollback(self, version: int) -> ConfigSnapshot:
+        """
+        Publishes a version of the history again, without calling the factory.
+        :param version: a version retained by the history given to the constructor.
+        :return: the new snapshot.
+        """
+        if self.history is None:
+            raise ValueError('a history is needed to roll back')
+        with self._reload_lock:
+            config = self.history.rollback(version)
+            self._snapshot = ConfigSnapshot(self._snapshot.generation + 1, config)
+            return self._snapshot
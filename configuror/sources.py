@@ -0,0 +1,134 @@
+"""Module which holds helpers to retrieve configurations which are not stored on the local filesystem"""
+import http.client
+import threading
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from .exceptions import FetchError
+
+# errors meaning that a kept-alive connection was closed by the server between two requests
+_STALE_CONNECTION_ERRORS = (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError)
+
+
+class HttpFetcher:
+    """
+    Fetches remote configuration files over http(s). Persistent connections are kept in a small pool per host and
+    responses are cached with their ETag so that unchanged documents are not downloaded again. The lock only protects
+    the pool and the cache, so concurrent fetches run in parallel, each one on its own connection.
+    """
+
+    def __init__(self, timeout: float = 10.0, headers: Optional[Dict[str, str]] = None, max_idle_connections: int = 4):
+        """
+        :param timeout: the number of seconds to wait for a server.
+        :param headers: headers sent with every request.
+        :param max_idle_connections: the number of unused connections kept open per host.
+        """
+        self.timeout = timeout
+        self.headers = headers or {}
+        self.max_idle_connections = max_idle_connections
+        # (scheme, netloc) -> connections which are not used by a fetch
+        self._idle_connections: Dict[Tuple[str, str], List[http.client.HTTPConnection]] = {}
+        # url -> (etag, body, content type)
+        self._cache: Dict[str, Tuple[str, bytes, Optional[str]]] = {}
+        self._lock = threading.Lock()
+
+    def _new_connection(self, host: Tuple[str, str]) -> http.client.HTTPConnection:
+        scheme, netloc = host
+        connection_class = http.client.HTTPSConnection if scheme == 'https' else http.client.HTTPConnection
+        return connection_class(netloc, timeout=self.timeout)
+
+    def _acquire_connection(self, host: Tuple[str, str]) -> http.client.HTTPConnection:
+        with self._lock:
+            idle_connections = self._idle_connections.get(host)
+            if idle_connections:
+                return idle_connections.pop()
+        return self._new_connection(host)
+
+    def _release_connection(self, host: Tuple[str, str], connection: http.client.HTTPConnection) -> None:
+        with self._lock:
+            idle_connections = self._idle_connections.setdefault(host, [])
+            if len(idle_connections) < self.max_idle_connections:
+                idle_connections.append(connection)
+                return
+        connection.close()
+
+    def _request(
+        self, host: Tuple[str, str], path: str, headers: Dict[str, str]
+    ) -> Tuple[http.client.HTTPConnection, http.client.HTTPResponse]:
+        connection = self._acquire_connection(host)
+        try:
+            connection.request('GET', path, headers=headers)
+            return connection, connection.getresponse()
+        except _STALE_CONNECTION_ERRORS:
+            # the server closed the kept-alive connection, we retry once with a fresh one
+            connection.close()
+        except Exception:
+            connection.close()
+            raise
+        connection = self._new_connection(host)
+        try:
+            connection.request('GET', path, headers=headers)
+            return connection, connection.getresponse()
+        except Exception:
+            connection.close()
+            raise
+
+    def fetch(self, url: str) -> Tuple[bytes, Optional[str]]:
+        """
+        :param url: the http(s) url of the configuration to retrieve.
+        :return: a tuple (body, content_type) where content_type is the media type sent by the server if any.
+        """
+        parts = urlsplit(url)
+        if parts.scheme not in ('http', 'https'):
+            raise ValueError(f'{url} is not an http or https url')
+        path = parts.path or '/'
+        if parts.query:
+            path = f'{path}?{parts.query}'
+
+        headers = dict(self.headers)
+        with self._lock:
+            cached = self._cache.get(url)
+        if cached is not None:
+            headers['If-None-Match'] = cached[0]
+
+        host = (parts.scheme, parts.netloc)
+        connection, response = self._request(host, path, headers)
+        try:
+            # the body must always be consumed to be able to reuse the connection
+            body = response.read()
+        except Exception:
+            connection.close()
+            raise
+        self._release_connection(host, connection)
+
+        if response.status == 304 and cached is not None:
+            return cached[1], cached[2]
+        if response.status != 200:
+            raise FetchError(url, response.status)
+
+        content_type = response.getheader('Content-Type')
+        if content_type is not None:
+            content_type = content_type.split(';')[0].strip().lower()
+        etag = response.getheader('ETag')
+        with self._lock:
+            if etag is not None:
+                self._cache[url] = (etag, body, content_type)
+            else:
+                self._cache.pop(url, None)
+        return body, content_type
+
+    def close(self) -> None:
+        """Closes the idle connections, the connections of fetches in progress are added to the pool when they end."""
+        with self._lock:
+            idle_connections = [
+                connection for connections in self._idle_connections.values() for connection in connections
+            ]
+            self._idle_connections.clear()
+        for connection in idle_connections:
+            connection.close()
+
+    def __enter__(self) -> 'HttpFetcher':
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
@@ -1,19 +1,194 @@
 """Helper functions for the project"""
+import os
 import re
+import sys
 from configparser import ConfigParser
 from decimal import Decimal
+from importlib import import_module
+from itertools import chain
 from pathlib import Path
-from typing import Dict, List, Union
+from types import ModuleType
+from typing import Any, Dict, Iterable, List, Mapping, NamedTuple, Optional, Set, Tuple, Union
 
 from .exceptions import DecodeError
 
 SET_EXPORT_EXPRESSION = re.compile(r'[\w/]*\s*(set|export)\s+', flags=re.IGNORECASE)
 ITEM_EXPRESSION = re.compile(r'[\w/]+')
+# same syntax as the one used by os.path.expandvars on posix systems: $name or ${name}
+VARIABLE_EXPRESSION = re.compile(r'\$(\w+|\{[^}]*\})', flags=re.ASCII)
 
 
-def convert_ini_config_to_dict(config: ConfigParser) -> dict:
-    """Translates a configparser object into a dict."""
-    return {key: dict(value) for key, value in config.items()}
+def convert_ini_config_to_dict(config: ConfigParser, sections: Optional[Iterable[str]] = None) -> dict:
+    """
+    Translates a configparser object into a dict.
+    :param config: the configparser object to translate.
+    :param sections: if given, only these sections are translated, sparing the interpolation of the other values.
+    """
+    return {key: dict(value) for key, value in config.items() if sections is None or key in sections}
+
+
+def import_optional(module_name: str) -> ModuleType:
+    """Imports a package which is only needed by some file types and is therefore not a configuror dependency."""
+    try:
+        return import_module(module_name)
+    except ImportError as e:
+        raise ImportError(f'{module_name} must be installed to use this file type: pip install {module_name}') from e
+
+
+class _StringTable:
+    """Canonical strings of a deduplication pass along with the memory released by dropping their duplicates."""
+
+    def __init__(self, max_length: int):
+        self.max_length = max_length
+        self.strings: Dict[str, str] = {}
+        self.saved_bytes = 0
+
+    def canonical(self, value: Any, is_key: bool = False) -> Any:
+        if not isinstance(value, str) or (not is_key and len(value) > self.max_length):
+            return value
+        existing = self.strings.setdefault(value, value)
+        if existing is not value:
+            self.saved_bytes += sys.getsizeof(value)
+        return existing
+
+    def update_dict(self, item: dict, children: List[Any]) -> None:
+        if any(self.strings.get(key, key) is not key for key in item):
+            # keys can only be swapped by rebuilding the dict, it is done in place to preserve its identity
+            items = [(self.canonical(key, is_key=True), value) for key, value in item.items()]
+            item.clear()
+            item.update(items)
+        else:
+            for key in item:
+                self.canonical(key, is_key=True)
+        for key, value in item.items():
+            if isinstance(value, (dict, list)):
+                children.append(value)
+            else:
+                item[key] = self.canonical(value)
+
+    def update_list(self, item: list, children: List[Any]) -> None:
+        for index, value in enumerate(item):
+            if isinstance(value, (dict, list)):
+                children.append(value)
+            else:
+                item[index] = self.canonical(value)
+
+
+def deduplicate_strings(data: Any, max_length: int = 64, shared_containers: bool = False) -> Tuple[Any, int]:
+    """
+    Replaces equal dict keys and short string values of a nested structure by a single canonical string object. Dicts
+    and lists are updated in place, so no copy of the structure is made.
+    :param data: the structure (typically the result of a json, yaml or toml parsing) to deduplicate.
+    :param max_length: string values longer than this limit are left untouched. Dict keys are always deduplicated.
+    :param shared_containers: must be True if a container can be referenced several times or by itself, like yaml
+    aliases. Each container is then visited once, at the cost of remembering the ids of the visited ones.
+    :return: a tuple (data, saved_bytes) where saved_bytes is the memory released by the duplicate strings dropped.
+    """
+    table = _StringTable(max_length)
+    if isinstance(data, str):
+        return table.canonical(data), 0
+
+    seen = set() if shared_containers else None
+    stack = [data]
+    while stack:
+        item = stack.pop()
+        if seen is not None:
+            if id(item) in seen:
+                continue
+            seen.add(id(item))
+        if isinstance(item, dict):
+            table.update_dict(item, stack)
+        elif isinstance(item, list):
+            table.update_list(item, stack)
+    return data, table.saved_bytes
+
+
+class SizeCount(NamedTuple):
+    """Deep memory size of a structure along with the number of containers and strings it holds."""
+
+    bytes: int
+    containers: int
+    strings: int
+
+
+def deep_size(data: Any, seen: Optional[Set[int]] = None) -> SizeCount:
+    """
+    Computes the memory used by a nested structure. Each object is counted once, even if referenced many times.
+    :param data: the structure to measure.
+    :param seen: ids of the objects already counted. Sharing it between calls avoids counting shared objects twice.
+    :return: a SizeCount instance.
+    """
+    seen = set() if seen is None else seen
+    size = containers = strings = 0
+    stack = [data]
+    while stack:
+        item = stack.pop()
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        size += sys.getsizeof(item)
+        if isinstance(item, str):
+            strings += 1
+        elif isinstance(item, Mapping):
+            containers += 1
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            containers += 1
+            stack.extend(item)
+    return SizeCount(size, containers, strings)
+
+
+class ChangeSet(NamedTuple):
+    """Key paths added, removed and changed between two configurations."""
+
+    added: List[Tuple[Any, ...]]
+    removed: List[Tuple[Any, ...]]
+    changed: List[Tuple[Any, ...]]
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.changed)
+
+    def affects(self, *path: Any) -> bool:
+        """
+        :param path: a key path like ('database', 'pool').
+        :return: True if a change occurred on the path, one of its parents or one of its children.
+        """
+        size = len(path)
+        for change_path in chain(self.added, self.removed, self.changed):
+            if change_path[:size] == path or path[: len(change_path)] == change_path:
+                return True
+        return False
+
+
+def diff_mappings(old: Mapping, new: Mapping) -> ChangeSet:
+    """
+    Computes the key paths that differ between two mappings. Nested mappings are compared recursively, and values
+    which are the same object are skipped without being compared.
+    :param old: the previous mapping.
+    :param new: the current mapping.
+    :return: a ChangeSet object.
+    """
+    change_set = ChangeSet([], [], [])
+
+    def walk(old_mapping: Mapping, new_mapping: Mapping, parent: Tuple[Any, ...]) -> None:
+        for key, old_value in old_mapping.items():
+            if key not in new_mapping:
+                change_set.removed.append((*parent, key))
+                continue
+            new_value = new_mapping[key]
+            if old_value is new_value:
+                continue
+            if isinstance(old_value, Mapping) and isinstance(new_value, Mapping):
+                walk(old_value, new_value, (*parent, key))
+            elif old_value != new_value:
+                change_set.changed.append((*parent, key))
+        for key in new_mapping:
+            if key not in old_mapping:
+                change_set.added.append((*parent, key))
+
+    walk(old, new, ())
+    return change_set
 
 
 # DOTENV
@@ -32,38 +207,71 @@ def _sanitize_key_and_value(items: List[str]) -> List[str]:
     return [key, value]
 
 
-def get_dict_from_dotenv_file(filename: Union[Path, str]) -> Dict[str, str]:
+def get_dict_from_dotenv_lines(lines: Iterable[str], filename: str = 'the stream') -> Dict[str, str]:
     """
-    :param filename: .env file where values are extracted.
-    :return: a dict with keys and values extracted from the .env file.
+    :param lines: lines of a dotenv content.
+    :param filename: name of the source used in error messages.
+    :return: a dict with keys and values extracted from the lines.
     """
     result_dict = {}
 
     error_message = 'file {filename}: the line n°{index} is not correct: "{line}"'
-    with open(filename) as f:
-        for index, line in enumerate(f):
-            stripped_line = line.strip()
-            # we don't take into account comments
-            if stripped_line.startswith('#'):
-                continue
-            # we don't take into account empty lines
-            if not stripped_line:
-                continue
-            parts = stripped_line.split('#')  # we remove inline comments if there are any
-            # we remove set or export command if there are any
-            new_line = SET_EXPORT_EXPRESSION.sub('', parts[0].strip())
-
-            # we get key and value
-            parts = new_line.split('=')
-            parts = _sanitize_key_and_value(parts)
-            if len(parts) != 2 or ITEM_EXPRESSION.match(parts[0]) is None or ITEM_EXPRESSION.match(parts[1]) is None:
-                line_number = index + 1
-                raise DecodeError(message=error_message.format(filename=filename, index=line_number, line=new_line))
-            result_dict[parts[0]] = parts[1]
+    for index, line in enumerate(lines):
+        stripped_line = line.strip()
+        # we don't take into account comments
+        if stripped_line.startswith('#'):
+            continue
+        # we don't take into account empty lines
+        if not stripped_line:
+            continue
+        parts = stripped_line.split('#')  # we remove inline comments if there are any
+        new_line = parts[0].strip()
+        # we remove set or export command if there are any, the substring test avoids the costly regex on most lines
+        lowered_line = new_line.lower()
+        if 'set' in lowered_line or 'export' in lowered_line:
+            new_line = SET_EXPORT_EXPRESSION.sub('', new_line)
+
+        # we get key and value
+        parts = new_line.split('=')
+        parts = _sanitize_key_and_value(parts)
+        if len(parts) != 2 or ITEM_EXPRESSION.match(parts[0]) is None or ITEM_EXPRESSION.match(parts[1]) is None:
+            line_number = index + 1
+            raise DecodeError(message=error_message.format(filename=filename, index=line_number, line=new_line))
+        result_dict[parts[0]] = parts[1]
 
     return result_dict
 
 
+def expand_variables(value: str, variables: Mapping[str, str]) -> str:
+    """
+    Expands $name and ${name} references in a single pass. Unknown references are left unchanged.
+    :param value: the string to expand.
+    :param variables: variables looked up before the environment variables.
+    :return: the expanded string.
+    """
+    if '$' not in value:
+        return value
+
+    def replace(match: re.Match) -> str:
+        name = match.group(1)
+        if name.startswith('{'):
+            name = name[1:-1]
+        if name in variables:
+            return variables[name]
+        return os.environ.get(name, match.group(0))
+
+    return VARIABLE_EXPRESSION.sub(replace, value)
+
+
+def get_dict_from_dotenv_file(filename: Union[Path, str]) -> Dict[str, str]:
+    """
+    :param filename: .env file where values are extracted.
+    :return: a dict with keys and values extracted from the .env file.
+    """
+    with open(filename) as f:
+        return get_dict_from_dotenv_lines(f, filename)
+
+
 def bool_converter(value: str) -> bool:
     """
     :param value: a string to convert to bool.
@@ -0,0 +1,106 @@
+"""Module which holds read-only views over Config objects"""
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Any, Dict, Iterator, Optional
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .main import Config
+
+_MISSING = object()
+
+
+class ConfigOverlay(Mapping):
+    """
+    Read-only view of a base mapping with some keys overridden. Only the overrides are stored and the base mapping is
+    referenced, so an overlay costs the size of its overrides whatever the size of the base. Nested mappings of the
+    overrides are merged with the corresponding nested mappings of the base when they are accessed.
+    """
+
+    __slots__ = ('_base', '_overrides')
+
+    def __init__(self, base: Mapping, overrides: Mapping):
+        self._base = base
+        self._overrides = overrides
+
+    def __getitem__(self, key: Any) -> Any:
+        value = self._overrides.get(key, _MISSING)
+        if value is _MISSING:
+            return self._base[key]
+        if isinstance(value, Mapping):
+            base_value = self._base.get(key)
+            if isinstance(base_value, Mapping):
+                return ConfigOverlay(base_value, value)
+        return value
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._overrides or key in self._base
+
+    def __iter__(self) -> Iterator:
+        yield from self._base
+        for key in self._overrides:
+            if key not in self._base:
+                yield key
+
+    def __len__(self) -> int:
+        return len(self._base) + sum(1 for key in self._overrides if key not in self._base)
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({self._base!r}, {self._overrides!r})'
+
+    def overlay(self, overrides: Optional[Mapping] = None, **kwargs) -> 'ConfigOverlay':
+        """
+        :param overrides: values overriding the ones of this view.
+        :param kwargs: other values overriding the ones of this view.
+        :return: a new view on top of this one.
+        """
+        return ConfigOverlay(self, {**(overrides or {}), **kwargs})
+
+
+class NamespaceView(Mapping):
+    """
+    Read-only view of the keys of a Config starting with a namespace, like the dict returned by
+    Config.get_dict_from_namespace. Values are not copied: the view maps translated keys to the keys of the
+    configuration and reads values from it. This key map is built on first access and kept until the configuration
+    is mutated.
+    """
+
+    __slots__ = ('_config', '_namespace', '_lowercase', '_trim_namespace', '_keys', '_mutations')
+
+    def __init__(self, config: 'Config', namespace: str, lowercase: bool = True, trim_namespace: bool = True):
+        self._config = config
+        self._namespace = namespace
+        self._lowercase = lowercase
+        self._trim_namespace = trim_namespace
+        # translated key -> key of the configuration
+        self._keys: Dict[str, str] = {}
+        self._mutations: Optional[int] = None
+
+    def _key_map(self) -> Dict[str, str]:
+        mutations = self._config._mutations
+        if mutations != self._mutations:
+            keys = {}
+            start = len(self._namespace) if self._trim_namespace else 0
+            for key in self._config:
+                if not isinstance(key, str) or not key.startswith(self._namespace):
+                    continue
+                translated = key[start:]
+                if self._lowercase:
+                    translated = translated.lower()
+                keys[translated] = key
+            self._keys = keys
+            self._mutations = mutations
+        return self._keys
+
+    def __getitem__(self, key: Any) -> Any:
+        return self._config[self._key_map()[key]]
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._key_map()
+
+    def __iter__(self) -> Iterator:
+        return iter(self._key_map())
+
+    def __len__(self) -> int:
+        return len(self._key_map())
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({dict(self)!r})'
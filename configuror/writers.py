@@ -0,0 +1,104 @@
+"""Module which holds functions writing configurations in the formats supported by configuror"""
+import json
+from datetime import date, datetime, time
+from typing import IO, Any, Callable, Mapping, NamedTuple
+
+import toml
+import yaml
+
+from .columnar import RecordTable
+from .exceptions import DecodeError
+from .utils import VARIABLE_EXPRESSION, get_dict_from_dotenv_lines, import_optional
+
+
+class Writer(NamedTuple):
+    """A function writing a mapping to a file object of a given type."""
+
+    write: Callable[[Mapping, IO], None]
+    # if True, the file object must be opened in binary mode
+    binary: bool
+
+
+class _YamlDumper(yaml.SafeDumper):
+    """Safe dumper which also knows how to represent dict subclasses like Config."""
+
+
+_YamlDumper.add_multi_representer(dict, yaml.representer.SafeRepresenter.represent_dict)
+_YamlDumper.add_representer(
+    RecordTable, lambda dumper, table: yaml.representer.SafeRepresenter.represent_list(dumper, table.to_list())
+)
+
+
+def _to_serializable(value: Any) -> Any:
+    # date and time objects not natively supported by a format are written as iso formatted strings
+    if isinstance(value, (date, datetime, time)):
+        return value.isoformat()
+    # record tables created by Config.columnarize are written as lists of dicts
+    if isinstance(value, RecordTable):
+        return value.to_list()
+    raise TypeError(f'{value!r} is not serializable')
+
+
+def _is_scalar(value: Any) -> bool:
+    return not isinstance(value, (Mapping, list, tuple, set))
+
+
+def write_json(data: Mapping, stream: IO) -> None:
+    # json.dump writes the chunks produced by the encoder one after the other, the document is never built in memory
+    json.dump(data, stream, indent=2, default=_to_serializable)
+
+
+def write_yaml(data: Mapping, stream: IO) -> None:
+    yaml.dump(data, stream, Dumper=_YamlDumper, sort_keys=False, allow_unicode=True)
+
+
+def write_toml(data: Mapping, stream: IO) -> None:
+    toml.dump(data, stream)
+
+
+def write_ini(data: Mapping, stream: IO) -> None:
+    for section, options in data.items():
+        if not isinstance(options, Mapping):
+            raise ValueError(f'{section} is not a section, only mappings can be written at the top level of ini files')
+        stream.write(f'[{section}]\n')
+        for key, value in options.items():
+            # percent signs are escaped so that values are read unchanged with the default basic interpolation
+            value = f'{value}'.replace('%', '%%').replace('\n', '\n\t')
+            stream.write(f'{key} = {value}\n')
+        stream.write('\n')
+
+
+def _can_read_dotenv_line(line: str, key: str, value: str) -> bool:
+    # the dotenv syntax has no escaping, so the line is parsed again to reject values which would come back altered,
+    # e.g. empty values, values holding "#", "=" or line breaks, and variable references expanded when loading
+    if VARIABLE_EXPRESSION.search(value):
+        return False
+    try:
+        return get_dict_from_dotenv_lines(line.splitlines()) == {key: value}
+    except DecodeError:
+        return False
+
+
+def write_dotenv(data: Mapping, stream: IO) -> None:
+    for key, value in data.items():
+        if not _is_scalar(value):
+            raise ValueError(f'{key} value cannot be written in a dotenv file, only scalar values are supported')
+        key, value = f'{key}', f'{value}'
+        written_value = f'"{value}"' if any(character.isspace() for character in value) else value
+        line = f'{key}={written_value}'
+        if not _can_read_dotenv_line(line, key, value):
+            raise ValueError(
+                f'{key} value {value!r} cannot be written in a dotenv file, it would not be read unchanged'
+            )
+        stream.write(f'{line}\n')
+
+
+def write_msgpack(data: Mapping, stream: IO) -> None:
+    msgpack = import_optional('msgpack')
+    # msgpack only knows timezone-aware datetimes
+    msgpack.pack(data, stream, default=_to_serializable, datetime=True)
+
+
+def write_cbor(data: Mapping, stream: IO) -> None:
+    cbor2 = import_optional('cbor2')
+    cbor2.dump(data, stream, default=lambda encoder, value: encoder.encode(_to_serializable(value)))
@@ -1,5 +1,7 @@
 import os
 import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 
 import pytest
 
@@ -26,3 +28,58 @@ def clean_env():
 def tempdir():
     with tempfile.TemporaryDirectory() as temp_dir:
         yield temp_dir
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Serves the documents of the stub server, answering 304 when the client already has the current version."""
+
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):  # noqa: N802
+        server = self.server
+        server.requests.append((self.path, self.headers.get('If-None-Match'), self.client_address))
+        if server.barrier is not None:
+            try:
+                server.barrier.wait()
+            except threading.BrokenBarrierError:
+                self.send_response(503)
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+                return
+        if self.path not in server.documents:
+            self.send_response(404)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        body, content_type = server.documents[self.path]
+        etag = f'"{hash(body)}"'
+        if self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('ETag', etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_):
+        pass
+
+
+@pytest.fixture()
+def stub_server():
+    """A local http server serving the documents registered in its "documents" attribute."""
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StubHandler)
+    server.documents = {}
+    server.requests = []
+    # if set, requests wait for each other at the barrier, a broken barrier gives a 503 response
+    server.barrier = None
+    server.url = f'http://127.0.0.1:{server.server_port}'
+    thread = threading.Thread(target=server.serve_forever, kwargs={'poll_interval': 0.05}, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
@@ -0,0 +1,162 @@
+"""Tests binding of configurations to dataclasses and named tuples"""
+from dataclasses import dataclass, field
+from decimal import Decimal
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+import pytest
+
+from configuror import BindError, Config
+from configuror.binding import _plans, bind
+
+
+class Credentials(NamedTuple):
+    user: str
+    password: str = ''
+
+
+@dataclass
+class Database:
+    host: str
+    port: int
+    credentials: Credentials
+    replicas: List[str] = field(default_factory=list)
+    timeout: Optional[float] = None
+
+
+@dataclass
+class Settings:
+    debug: bool
+    database: Database
+    ratios: List[Decimal]
+    paths: Tuple[Path, ...] = ()
+    limits: Dict[str, int] = field(default_factory=dict)
+    max_size: int = field(default=10, metadata={'key': 'max-size'})
+    tags: List[str] = field(default_factory=list, metadata={'converter': lambda value: value.split('|')})
+    extra: object = None
+
+
+@dataclass
+class Node:
+    name: str
+    children: List['Node'] = field(default_factory=list)
+
+
+@dataclass
+class Port:
+    number: int
+    # instances created, to check that the class is only called once per bind
+    created = 0
+
+    def __post_init__(self):
+        Port.created += 1
+        if self.number > 65535:
+            raise ValueError('port number is too big')
+
+
+@pytest.fixture()
+def data():
+    return {
+        'debug': 'no',
+        'database': {'host': 'localhost', 'port': '5432', 'credentials': {'user': 'admin'}, 'replicas': ['a', 'b']},
+        'ratios': '0.1, 0.2',
+        'paths': ['/etc', '/var'],
+        'limits': {'cpu': '2'},
+        'max-size': 20,
+        'tags': 'a|b',
+        'unknown': 'ignored',
+    }
+
+
+class TestBind:
+    """Tests function bind and method Config.bind"""
+
+    def test_should_convert_values_to_annotated_types(self, data):
+        settings = bind(data, Settings)
+
+        assert (
+            Settings(
+                debug=False,
+                database=Database('localhost', 5432, Credentials('admin'), ['a', 'b']),
+                ratios=[Decimal('0.1'), Decimal('0.2')],
+                paths=(Path('/etc'), Path('/var')),
+                limits={'cpu': 2},
+                max_size=20,
+                tags=['a', 'b'],
+            )
+            == settings
+        )
+
+    def test_should_apply_defaults_of_missing_fields(self):
+        database = bind({'host': 'localhost', 'port': 5432, 'credentials': {'user': 'admin'}, 'timeout': 3}, Database)
+
+        assert [] == database.replicas
+        assert 3.0 == database.timeout
+        assert isinstance(database.timeout, float)
+
+    def test_should_bind_classes_referencing_themselves(self):
+        node = bind({'name': 'a', 'children': [{'name': 'b', 'children': [{'name': 'c'}]}]}, Node)
+
+        assert Node('a', [Node('b', [Node('c')])]) == node
+
+    def test_should_cache_compiled_plan_per_class(self, data):
+        bind(data, Settings)
+        plan = _plans[Settings]
+        bind(data, Settings)
+
+        assert plan is _plans[Settings]
+        assert Database in _plans
+        assert Credentials in _plans
+
+    @pytest.mark.parametrize(
+        ('change', 'message'),
+        [
+            ({'database': 'localhost'}, 'cannot bind "database": expected a mapping, got str'),
+            ({'database': {'host': 'x', 'port': 'abc', 'credentials': {}}}, 'cannot bind "database.port": '),
+            ({'database': {'host': 'x', 'port': 1, 'credentials': {}}}, 'cannot bind "database.credentials.user": '),
+            ({'ratios': ['0.1', 'x']}, 'cannot bind "ratios": '),
+            ({'limits': {'cpu': 'x'}}, 'cannot bind "limits": '),
+        ],
+    )
+    def test_should_raise_error_with_path_of_invalid_values(self, data, change, message):
+        data.update(change)
+
+        with pytest.raises(BindError) as exc_info:
+            bind(data, Settings)
+
+        assert str(exc_info.value).startswith(message)
+
+    def test_should_raise_error_when_required_value_is_missing(self, data):
+        del data['database']
+
+        with pytest.raises(BindError) as exc_info:
+            bind(data, Settings)
+
+        assert 'cannot bind "database": missing value' == str(exc_info.value)
+        assert 'database' == exc_info.value.path
+
+    def test_should_not_call_class_again_when_it_raises_an_error(self):
+        Port.created = 0
+
+        with pytest.raises(ValueError) as exc_info:
+            bind({'number': '70000'}, Port)
+
+        assert 'port number is too big' == str(exc_info.value)
+        assert 1 == Port.created
+
+    def test_should_raise_error_when_data_is_not_a_mapping(self):
+        with pytest.raises(BindError) as exc_info:
+            bind([], Credentials)
+
+        assert 'cannot bind Credentials: expected a mapping, got list' == str(exc_info.value)
+
+    def test_should_raise_error_when_target_is_not_a_model(self):
+        with pytest.raises(TypeError) as exc_info:
+            bind({}, dict)
+
+        assert "<class 'dict'> is not a dataclass or a named tuple class" == str(exc_info.value)
+
+    def test_config_binds_its_top_level_keys(self):
+        config = Config(user='admin', password='secret', debug=True)
+
+        assert Credentials('admin', 'secret') == config.bind(Credentials)
@@ -0,0 +1,111 @@
+"""Tests case-insensitive lookups of Config"""
+import copy
+import warnings
+
+import pytest
+
+from configuror import CaseCollisionError, Config
+from configuror.casefold import CaseFoldIndex
+
+
+class TestCaseFoldIndex:
+    """Tests class CaseFoldIndex"""
+
+    def test_should_raise_error_when_policy_is_unknown(self):
+        with pytest.raises(ValueError) as exc_info:
+            CaseFoldIndex('raise')
+
+        assert "case collision policy must be one of ['warn', 'error', 'ignore'], not 'raise'" == str(exc_info.value)
+
+    def test_should_return_key_added_last_among_keys_differing_by_case(self):
+        index = CaseFoldIndex('ignore')
+        index.add(['DEBUG', 4, 'Debug'])
+        index.add(['DEBUG'])
+
+        assert 'Debug' == index.get('debug')
+        index.remove('Debug')
+        index.remove(4)
+        assert 'DEBUG' == index.get('dEbUg')
+        index.remove('DEBUG')
+        assert index.get('debug') is None
+
+    def test_should_not_modify_index_when_error_is_raised(self):
+        index = CaseFoldIndex('error')
+        index.add(['name'])
+
+        with pytest.raises(CaseCollisionError) as exc_info:
+            index.add(['port', 'NAME'])
+
+        assert 'keys "name" and "NAME" only differ by case' == str(exc_info.value)
+        assert index.get('PORT') is None
+
+
+class TestGetIgnoreCase:
+    """Tests method Config.get_ignore_case"""
+
+    @pytest.mark.parametrize('case_insensitive', [True, False])
+    def test_method_returns_value_whatever_the_case(self, case_insensitive):
+        config = Config(case_insensitive=case_insensitive, case_collision='ignore', DEBUG=True, workers=2)
+        config['Debug'] = False
+
+        assert config.get_ignore_case('debug') is False
+        assert 2 == config.get_ignore_case('WORKERS')
+        assert 'default' == config.get_ignore_case('unknown', 'default')
+
+    def test_index_is_maintained_by_mutators(self):
+        config = Config(case_insensitive=True, A=1, B=2, C=3, D=4)
+        config.update({'e': 5}, F=6)
+        config |= {'g': 7}
+        config.setdefault('h', 8)
+        del config['A']
+        config.pop('B')
+        config.pop('unknown', None)
+        config.popitem()
+
+        assert [None, None, 3, 4, 5, 6, 7, None] == [config.get_ignore_case(key) for key in 'abcdefgh']
+        config.clear()
+        assert config.get_ignore_case('c') is None
+
+    @pytest.mark.parametrize('case_insensitive', [True, False])
+    def test_method_returns_value_of_key_created_last_even_if_an_older_key_is_set_again(self, case_insensitive):
+        config = Config(case_insensitive=case_insensitive, case_collision='ignore')
+        config['A'] = 1
+        config['a'] = 2
+        config['A'] = 3
+
+        assert 2 == config.get_ignore_case('a')
+
+    @pytest.mark.parametrize('copy_config', [copy.copy, Config.copy])
+    def test_copies_have_their_own_index(self, copy_config):
+        config = Config(case_insensitive=True, Debug=True, workers=2)
+        config_copy = copy_config(config)
+        del config_copy['Debug']
+        config_copy['Port'] = 8000
+
+        assert isinstance(config_copy, Config)
+        assert {'workers': 2, 'Port': 8000} == config_copy
+        assert config.get_ignore_case('debug') is True
+        assert config.get_ignore_case('port') is None
+        assert config_copy.get_ignore_case('DEBUG', 'missing') == 'missing'
+        assert 8000 == config_copy.get_ignore_case('PORT')
+
+    def test_loaders_warn_about_keys_differing_by_case(self):
+        config = Config(case_insensitive=True, TITLE='env title')
+
+        with pytest.warns(UserWarning, match='keys "TITLE" and "title" only differ by case'):
+            config.load_from_yaml('dummy.yaml')
+        assert 'YAML Example' == config.get_ignore_case('Title')
+
+    def test_loaders_raise_error_with_error_policy(self):
+        config = Config(case_insensitive=True, case_collision='error', TITLE='env title')
+
+        with pytest.raises(CaseCollisionError):
+            config.load_from_yaml('dummy.yaml')
+        assert {'TITLE': 'env title'} == config
+
+    def test_ignore_policy_does_not_warn(self):
+        config = Config(case_insensitive=True, case_collision='ignore', TITLE='env title')
+
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            config.load_from_yaml('dummy.yaml')
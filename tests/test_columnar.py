@@ -0,0 +1,84 @@
+"""Tests columnar module"""
+import sys
+
+import pytest
+
+from configuror.columnar import Record, RecordTable
+
+
+@pytest.fixture()
+def records():
+    return [
+        {'host': 'alpha', 'port': 80, 'weight': 0.5, 'enabled': True, 'tags': ['a']},
+        {'host': 'beta', 'port': 8080, 'weight': 1.5, 'enabled': False, 'tags': []},
+        {'host': 'alpha', 'port': 443, 'weight': 2.0, 'enabled': True, 'tags': None},
+    ]
+
+
+@pytest.fixture()
+def table(records):
+    return RecordTable.from_records(records)
+
+
+class TestRecordTable:
+    """Tests class RecordTable"""
+
+    @pytest.mark.parametrize('records', [[], [{'a': 1}, 'foo'], [{'a': 1}, {'b': 1}], [{'a': 1}, {'a': 1, 'b': 2}]])
+    def test_should_raise_error_when_records_do_not_share_the_same_keys(self, records):
+        with pytest.raises(ValueError):
+            RecordTable.from_records(records)
+
+    def test_should_give_access_to_records_and_columns(self, table, records):
+        assert 3 == len(table)
+        assert ['host', 'port', 'weight', 'enabled', 'tags'] == table.fields
+        assert isinstance(table[0], Record)
+        assert records[1] == table[1] == dict(table[-2])
+        assert table[0]['enabled'] is True
+        assert ['alpha', 'beta', 'alpha'] == list(table.column('host'))
+        assert records == table
+        assert records == table.to_list()
+        assert records[1:] == table[1:]
+
+    def test_should_raise_error_when_index_is_out_of_range(self, table):
+        with pytest.raises(IndexError):
+            table[3]  # noqa: B018
+
+    def test_should_filter_records_on_values_and_predicates(self, table, records):
+        assert [records[0], records[2]] == table.filter(host='alpha')
+        assert [records[2]] == table.filter(host='alpha', port=lambda port: port > 100)
+        assert [records[1]] == table.filter(enabled=False)
+        assert [records[0]] == table.filter(tags=['a'], weight=0.5)
+        assert [] == table.filter(host='gamma')
+        assert table is table.filter()
+
+    def test_should_filter_and_slice_filtered_tables(self, table, records):
+        enabled = table.filter(enabled=True)
+
+        assert [records[0], records[2]] == enabled
+        assert [80, 443] == list(enabled.column('port'))
+        assert [records[2]] == enabled[1:] == enabled.filter(port=443)
+        assert records[2] == enabled[-1]
+
+    def test_should_filter_columns_with_many_distinct_strings(self):
+        records = [{'host': f'host-{i}', 'zone': f'zone-{i % 3}'} for i in range(1000)]
+        table = RecordTable.from_records(records)
+
+        assert records[1::3] == table.filter(zone='zone-1')
+        assert [records[999]] == table.filter(zone='zone-0', host='host-999')
+
+    def test_should_call_predicate_once_per_distinct_string(self, table, mocker):
+        predicate = mocker.Mock(return_value=True)
+        table.filter(host=predicate)
+
+        assert [mocker.call('alpha'), mocker.call('beta')] == predicate.call_args_list
+
+    def test_should_use_less_memory_than_a_list_of_dicts(self):
+        records = [{'host': f'host-{i % 100}', 'port': i, 'enabled': i % 2 == 0} for i in range(10_000)]
+        list_size = sys.getsizeof(records) + sum(sys.getsizeof(record) for record in records)
+
+        assert sys.getsizeof(RecordTable.from_records(records)) * 10 < list_size
+
+    def test_should_store_big_integers_as_they_are(self):
+        table = RecordTable.from_records([{'id': 2**70}, {'id': 1}])
+
+        assert [2**70, 1] == list(table.column('id'))
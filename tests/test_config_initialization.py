@@ -17,5 +17,16 @@ def test_config_calls_methods_for_adding_files(mocker):
     files = ['dummy.env', 'dummy_module.py']
     Config(mapping_files=mapping_files, files=files, ignore_file_absence=True)
 
-    add_mapping_files_mock.assert_called_once_with(mapping_files, True)
-    add_files_mock.assert_called_once_with(files, True)
+    add_mapping_files_mock.assert_called_once_with(mapping_files, True, None, None)
+    add_files_mock.assert_called_once_with(files, True, None, None)
+
+
+def test_config_only_loads_requested_keys_of_files():
+    config = Config(mapping_files={'toml': ['dummy.toml']}, files=['dummy.json', 'dummy_module.py'], keys=['title'])
+
+    assert {'title': 'JSON Example'} == config
+
+
+def test_config_raises_error_when_keys_is_a_string():
+    with pytest.raises(TypeError):
+        Config(files=['dummy.json'], keys='title')
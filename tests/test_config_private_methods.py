@@ -63,3 +63,24 @@ class TestFilterPaths:
             config._filter_paths([f'{path}', 2], ignore_file_absence=ignore_absence)
 
         assert '2 is not a string representing a path' == str(exc_info.value)
+
+
+class TestOpenFile:
+    """test method _open_file"""
+
+    def test_method_returns_opened_file_when_file_exists(self, config, tmp_path):
+        path = tmp_path / 'foo.txt'
+        path.write_text('hello')
+        with config._open_file(f'{path}') as f:
+            assert 'hello' == f.read()
+
+    @pytest.mark.parametrize('filename', ['foo.txt', '.'])
+    def test_method_returns_none_when_file_does_not_exist_and_ignore_flag_is_true(self, config, filename):
+        assert config._open_file(filename, ignore_file_absence=True) is None
+
+    @pytest.mark.parametrize('filename', ['foo.txt', '.'])
+    def test_method_raises_error_when_file_does_not_exist_and_ignore_flag_is_false(self, config, filename):
+        with pytest.raises(FileNotFoundError) as exc_info:
+            config._open_file(filename)
+
+        assert f'file {filename} not found on the filesystem' == str(exc_info.value)
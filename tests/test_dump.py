@@ -0,0 +1,148 @@
+"""Tests method Config.dump"""
+import json
+from datetime import date, datetime, timezone
+
+import pytest
+
+from configuror.exceptions import UnknownExtensionError
+from configuror.main import Config
+
+
+@pytest.fixture()
+def data():
+    return {'title': 'example', 'database': {'ports': [8001, 8002], 'enabled': True, 'ratio': 0.5}}
+
+
+@pytest.mark.parametrize(('extension', 'module'), [('msgpack', 'msgpack'), ('mpk', 'msgpack'), ('cbor', 'cbor2')])
+def test_method_writes_binary_files_which_can_be_loaded_again(tmp_path, data, extension, module):
+    pytest.importorskip(module)
+    path = tmp_path / f'config.{extension}'
+    Config(**data).dump(f'{path}')
+
+    assert data == Config(files=[f'{path}'])
+
+
+@pytest.mark.parametrize('file_type', ['msgpack', 'CBOR'])
+def test_method_uses_given_file_type(tmp_path, data, file_type):
+    pytest.importorskip('msgpack' if file_type == 'msgpack' else 'cbor2')
+    path = tmp_path / 'config.bin'
+    Config(**data).dump(f'{path}', file_type)
+
+    assert data == Config(mapping_files={file_type: [f'{path}']})
+
+
+def test_method_writes_date_and_time_objects_in_msgpack_format(tmp_path):
+    pytest.importorskip('msgpack')
+    path = tmp_path / 'config.msgpack'
+    aware = datetime(1979, 5, 27, 7, 32, tzinfo=timezone.utc)
+    Config(aware=aware, day=date(1979, 5, 27)).dump(f'{path}')
+
+    assert {'aware': aware, 'day': '1979-05-27'} == Config(files=[f'{path}'])
+
+
+def test_method_raises_error_when_file_type_cannot_be_guessed(config, tmp_path):
+    path = tmp_path / 'config.bin'
+    with pytest.raises(UnknownExtensionError) as exc_info:
+        config.dump(f'{path}')
+
+    assert f'unable to guess the file type of {path}, please provide the file_type argument' == str(exc_info.value)
+
+
+def test_method_raises_error_when_file_type_cannot_be_written(config, tmp_path):
+    with pytest.raises(UnknownExtensionError) as exc_info:
+        config.dump(f'{tmp_path / "config.py"}')
+
+    assert 'configuror cannot write python files' == str(exc_info.value)
+
+
+@pytest.mark.parametrize('extension', ['json', 'yaml', 'yml', 'toml'])
+def test_method_writes_text_files_which_can_be_loaded_again(tmp_path, data, extension):
+    path = tmp_path / f'config.{extension}'
+    Config(**data).dump(f'{path}')
+
+    assert data == Config(files=[f'{path}'])
+
+
+def test_method_writes_date_and_time_objects_as_strings_in_json_format(tmp_path):
+    path = tmp_path / 'config.json'
+    Config(day=date(1979, 5, 27)).dump(f'{path}')
+
+    assert {'day': '1979-05-27'} == Config(files=[f'{path}'])
+
+
+def test_method_writes_ini_files_which_can_be_loaded_again(tmp_path):
+    config = Config(files=['dummy.ini'])
+    path = tmp_path / 'config.ini'
+    config.dump(f'{path}')
+
+    assert config == Config(files=[f'{path}'])
+
+
+def test_method_escapes_percent_signs_in_ini_files(tmp_path):
+    path = tmp_path / 'config.ini'
+    Config(section={'ratio': '100%'}).dump(f'{path}')
+
+    assert {'ratio': '100%'} == Config(files=[f'{path}'])['section']
+
+
+def test_method_raises_error_when_writing_a_top_level_value_in_ini_format(tmp_path):
+    with pytest.raises(ValueError) as exc_info:
+        Config(foo='bar').dump(f'{tmp_path / "config.ini"}')
+
+    assert 'foo is not a section, only mappings can be written at the top level of ini files' == str(exc_info.value)
+
+
+@pytest.mark.usefixtures('clean_env')
+def test_method_writes_dotenv_files_which_can_be_loaded_again(tmp_path):
+    path = tmp_path / 'config.env'
+    Config(NAME='Kevin T', FOO='BAR', THOR=2).dump(f'{path}')
+    config = Config()
+    config.load_from_dotenv(f'{path}', export=False)
+
+    assert {'NAME': 'Kevin T', 'FOO': 'BAR', 'THOR': '2'} == config
+
+
+@pytest.mark.usefixtures('clean_env')
+@pytest.mark.parametrize('value', ['bar', 'Kevin T', 'trailing ', '2.5', 'True', '/usr/local/bin', 'ok!', '100%'])
+def test_method_writes_dotenv_values_which_are_loaded_unchanged(tmp_path, value):
+    path = tmp_path / 'config.env'
+    Config(FOO=value).dump(f'{path}')
+    config = Config()
+    config.load_from_dotenv(f'{path}', export=False)
+
+    assert {'FOO': value} == config
+
+
+@pytest.mark.parametrize('value', ['', 'a=b', 'https://foo.com/?a=1', 'x#y', ' x', '-1', 'a\nb', '"quoted"', '$HOME'])
+def test_method_raises_error_when_dotenv_value_cannot_be_loaded_unchanged(tmp_path, value):
+    with pytest.raises(ValueError) as exc_info:
+        Config(FOO=value).dumps('env')
+
+    assert f'FOO value {value!r} cannot be written in a dotenv file, it would not be read unchanged' == str(
+        exc_info.value
+    )
+
+
+def test_method_raises_error_when_writing_a_nested_value_in_dotenv_format(tmp_path):
+    with pytest.raises(ValueError) as exc_info:
+        Config(FOO={'a': 'b'}).dump(f'{tmp_path / "config.env"}')
+
+    assert 'FOO value cannot be written in a dotenv file, only scalar values are supported' == str(exc_info.value)
+
+
+class TestDumps:
+    """Tests method dumps"""
+
+    def test_method_returns_string_for_text_formats(self, data):
+        assert data == json.loads(Config(**data).dumps('JSON'))
+
+    def test_method_returns_bytes_for_binary_formats(self, data):
+        msgpack = pytest.importorskip('msgpack')
+
+        assert data == msgpack.unpackb(Config(**data).dumps('msgpack'))
+
+    def test_method_raises_error_when_file_type_cannot_be_written(self, config):
+        with pytest.raises(UnknownExtensionError) as exc_info:
+            config.dumps('python')
+
+        assert 'configuror cannot write python files' == str(exc_info.value)
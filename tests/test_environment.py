@@ -3,6 +3,8 @@ import os
 
 import pytest
 
+from configuror.utils import bool_converter
+
 
 class TestGetEnv:
     """Tests method getenv"""
@@ -58,3 +60,90 @@ class TestLoadFromDotEnv:
         assert 'RAGNAROK' == config['THOR'] == os.environ['THOR']
         assert 'Kevin T' == config['NAME'] == os.environ['NAME']
         assert '/home/Kevin T' == config['PERSONAL_DIR'] == os.environ['PERSONAL_DIR']
+
+    @pytest.mark.usefixtures('clean_env')
+    def test_method_does_not_touch_environment_when_export_flag_is_false(self, config):
+        return_value = config.load_from_dotenv('dummy.env', export=False)
+
+        assert return_value is True
+        assert '/home/Kevin T' == config['PERSONAL_DIR']
+        for key in ['FOO', 'THOR', 'IRON', 'NAME', 'PERSONAL_DIR']:
+            assert key not in os.environ
+
+    @pytest.mark.usefixtures('clean_env')
+    def test_method_expands_earlier_keys_before_environment_variables(self, monkeypatch, tmp_path, config):
+        monkeypatch.setenv('HOME', '/home/kevin')
+        monkeypatch.setenv('NAME', 'environment')
+        path = tmp_path / '.env'
+        path.write_text('\n'.join(['NAME=file', 'FOO=/${HOME}/$NAME/${UNKNOWN}']))
+        config.load_from_dotenv(f'{path}')
+
+        assert '//home/kevin/file/${UNKNOWN}' == config['FOO'] == os.environ['FOO']
+
+    @pytest.mark.usefixtures('clean_env')
+    def test_method_only_loads_and_exports_requested_keys(self, config):
+        return_value = config.load_from_dotenv('dummy.env', keys=['PERSONAL_DIR'])
+
+        assert return_value is True
+        assert {'PERSONAL_DIR': '/home/Kevin T'} == config
+        assert '/home/Kevin T' == os.environ['PERSONAL_DIR']
+        assert 'NAME' not in os.environ
+
+
+class TestLoadFromEnviron:
+    """Tests method load_from_environ"""
+
+    @pytest.fixture()
+    def app_environ(self, monkeypatch):
+        for name in [name for name in os.environ if name.startswith('APP')]:
+            monkeypatch.delenv(name)
+        monkeypatch.setenv('APP__DB__HOST', 'localhost')
+        monkeypatch.setenv('APP__DB__PORT', '5432')
+        monkeypatch.setenv('APP__DEBUG', 'no')
+        monkeypatch.setenv('APPLICATION', 'foo')
+
+    def test_method_returns_false_when_no_variable_matches(self, config):
+        assert config.load_from_environ('CONFIGUROR_UNKNOWN_PREFIX') is False
+        assert {} == config
+
+    @pytest.mark.usefixtures('app_environ')
+    @pytest.mark.parametrize('prefix', ['APP', 'APP_', 'APP__'])
+    def test_method_builds_nested_keys_from_variable_names(self, config, prefix):
+        assert config.load_from_environ(prefix) is True
+        assert {'db': {'host': 'localhost', 'port': '5432'}, 'debug': 'no'} == config
+
+    @pytest.mark.usefixtures('app_environ')
+    def test_method_keeps_case_when_lowercase_flag_is_false(self, config):
+        config.load_from_environ('APP_', lowercase=False)
+
+        assert {'DB': {'HOST': 'localhost', 'PORT': '5432'}, 'DEBUG': 'no'} == config
+
+    @pytest.mark.usefixtures('app_environ')
+    def test_method_applies_converters(self, config):
+        config.load_from_environ('APP_', converters={'APP__DB__PORT': int, 'APP__DEBUG': bool_converter})
+
+        assert 5432 == config['db']['port']
+        assert config['debug'] is False
+
+    @pytest.mark.usefixtures('app_environ')
+    def test_method_overlays_existing_values_without_modifying_shared_dicts(self, config):
+        database = {'host': 'db.local', 'name': 'app'}
+        config.update({'db': database, 'debug': {'level': 2}})
+        config.load_from_environ('APP_')
+
+        assert {'host': 'localhost', 'port': '5432', 'name': 'app'} == config['db']
+        assert 'no' == config['debug']
+        assert {'host': 'db.local', 'name': 'app'} == database
+
+    def test_method_requires_separator_after_prefix(self, monkeypatch, config):
+        monkeypatch.setenv('MYAPPLICATION', 'foo')
+        monkeypatch.setenv('MYAPP___NAME', 'bar')
+
+        assert config.load_from_environ('MYAPP') is True
+        assert {'_name': 'bar'} == config
+
+    def test_method_uses_given_separator(self, monkeypatch, config):
+        monkeypatch.setenv('MYAPP.CACHE.TTL', '60')
+
+        assert config.load_from_environ('MYAPP', separator='.') is True
+        assert {'cache': {'ttl': '60'}} == config
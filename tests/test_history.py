@@ -0,0 +1,156 @@
+"""Tests module history"""
+from types import MappingProxyType
+
+import pytest
+
+from configuror import Config, ConfigHistory
+from configuror.history import freeze, share
+from configuror.utils import deep_size
+
+
+@pytest.fixture()
+def settings():
+    return {
+        'database': {'host': 'localhost', 'pool': {'size': 5, 'timeout': 3}},
+        'hosts': [{'name': 'a', 'port': 1}, {'name': 'b', 'port': 2}],
+        'debug': False,
+    }
+
+
+def changed_settings():
+    return {
+        'database': {'host': 'localhost', 'pool': {'size': 10, 'timeout': 3}},
+        'hosts': [{'name': 'a', 'port': 1}, {'name': 'b', 'port': 2}],
+        'debug': False,
+    }
+
+
+class TestShare:
+    """Tests function share"""
+
+    def test_should_copy_containers_to_read_only_ones_when_there_is_no_previous_version(self, settings):
+        data = share(object(), settings)
+
+        assert settings['database'] == data['database']
+        assert ({'name': 'a', 'port': 1}, {'name': 'b', 'port': 2}) == data['hosts']
+        assert isinstance(data, MappingProxyType)
+        assert isinstance(data['database']['pool'], MappingProxyType)
+        assert isinstance(data['hosts'][0], MappingProxyType)
+
+    def test_should_reuse_unchanged_values_of_previous_version(self, settings):
+        old = share(object(), settings)
+        new = share(old, changed_settings())
+
+        assert changed_settings()['database'] == new['database']
+        assert new['hosts'] is old['hosts']
+        assert new['database'] is not old['database']
+        assert new['database']['host'] is old['database']['host']
+        assert 10 == new['database']['pool']['size']
+
+    def test_should_return_previous_version_when_nothing_changed(self, settings):
+        old = share(object(), settings)
+
+        assert share(old, Config(**settings)) is old
+
+    @pytest.mark.parametrize(
+        ('old', 'new', 'expected'),
+        [
+            (1, True, True),
+            ((1, 2), [1], (1,)),
+            (MappingProxyType({'a': 1}), {'a': 1, 'b': 2}, {'a': 1, 'b': 2}),
+            (MappingProxyType({'a': 1}), [1], (1,)),
+        ],
+    )
+    def test_should_not_reuse_values_of_different_types_or_sizes(self, old, new, expected):
+        result = share(old, new)
+
+        assert expected == result
+        assert result is not old
+
+    def test_freeze_returns_a_deeply_read_only_copy(self, settings):
+        data = freeze(settings)
+
+        with pytest.raises(TypeError):
+            data['database']['host'] = 'example.com'
+        with pytest.raises(AttributeError):
+            data['hosts'].append({})
+        assert 'localhost' == data['database']['host']
+
+
+class TestConfigHistory:
+    """Tests class ConfigHistory"""
+
+    def test_should_raise_error_when_max_versions_is_not_positive(self):
+        with pytest.raises(ValueError) as exc_info:
+            ConfigHistory(0)
+
+        assert 'max_versions must be greater than 0' == str(exc_info.value)
+
+    def test_should_record_read_only_versions(self, settings):
+        history = ConfigHistory()
+
+        assert history.current_version is None
+        assert 1 == history.record(Config(**settings))
+        assert 1 == history.current_version
+        assert settings['database'] == history.get(1)['database']
+        with pytest.raises(TypeError):
+            history.get(1)['debug'] = True
+
+    def test_shared_values_cannot_be_modified_through_a_version(self, settings):
+        history = ConfigHistory()
+        history.record(settings)
+        history.record(changed_settings())
+
+        with pytest.raises(TypeError):
+            history.get(2)['hosts'][0]['name'] = 'c'
+        with pytest.raises(TypeError):
+            history.get(2)['database']['host'] = 'example.com'
+        assert history.get(2)['hosts'] is history.get(1)['hosts']
+        assert 'a' == history.get(1)['hosts'][0]['name']
+
+    def test_versions_do_not_reference_recorded_config(self, settings):
+        history = ConfigHistory()
+        history.record(settings)
+        settings['database']['host'] = 'example.com'
+
+        assert 'localhost' == history.get(1)['database']['host']
+
+    def test_should_only_keep_max_versions(self, settings):
+        history = ConfigHistory(max_versions=2)
+        for _ in range(3):
+            history.record(settings)
+
+        assert [2, 3] == history.versions
+        with pytest.raises(KeyError):
+            history.get(1)
+
+    def test_memory_grows_with_changes_only(self, settings):
+        history = ConfigHistory()
+        settings['services'] = [{'name': f'service {index}', 'port': index} for index in range(1000)]
+        history.record(settings)
+        first_size = deep_size(history.get(1)).bytes
+        for size in range(9):
+            settings['database'] = {**settings['database'], 'pool': {'size': size, 'timeout': 3}}
+            history.record(settings)
+
+        seen = set()
+        total_size = sum(deep_size(dict(history.get(version)), seen).bytes for version in history.versions)
+        assert total_size < first_size * 1.1
+
+    def test_rollback_makes_version_current(self, settings):
+        history = ConfigHistory()
+        history.record(settings)
+        history.record(changed_settings())
+
+        assert 5 == history.rollback(1)['database']['pool']['size']
+        assert 1 == history.current_version
+        assert [1, 2] == history.versions
+        history.record(settings)
+        assert history.get(3)['database'] is history.get(1)['database']
+
+    def test_diff_returns_changes_between_versions(self, settings):
+        history = ConfigHistory()
+        history.record(settings)
+        history.record(changed_settings())
+
+        assert [('database', 'pool', 'size')] == history.diff(1, 2).changed
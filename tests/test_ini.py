@@ -0,0 +1,135 @@
+"""Tests module ini"""
+import configparser
+
+import pytest
+
+from configuror.ini import IniParser
+from configuror.utils import convert_ini_config_to_dict
+
+BASIC_CONTENT = """
+# comment
+[DEFAULT]
+home = /home/kevin
+log_level = INFO
+
+[paths]
+data = %(home)s/data
+escaped = 100%%
+Mixed Case = value
+empty =
+colon: separated = yes
+log_level = DEBUG
+
+[text]
+; another comment
+description = first line
+    second line
+
+    after an empty line
+nested = %(description)s!
+"""
+
+EXTENDED_CONTENT = """
+[DEFAULT]
+root = /srv
+
+[common]
+name = app
+home = ${root}/${name}
+price = $$10
+
+[server]
+log = ${common:home}/log
+level = ${DEFAULT:root}
+deep = ${log}/deep
+"""
+
+
+def config_parser_dict(content, interpolation=None, sections=None):
+    config = configparser.ConfigParser(interpolation=interpolation or configparser.BasicInterpolation())
+    config.read_string(content)
+    return convert_ini_config_to_dict(config, sections)
+
+
+def ini_parser_dict(content, interpolation='basic', sections=None):
+    parser = IniParser(interpolation)
+    parser.read_string(content)
+    return parser.to_dict(sections)
+
+
+class TestIniParser:
+    """Tests class IniParser"""
+
+    def test_should_parse_like_config_parser_with_basic_interpolation(self):
+        data = ini_parser_dict(BASIC_CONTENT)
+
+        assert data == config_parser_dict(BASIC_CONTENT)
+        assert list(data) == ['DEFAULT', 'paths', 'text']
+        assert data['text']['description'] == 'first line\nsecond line\n\nafter an empty line'
+        assert data['paths']['log_level'] == 'DEBUG'
+
+    def test_should_parse_like_config_parser_with_extended_interpolation(self):
+        data = ini_parser_dict(EXTENDED_CONTENT, 'extended')
+
+        assert data == config_parser_dict(EXTENDED_CONTENT, configparser.ExtendedInterpolation())
+        assert data['server']['deep'] == '/srv/app/log/deep'
+        assert data['common']['price'] == '$10'
+
+    @pytest.mark.parametrize(
+        ('interpolation', 'parser_interpolation'),
+        [
+            ('basic', configparser.BasicInterpolation()),
+            ('extended', configparser.ExtendedInterpolation()),
+        ],
+    )
+    def test_should_only_return_given_sections(self, interpolation, parser_interpolation):
+        content = BASIC_CONTENT if interpolation == 'basic' else EXTENDED_CONTENT
+        sections = frozenset(['paths', 'server', 'unknown'])
+
+        data = ini_parser_dict(content, interpolation, sections)
+
+        assert data == config_parser_dict(content, parser_interpolation, sections)
+        assert len(data) == 1
+
+    def test_should_merge_sections_of_several_files(self):
+        parser = IniParser()
+        parser.read_string('[a]\nx = 1\ny = 2\n', 'first.ini')
+        parser.read_string('[a]\ny = 3\n[b]\nz = %(y)s\n[DEFAULT]\ny = 4\n', 'second.ini')
+
+        assert parser.to_dict() == {'DEFAULT': {'y': '4'}, 'a': {'x': '1', 'y': '3'}, 'b': {'z': '4', 'y': '4'}}
+
+    @pytest.mark.parametrize(
+        ('content', 'error'),
+        [
+            ('x = 1\n', configparser.MissingSectionHeaderError),
+            ('[a]\n[a]\n', configparser.DuplicateSectionError),
+            ('[a]\nx = 1\nX = 2\n', configparser.DuplicateOptionError),
+            ('[a]\n= 1\n', configparser.ParsingError),
+            ('[a]\nx\n', configparser.ParsingError),
+        ],
+    )
+    def test_should_raise_config_parser_errors_when_content_is_malformed(self, content, error):
+        with pytest.raises(error):
+            config_parser_dict(content)
+        with pytest.raises(error):
+            ini_parser_dict(content)
+
+    @pytest.mark.parametrize(
+        ('content', 'interpolation', 'error'),
+        [
+            ('[a]\nx = %(y)s\n', 'basic', configparser.InterpolationMissingOptionError),
+            ('[a]\nx = 5%\n', 'basic', configparser.InterpolationSyntaxError),
+            ('[a]\nx = %(x)s\n', 'basic', configparser.InterpolationDepthError),
+            ('[a]\nx = ${b:y}\n', 'extended', configparser.InterpolationMissingOptionError),
+            ('[a]\nx = ${b:c:y}\n', 'extended', configparser.InterpolationSyntaxError),
+            ('[a]\nx = ${x}\n', 'extended', configparser.InterpolationDepthError),
+        ],
+    )
+    def test_should_raise_interpolation_errors_like_config_parser(self, content, interpolation, error):
+        parser_interpolation = (
+            configparser.ExtendedInterpolation() if interpolation == 'extended' else configparser.BasicInterpolation()
+        )
+        with pytest.raises(error):
+            config_parser_dict(content, parser_interpolation)
+        with pytest.raises(error):
+            ini_parser_dict(content, interpolation)
@@ -0,0 +1,116 @@
+"""Tests method Config.interpolate and module interpolation"""
+import pytest
+
+from configuror.exceptions import InterpolationError
+from configuror.interpolation import Interpolator
+
+
+def test_method_resolves_references_between_values(config):
+    config.update(
+        {
+            'paths': {'home': '/home/kevin', 'projects': '${paths.home}/projects'},
+            'project_dir': '${paths.projects}/configuror',
+            'servers': [{'ip': '10.0.0.1'}, {'ip': '10.0.0.2'}],
+            'main_server': 'http://${servers.1.ip}:${port}',
+            'port': 8000,
+        }
+    )
+    config.interpolate()
+
+    assert '/home/kevin/projects' == config['paths']['projects']
+    assert '/home/kevin/projects/configuror' == config['project_dir']
+    assert 'http://10.0.0.2:8000' == config['main_server']
+
+
+def test_method_keeps_type_of_values_made_of_a_single_reference(config):
+    config.update(
+        {
+            'database': {'port': 5432, 'options': {'ssl': True}},
+            'port': '${database.port}',
+            'opts': '${ database.options }',
+        }
+    )
+    config.interpolate()
+
+    assert 5432 == config['port']
+    assert {'ssl': True} == config['opts']
+
+
+def test_method_resolves_keys_containing_dots(config):
+    config.load_from_ini('dummy.ini')
+    config['alpha_ip'] = '${servers.alpha.ip}'
+    config.interpolate()
+
+    assert '10.0.0.1' == config['alpha_ip']
+
+
+def test_method_resolves_environment_variables(config, monkeypatch):
+    monkeypatch.setenv('CONFIGUROR_HOME', '/home/kevin')
+    config['home'] = '${ENV:CONFIGUROR_HOME}/app'
+    config.interpolate()
+
+    assert '/home/kevin/app' == config['home']
+
+
+def test_method_keeps_escaped_dollar_signs(config):
+    config.update({'price': '$$5 for $${item}', 'item': 'a'})
+    config.interpolate()
+
+    assert '$5 for ${item}' == config['price']
+
+
+def test_method_does_not_modify_nested_dicts_of_the_original_configuration(config):
+    section = {'a': 'foo', 'b': '${section.a}'}
+    config['section'] = section
+    config.interpolate()
+
+    assert {'a': 'foo', 'b': 'foo'} == config['section']
+    assert '${section.a}' == section['b']
+
+
+@pytest.mark.parametrize(
+    ('data', 'message'),
+    [
+        ({'a': '${b}'}, 'reference ${b} cannot be resolved'),
+        ({'a': '${b.c}', 'b': 2}, 'reference ${b.c} cannot be resolved'),
+        ({'a': '${b.4}', 'b': [1]}, 'reference ${b.4} cannot be resolved'),
+        (
+            {'a': '${ENV:CONFIGUROR_UNKNOWN}'},
+            'environment variable CONFIGUROR_UNKNOWN referenced by ${ENV:CONFIGUROR_UNKNOWN} is not defined',
+        ),
+    ],
+)
+def test_method_raises_error_when_a_reference_cannot_be_resolved(config, data, message):
+    config.update(data)
+    with pytest.raises(InterpolationError) as exc_info:
+        config.interpolate()
+
+    assert message == str(exc_info.value)
+
+
+@pytest.mark.parametrize(
+    ('data', 'message'),
+    [
+        ({'a': '${b}', 'b': '${c}', 'c': 'x${a}'}, 'circular reference detected: a -> b -> c -> a'),
+        ({'a': {'b': '${a}'}}, 'circular reference detected: a -> a.b -> a'),
+    ],
+)
+def test_method_raises_error_when_references_are_circular(config, data, message):
+    config.update(data)
+    with pytest.raises(InterpolationError) as exc_info:
+        config.interpolate()
+
+    assert message == str(exc_info.value)
+
+
+def test_each_reference_is_resolved_once(mocker):
+    data = {'base': '/srv', 'a': '${base}/a', **{f'key_{index}': '${a}/${a}' for index in range(100)}}
+    interpolator = Interpolator(data)
+    find_spy = mocker.spy(interpolator, '_find')
+    resolve_string_spy = mocker.spy(interpolator, '_resolve_string')
+    result = interpolator.resolve((), data)
+
+    assert '/srv/a//srv/a' == result['key_99']
+    # one resolution per value containing a reference
+    assert 102 == resolve_string_spy.call_count
+    assert 2 == find_spy.call_count
@@ -0,0 +1,166 @@
+"""Tests resource limits of loaders"""
+import itertools
+import json
+
+import pytest
+
+from configuror import Config, Limits
+from configuror.exceptions import ResourceLimitError
+from configuror.limits import LimitedYamlLoader, check_depth, load_yaml_with_limits
+
+BILLION_LAUGHS = """\
+a: &a [lol, lol, lol, lol, lol, lol, lol, lol, lol, lol]
+b: &b [*a, *a, *a, *a, *a, *a, *a, *a, *a, *a]
+c: &c [*b, *b, *b, *b, *b, *b, *b, *b, *b, *b]
+d: &d [*c, *c, *c, *c, *c, *c, *c, *c, *c, *c]
+e: &e [*d, *d, *d, *d, *d, *d, *d, *d, *d, *d]
+"""
+
+
+class TestLoadYamlWithLimits:
+    """Tests function load_yaml_with_limits"""
+
+    def test_should_return_document_when_limits_are_not_exceeded(self):
+        content = 'a: &a {b: [1, 2]}\nc: *a\n'
+
+        assert {'a': {'b': [1, 2]}, 'c': {'b': [1, 2]}} == load_yaml_with_limits(content, Limits(max_depth=3))
+
+    def test_should_count_alias_expansions_in_max_nodes(self):
+        # the document has about 60 nodes but expands to more than 100 000 values
+        with pytest.raises(ResourceLimitError) as exc_info:
+            load_yaml_with_limits(BILLION_LAUGHS, Limits(max_nodes=10_000))
+
+        assert '<unicode string> exceeds the max_nodes limit of 10000' == str(exc_info.value)
+
+    @pytest.mark.parametrize(('max_depth', 'exceeded'), [(3, False), (2, True)])
+    def test_should_raise_error_when_document_is_too_deep(self, max_depth, exceeded):
+        content = 'a: {b: [1]}'
+
+        if exceeded:
+            with pytest.raises(ResourceLimitError):
+                load_yaml_with_limits(content, Limits(max_depth=max_depth))
+        else:
+            assert {'a': {'b': [1]}} == load_yaml_with_limits(content, Limits(max_depth=max_depth))
+
+    def test_should_raise_error_when_parsing_takes_too_long(self, mocker):
+        # each call to the clock moves 5 seconds forward
+        mocker.patch('configuror.limits.time.monotonic', side_effect=itertools.count(step=5))
+
+        with pytest.raises(ResourceLimitError) as exc_info:
+            load_yaml_with_limits('a: [1, 2, 3]', Limits(max_seconds=1))
+
+        assert '<unicode string> exceeds the max_seconds limit of 1' == str(exc_info.value)
+
+    def test_should_only_build_requested_keys_and_count_anchored_values_of_skipped_ones(self):
+        content = 'a: &a [1, 2, 3]\nb: [4, 5, 6, 7, 8, 9]\nc: *a\n'
+
+        assert {'c': [1, 2, 3]} == load_yaml_with_limits(content, Limits(max_nodes=12), frozenset(['c']))
+        with pytest.raises(ResourceLimitError):
+            load_yaml_with_limits(content, Limits(max_nodes=11), frozenset(['c']))
+
+    def test_loader_has_no_limits_by_default(self):
+        loader = LimitedYamlLoader(BILLION_LAUGHS)
+        try:
+            assert 5 == len(loader.get_single_data())
+        finally:
+            loader.dispose()
+
+
+class TestCheckDepth:
+    """Tests function check_depth"""
+
+    @pytest.mark.parametrize(('max_depth', 'exceeded'), [(3, False), (2, True)])
+    def test_should_raise_error_when_data_is_too_deep(self, max_depth, exceeded):
+        data = {'a': {'b': [1]}, 'c': 2}
+
+        if exceeded:
+            with pytest.raises(ResourceLimitError) as exc_info:
+                check_depth(data, 'data.json', Limits(max_depth=max_depth))
+            assert 'data.json exceeds the max_depth limit of 2' == str(exc_info.value)
+        else:
+            check_depth(data, 'data.json', Limits(max_depth=max_depth))
+
+    def test_should_not_check_anything_without_max_depth(self):
+        check_depth({'a': {'b': {}}}, 'data.json', Limits(max_bytes=1))
+
+
+class TestLoadersLimits:
+    """Tests limits parameter of Config loaders"""
+
+    @pytest.mark.parametrize(
+        ('method', 'filename'),
+        [
+            ('load_from_json', 'dummy.json'),
+            ('load_from_yaml', 'dummy.yaml'),
+            ('load_from_toml', 'dummy.toml'),
+            ('load_from_ini', 'dummy.ini'),
+            ('load_from_dotenv', 'dummy.env'),
+            ('load_from_python_file', 'dummy_module.py'),
+        ],
+    )
+    def test_method_raises_error_when_file_is_too_big(self, config, method, filename):
+        with pytest.raises(ResourceLimitError) as exc_info:
+            getattr(config, method)(filename, limits=Limits(max_bytes=50))
+
+        assert f'{filename} exceeds the max_bytes limit of 50' == str(exc_info.value)
+        assert {} == config
+
+    @pytest.mark.parametrize(
+        ('method', 'filename'),
+        [
+            ('load_from_json', 'dummy.json'),
+            ('load_from_yaml', 'dummy.yaml'),
+            ('load_from_dotenv', 'dummy.env'),
+        ],
+    )
+    def test_method_closes_file_when_it_is_too_big(self, mocker, config, method, filename):
+        open_file = mocker.spy(Config, '_open_file')
+
+        with pytest.raises(ResourceLimitError):
+            getattr(config, method)(filename, limits=Limits(max_bytes=50))
+
+        assert open_file.spy_return.closed
+
+    def test_json_method_raises_error_when_file_is_too_deep(self, config, tmp_path):
+        path = tmp_path / 'deep.json'
+        path.write_text(json.dumps({'a': {'b': {'c': 1}}}))
+
+        with pytest.raises(ResourceLimitError) as exc_info:
+            config.load_from_json(f'{path}', limits=Limits(max_depth=2))
+
+        assert f'{path} exceeds the max_depth limit of 2' == str(exc_info.value)
+
+    def test_json_method_raises_error_when_file_is_too_deep_to_be_parsed(self, config, tmp_path):
+        path = tmp_path / 'deep.json'
+        path.write_text('[' * 100_000 + ']' * 100_000)
+
+        with pytest.raises(ResourceLimitError) as exc_info:
+            config.load_from_json(f'{path}')
+
+        assert f'{path} is too deeply nested to be parsed' == str(exc_info.value)
+
+    def test_method_loads_yaml_file_within_limits(self, config):
+        assert config.load_from_yaml('dummy.yaml', limits=Limits(max_bytes=10_000, max_depth=4, max_nodes=100))
+        assert 'YAML Example' == config['title']
+
+    def test_method_raises_error_when_yaml_file_expands_too_much(self, config, tmp_path):
+        path = tmp_path / 'laughs.yaml'
+        path.write_text(BILLION_LAUGHS)
+
+        with pytest.raises(ResourceLimitError) as exc_info:
+            config.load_from_yaml(f'{path}', limits=Limits(max_nodes=10_000))
+
+        assert f'{path} exceeds the max_nodes limit of 10000' == str(exc_info.value)
+
+    def test_config_forwards_limits_to_loaders(self, tmp_path):
+        path = tmp_path / 'config.json'
+        path.write_text(json.dumps({'values': list(range(100))}))
+
+        with pytest.raises(ResourceLimitError):
+            Config(files=[f'{path}'], limits=Limits(max_bytes=100))
+        assert list(range(100)) == Config(files=[f'{path}'], limits=Limits(max_bytes=1000))['values']
+
+    def test_config_forwards_limits_to_python_files(self):
+        with pytest.raises(ResourceLimitError):
+            Config(files=['dummy_module.py'], limits=Limits(max_bytes=10))
+        assert Config(files=['dummy_module.py'], limits=Limits(max_bytes=100_000))
@@ -0,0 +1,45 @@
+"""Tests method Config.load_from_cbor"""
+import pytest
+
+from configuror.exceptions import DecodeError
+
+cbor2 = pytest.importorskip('cbor2')
+
+
+def test_method_return_false_when_file_is_unknown_and_ignore_flag_is_true(config):
+    assert config.load_from_cbor('foo.cbor', ignore_file_absence=True) is False
+
+
+def test_method_raises_error_when_file_is_unknown_and_ignore_flag_is_false(config):
+    with pytest.raises(FileNotFoundError):
+        config.load_from_cbor('foo.cbor')
+
+
+def test_method_updates_config_when_passing_valid_(config, tmp_path):
+    data = {'title': 'cbor example', 'database': {'ports': [8001, 8002], 'enabled': True}, 4: 'foo'}
+    path = tmp_path / 'config.cbor'
+    path.write_bytes(cbor2.dumps(data))
+    return_value = config.load_from_cbor(f'{path}')
+
+    assert return_value is True
+    assert data == config
+
+
+@pytest.mark.parametrize('data', [2, 'hello', [1, 'foo']])
+def test_method_returns_false_when_loaded_data_is_not_a_dict(config, tmp_path, data):
+    path = tmp_path / 'config.cbor'
+    path.write_bytes(cbor2.dumps(data))
+
+    assert config.load_from_cbor(f'{path}') is False
+    assert {} == config
+
+
+@pytest.mark.parametrize('content', [b'', b'\xc1'])
+def test_method_raises_error_when_file_content_is_not_valid(config, tmp_path, content):
+    path = tmp_path / 'config.cbor'
+    path.write_bytes(content)
+
+    with pytest.raises(DecodeError) as exc_info:
+        config.load_from_cbor(f'{path}')
+
+    assert f'{path} is not well cbor formatted' == str(exc_info.value)
@@ -0,0 +1,101 @@
+"""Tests method Config.load_from_directory"""
+import os
+
+import pytest
+
+
+@pytest.fixture()
+def conf_dir(tmp_path):
+    directory = tmp_path / 'conf.d'
+    directory.mkdir()
+    (directory / '20-database.yaml').write_text('database:\n  host: db.local\nname: second')
+    (directory / '10-base.json').write_text('{"name": "first", "debug": true}')
+    (directory / '30-override.toml').write_text('debug = false')
+    (directory / 'README.md').write_text('# not a configuration file')
+    (directory / 'nested.d').mkdir()
+    return directory
+
+
+def touch_later(path, content):
+    """Writes content and makes sure the modification time changes even on filesystems with coarse timestamps."""
+    stat = path.stat()
+    path.write_text(content)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_method_returns_false_when_directory_is_unknown_and_ignore_flag_is_true(config, tmp_path):
+    assert config.load_from_directory(f'{tmp_path / "unknown"}', ignore_directory_absence=True) is False
+
+
+@pytest.mark.parametrize('name', ['unknown', 'file.txt'])
+def test_method_raises_error_when_directory_is_unknown_and_ignore_flag_is_false(config, tmp_path, name):
+    (tmp_path / 'file.txt').touch()
+    directory = f'{tmp_path / name}'
+    with pytest.raises(FileNotFoundError) as exc_info:
+        config.load_from_directory(directory)
+
+    assert f'directory {directory} not found on the filesystem' == str(exc_info.value)
+
+
+@pytest.mark.parametrize('directory', [2, 2.5, ['a']])
+def test_method_raises_error_when_directory_is_not_a_string(config, directory):
+    with pytest.raises(TypeError) as exc_info:
+        config.load_from_directory(directory)
+
+    assert f'{directory} is not a string representing a directory' == str(exc_info.value)
+
+
+def test_method_returns_false_when_no_file_matches(config, conf_dir):
+    assert config.load_from_directory(f'{conf_dir}', pattern='*.ini') is False
+    assert {} == config
+
+
+def test_method_loads_supported_files_in_sorted_order(config, conf_dir):
+    return_value = config.load_from_directory(f'{conf_dir}')
+
+    assert return_value is True
+    assert {'name': 'second', 'debug': False, 'database': {'host': 'db.local'}} == config
+
+
+def test_method_only_loads_files_matching_pattern(config, conf_dir):
+    config.load_from_directory(f'{conf_dir}', pattern='[12]0-*')
+
+    assert {'name': 'second', 'debug': True, 'database': {'host': 'db.local'}} == config
+
+
+def test_method_only_parses_changed_files_on_reload(config, conf_dir, mocker):
+    config.load_from_directory(f'{conf_dir}')
+    touch_later(conf_dir / '10-base.json', '{"name": "first", "debug": true, "workers": 4}')
+    load_from_json_spy = mocker.spy(config.__class__, 'load_from_json')
+    load_from_yaml_spy = mocker.spy(config.__class__, 'load_from_yaml')
+    config.load_from_directory(f'{conf_dir}')
+
+    assert 1 == load_from_json_spy.call_count
+    load_from_yaml_spy.assert_not_called()
+    assert 4 == config['workers']
+
+
+def test_modifying_config_does_not_change_cached_values(config, conf_dir):
+    config.load_from_directory(f'{conf_dir}')
+    config['database']['host'] = 'mutated'
+    config.load_from_directory(f'{conf_dir}')
+
+    assert {'host': 'db.local'} == config['database']
+
+
+def test_method_reuses_directory_listing_until_directory_changes(config, conf_dir, mocker):
+    config.load_from_directory(f'{conf_dir}')
+    scandir_spy = mocker.spy(os, 'scandir')
+    config.load_from_directory(f'{conf_dir}')
+
+    scandir_spy.assert_not_called()
+
+    (conf_dir / '40-new.json').write_text('{"new": 1}')
+    directory_stat = conf_dir.stat()
+    os.utime(conf_dir, ns=(directory_stat.st_atime_ns, directory_stat.st_mtime_ns + 1_000_000_000))
+    (conf_dir / '10-base.json').unlink()
+    config.load_from_directory(f'{conf_dir}')
+
+    scandir_spy.assert_called_once()
+    assert 1 == config['new']
+    assert f'{conf_dir / "10-base.json"}' not in config._fragments
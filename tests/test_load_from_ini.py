@@ -1,4 +1,6 @@
 """Tests method load_from_ini"""
+import os
+
 import pytest
 
 from configuror.exceptions import DecodeError
@@ -35,31 +37,32 @@ def test_method_raises_error_when_a_file_in_the_list_is_unknown_and_ignore_flag_
     assert f'file {unknown_file} not found on the filesystem' == str(exc_info.value)
 
 
-def test_config_has_a_default_entry_when_none_of_the_files_are_valid_and_ignore_flag_is_true(config):
-    config.load_from_ini(['foo.txt', 'bar.txt'], ignore_file_absence=True)
+def test_method_returns_false_when_none_of_the_files_are_valid_and_ignore_flag_is_true(config):
+    assert config.load_from_ini(['foo.txt', 'bar.txt'], ignore_file_absence=True) is False
+    assert {} == config
+
+
+def test_config_has_a_default_entry_when_the_list_is_empty(config):
+    config.load_from_ini([])
 
     assert 1 == len(config)
     assert {} == config['DEFAULT']
 
 
-# this test avoids to check all cases already tested with method _filter_paths
-@pytest.mark.parametrize('filenames', ['foo.txt', ['foo.txt']])
-def test_method_calls_correctly_private_method_filter_paths(tmp_path, config, mocker, filenames):
-    filter_path_mock = mocker.patch('configuror.main.Config._filter_paths')
-    expected_filenames = []
-    if isinstance(filenames, str):
-        p = tmp_path / filenames
-        p.touch()
-        expected_filenames = [f'{p}']
-    else:
-        for filename in filenames:
-            p = tmp_path / filename
-            p.touch()
-            expected_filenames.append(f'{p}')
+def test_method_opens_files_without_checking_their_existence_first(config, mocker):
+    isfile_spy = mocker.spy(os.path, 'isfile')
 
-    config.load_from_ini(expected_filenames)
+    assert config.load_from_ini(['dummy.ini', 'dummy.ini'])
+    assert config.load_from_ini('dummy.ini')
+    isfile_spy.assert_not_called()
+
+
+@pytest.mark.parametrize('filename', [2, 2.5, None])
+def test_method_raises_error_when_a_file_of_the_list_is_not_a_string(config, filename):
+    with pytest.raises(TypeError) as exc_info:
+        config.load_from_ini(['dummy.ini', filename])
 
-    filter_path_mock.assert_called_once_with(expected_filenames, False)
+    assert f'{filename} is not a string representing a path' == str(exc_info.value)
 
 
 @pytest.mark.parametrize('interpolation_method', [2, 2.5, ['a', 'b']])
@@ -131,6 +134,16 @@ def test_method_updates_config_when_passing_list_of_ini_files_with_extended_inte
     assert '/System/Library/Frameworks/' == config['Frameworks']['path']
 
 
+def test_method_only_loads_requested_sections_which_can_reference_skipped_ones(tmp_path, config):
+    test_content_lines = ['[Paths]', 'system_dir: /System', '[Frameworks]', 'path: ${Paths:system_dir}/Frameworks/']
+    path = tmp_path / 'test.ini'
+    path.write_text('\n'.join(test_content_lines))
+    return_value = config.load_from_ini(f'{path}', interpolation_method='extended', keys=['Frameworks'])
+
+    assert return_value is True
+    assert {'Frameworks': {'path': '/System/Frameworks/'}} == config
+
+
 def test_method_raises_error_when_a_single_file_is_not_ini_formatted(config):
     with pytest.raises(DecodeError) as exc_info:
         config.load_from_ini('dummy.yaml')
@@ -33,3 +33,29 @@ def test_method_raises_error_when_file_content_is_not_valid(config, tempdir, fil
         config.load_from_json(f'{path}')
 
     assert f'{path} is not well json formatted' == str(exc_info.value)
+
+
+def test_method_deduplicates_strings_when_intern_strings_flag_is_true(config):
+    return_value = config.load_from_json('dummy.json', intern_strings=True)
+
+    assert return_value is True
+    assert config['servers']['alpha']['dc'] is config['servers']['beta']['dc']
+    assert config.interned_bytes > 0
+
+
+def test_method_only_loads_requested_keys(config):
+    return_value = config.load_from_json('dummy.json', keys=['title', 'servers'])
+
+    assert return_value is True
+    assert {'title', 'servers'} == set(config)
+    assert 'eqdc10' == config['servers']['beta']['dc']
+
+
+def test_method_raises_error_when_a_skipped_value_is_not_valid(config, tempdir):
+    path = Path(tempdir) / 'foo.json'
+    path.write_text('{"title": "foo", "servers": {"alpha": [1, 2}')
+
+    with pytest.raises(DecodeError) as exc_info:
+        config.load_from_json(f'{path}', keys=['title'])
+
+    assert f'{path} is not well json formatted' == str(exc_info.value)
@@ -0,0 +1,105 @@
+"""Tests method Config.load_from_stream"""
+import io
+import os
+
+import pytest
+
+from configuror.exceptions import DecodeError, UnknownExtensionError
+from configuror.main import Config
+
+
+@pytest.mark.parametrize('file_type', ['json', 'yaml', 'toml'])
+def test_method_updates_config_when_passing_a_valid_file_object(config, file_type):
+    with open(f'dummy.{file_type}') as f:
+        return_value = config.load_from_stream(f, file_type)
+
+    assert return_value is True
+    for item in ['title', 'owner', 'database', 'servers', 'clients']:
+        assert item in config
+
+
+def test_method_accepts_binary_streams(config):
+    return_value = config.load_from_stream(io.BytesIO(b'{"foo": "bar"}'), 'JSON')
+
+    assert return_value is True
+    assert {'foo': 'bar'} == config
+
+
+@pytest.mark.parametrize(('file_type', 'module'), [('msgpack', 'msgpack'), ('cbor', 'cbor2')])
+def test_method_updates_config_when_passing_binary_content(config, file_type, module):
+    pytest.importorskip(module)
+    data = {'title': f'{file_type} example', 'database': {'ports': [8001, 8002], 'enabled': True}}
+    content = Config(**data).dumps(file_type)
+    return_value = config.load_from_stream(io.BytesIO(content), file_type)
+
+    assert return_value is True
+    assert data == config
+
+
+@pytest.mark.parametrize(('file_type', 'module'), [('msgpack', 'msgpack'), ('cbor', 'cbor2')])
+def test_method_raises_error_when_binary_content_is_not_valid(config, file_type, module):
+    pytest.importorskip(module)
+    with pytest.raises(DecodeError) as exc_info:
+        config.load_from_stream(io.BytesIO(b'\xc1\xff'), file_type)
+
+    assert f'the stream is not well {file_type} formatted' == str(exc_info.value)
+
+
+def test_method_raises_error_when_binary_content_is_read_from_a_text_stream(config):
+    with pytest.raises(TypeError) as exc_info:
+        config.load_from_stream(io.StringIO('foo'), 'msgpack')
+
+    assert 'msgpack content must be read from a binary stream' == str(exc_info.value)
+
+
+def test_method_updates_config_when_passing_ini_content(config):
+    return_value = config.load_from_stream(io.StringIO('[section]\nfoo = bar\nchar = %(foo)s'), 'ini')
+
+    assert return_value is True
+    assert {'foo': 'bar', 'char': 'bar'} == config['section']
+
+
+@pytest.mark.usefixtures('clean_env')
+def test_method_updates_config_and_environment_when_passing_dotenv_content(config):
+    return_value = config.load_from_stream(io.StringIO('FOO=bar\nexport THOR=/${FOO}'), 'env')
+
+    assert return_value is True
+    assert '/bar' == config['THOR'] == os.environ['THOR']
+
+
+@pytest.mark.usefixtures('clean_env')
+def test_method_does_not_touch_environment_when_export_flag_is_false(config):
+    return_value = config.load_from_stream(io.StringIO('FOO=bar'), 'env', export=False)
+
+    assert return_value is True
+    assert 'bar' == config['FOO']
+    assert 'FOO' not in os.environ
+
+
+@pytest.mark.parametrize('content', ['[1, 2]', '2'])
+def test_method_returns_false_when_content_is_not_a_mapping(config, content):
+    assert config.load_from_stream(io.StringIO(content), 'json') is False
+    assert {} == config
+
+
+@pytest.mark.parametrize(
+    ('content', 'file_type'), [('hello', 'json'), ('[section', 'toml'), ('foo = bar', 'ini'), ('foo =', 'env')]
+)
+def test_method_raises_error_when_content_is_not_valid(config, content, file_type):
+    with pytest.raises(DecodeError):
+        config.load_from_stream(io.StringIO(content), file_type)
+
+
+@pytest.mark.parametrize('file_type', ['python', 'bat'])
+def test_method_raises_error_when_file_type_is_not_supported(config, file_type):
+    with pytest.raises(UnknownExtensionError) as exc_info:
+        config.load_from_stream(io.StringIO(''), file_type)
+
+    assert f'{file_type} content cannot be loaded from a stream' == str(exc_info.value)
+
+
+def test_method_raises_error_when_file_type_is_not_a_string(config):
+    with pytest.raises(TypeError) as exc_info:
+        config.load_from_stream(io.StringIO(''), 2)
+
+    assert 'file_type must be a string' == str(exc_info.value)
@@ -1,4 +1,5 @@
 """Tests method load_from_toml"""
+import os
 from pathlib import Path
 
 import pytest
@@ -29,9 +30,14 @@ def test_method_raises_error_when_a_file_in_the_list_is_unknown_and_ignore_flag_
     assert f'file {unknown_file} not found on the filesystem' == str(exc_info.value)
 
 
-def test_method_raises_error_when_none_of_the_files_are_valid_and_ignore_flag_is_true(config):
+def test_method_returns_false_when_none_of_the_files_are_valid_and_ignore_flag_is_true(config):
+    assert config.load_from_toml(['foo.txt', 'bar.txt'], ignore_file_absence=True) is False
+    assert {} == config
+
+
+def test_method_raises_error_when_the_list_is_empty(config):
     with pytest.raises(FileNotFoundError) as exc_info:
-        config.load_from_toml(['foo.txt', 'bar.txt'], ignore_file_absence=True)
+        config.load_from_toml([])
 
     assert 'the list does not contain one toml valid file' == str(exc_info.value)
 
@@ -44,24 +50,20 @@ def test_method_raises_error_when_filenames_does_not_have_the_correct_type(confi
     assert 'filenames must represent a path or list of paths' == str(exc_info.value)
 
 
-# this test avoids to check all cases already tested with method _filter_paths
-@pytest.mark.parametrize('filenames', ['foo.txt', ['foo.txt']])
-def test_method_calls_correctly_private_method_filter_paths(config, tempdir, mocker, filenames):
-    filter_path_mock = mocker.patch('configuror.main.Config._filter_paths')
-    expected_filenames = []
-    if isinstance(filenames, str):
-        p = Path(tempdir) / filenames
-        p.touch()
-        expected_filenames = [f'{p}']
-    else:
-        for filename in filenames:
-            p = Path(tempdir) / filename
-            p.touch()
-            expected_filenames.append(f'{p}')
-    with pytest.raises(TypeError):  # we don't want to worry about toml parsing error
-        config.load_from_toml(expected_filenames)
+def test_method_opens_files_without_checking_their_existence_first(config, mocker):
+    isfile_spy = mocker.spy(os.path, 'isfile')
 
-    filter_path_mock.assert_called_once_with(expected_filenames, False)
+    assert config.load_from_toml(['dummy.toml', 'dummy.toml'])
+    assert config.load_from_toml('dummy.toml')
+    isfile_spy.assert_not_called()
+
+
+@pytest.mark.parametrize('filename', [2, 2.5, None])
+def test_method_raises_error_when_a_file_of_the_list_is_not_a_string(config, filename):
+    with pytest.raises(TypeError) as exc_info:
+        config.load_from_toml(['dummy.toml', filename])
+
+    assert f'{filename} is not a string representing a path' == str(exc_info.value)
 
 
 def test_method_updates_config_when_passing_valid_toml_file(config):
@@ -86,6 +88,13 @@ def test_method_updates_config_when_passing_list_of_toml_files(config, tempdir):
     assert 2 == config['foo']
 
 
+def test_method_only_loads_requested_keys(config):
+    return_value = config.load_from_toml('dummy.toml', keys=['title', 'unknown'])
+
+    assert return_value is True
+    assert {'title': 'TOML Example'} == config
+
+
 def test_method_raises_error_when_a_single_file_is_not_toml_formatted(config):
     with pytest.raises(DecodeError) as exc_info:
         config.load_from_toml('dummy.yaml')
@@ -98,3 +107,11 @@ def test_method_raises_error_when_a_file_in_the_list_is_not_when_toml_formatted(
         config.load_from_toml(['dummy.toml', 'dummy.yaml'])
 
     assert 'one of your files is not well toml formatted' == str(exc_info.value)
+
+
+def test_method_deduplicates_strings_when_intern_strings_flag_is_true(config):
+    return_value = config.load_from_toml('dummy.toml', intern_strings=True)
+
+    assert return_value is True
+    assert config['servers']['alpha']['dc'] is config['servers']['beta']['dc']
+    assert config.interned_bytes > 0
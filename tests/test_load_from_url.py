@@ -0,0 +1,124 @@
+"""Tests method Config.load_from_url and class HttpFetcher"""
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from configuror.exceptions import FetchError, UnknownExtensionError
+from configuror.main import Config
+from configuror.sources import HttpFetcher
+
+
+@pytest.fixture()
+def fetcher():
+    with HttpFetcher(timeout=5) as http_fetcher:
+        yield http_fetcher
+
+
+class TestHttpFetcher:
+    """Tests class HttpFetcher"""
+
+    def test_fetch_returns_body_and_content_type(self, stub_server, fetcher):
+        stub_server.documents['/app.json'] = (b'{"foo": "bar"}', 'application/json; charset=utf-8')
+
+        assert (b'{"foo": "bar"}', 'application/json') == fetcher.fetch(f'{stub_server.url}/app.json')
+
+    def test_fetch_sends_etag_and_reuses_cached_body_when_document_is_unchanged(self, stub_server, fetcher):
+        stub_server.documents['/app.json'] = (b'{"foo": "bar"}', 'application/json')
+        url = f'{stub_server.url}/app.json'
+        first = fetcher.fetch(url)
+        second = fetcher.fetch(url)
+
+        assert first == second
+        assert stub_server.requests[0][1] is None
+        assert stub_server.requests[1][1] is not None
+
+    def test_fetch_downloads_document_again_when_it_changed(self, stub_server, fetcher):
+        url = f'{stub_server.url}/app.json'
+        stub_server.documents['/app.json'] = (b'{"foo": "bar"}', 'application/json')
+        fetcher.fetch(url)
+        stub_server.documents['/app.json'] = (b'{"foo": "baz"}', 'application/json')
+
+        assert b'{"foo": "baz"}' == fetcher.fetch(url)[0]
+
+    def test_fetch_reuses_the_same_connection(self, stub_server, fetcher):
+        stub_server.documents['/a.json'] = (b'{}', 'application/json')
+        stub_server.documents['/b.json'] = (b'{}', 'application/json')
+        fetcher.fetch(f'{stub_server.url}/a.json')
+        fetcher.fetch(f'{stub_server.url}/b.json')
+
+        client_addresses = {client_address for *_, client_address in stub_server.requests}
+        assert 1 == len(client_addresses)
+
+    def test_fetches_of_different_threads_run_concurrently(self, stub_server, fetcher):
+        # both requests must reach the server at the same time to pass the barrier
+        stub_server.barrier = threading.Barrier(2, timeout=2)
+        stub_server.documents['/a.json'] = (b'{"a": 1}', 'application/json')
+        stub_server.documents['/b.json'] = (b'{"b": 2}', 'application/json')
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [executor.submit(fetcher.fetch, f'{stub_server.url}/{name}.json') for name in 'ab']
+            bodies = [future.result() for future in futures]
+
+        assert [(b'{"a": 1}', 'application/json'), (b'{"b": 2}', 'application/json')] == bodies
+        assert 2 == len(fetcher._idle_connections[('http', stub_server.url[7:])])
+
+    def test_fetch_raises_error_when_server_does_not_return_document(self, stub_server, fetcher):
+        url = f'{stub_server.url}/unknown.json'
+        with pytest.raises(FetchError) as exc_info:
+            fetcher.fetch(url)
+
+        assert f'unable to fetch {url}, server responded with status 404' == str(exc_info.value)
+
+    @pytest.mark.parametrize('url', ['ftp://foo.com/app.json', '/tmp/app.json'])
+    def test_fetch_raises_error_when_url_scheme_is_not_supported(self, fetcher, url):
+        with pytest.raises(ValueError) as exc_info:
+            fetcher.fetch(url)
+
+        assert f'{url} is not an http or https url' == str(exc_info.value)
+
+
+class TestLoadFromUrl:
+    """Tests method Config.load_from_url"""
+
+    def test_method_guesses_file_type_from_url_extension(self, stub_server, fetcher, config):
+        stub_server.documents['/app.yml'] = (b'foo: bar', 'application/octet-stream')
+        return_value = config.load_from_url(f'{stub_server.url}/app.yml', fetcher=fetcher)
+
+        assert return_value is True
+        assert {'foo': 'bar'} == config
+
+    def test_method_guesses_file_type_from_content_type(self, stub_server, fetcher, config):
+        stub_server.documents['/config'] = (b'foo = "bar"', 'application/toml')
+        config.load_from_url(f'{stub_server.url}/config', fetcher=fetcher)
+
+        assert {'foo': 'bar'} == config
+
+    def test_method_loads_binary_content(self, stub_server, fetcher, config):
+        pytest.importorskip('msgpack')
+        stub_server.documents['/config'] = (Config(foo='bar').dumps('msgpack'), 'application/msgpack')
+        config.load_from_url(f'{stub_server.url}/config', fetcher=fetcher)
+
+        assert {'foo': 'bar'} == config
+
+    def test_method_uses_given_file_type(self, stub_server, fetcher, config):
+        stub_server.documents['/config'] = (b'{"foo": "bar"}', 'text/plain')
+        config.load_from_url(f'{stub_server.url}/config', 'json', fetcher=fetcher)
+
+        assert {'foo': 'bar'} == config
+
+    @pytest.mark.usefixtures('clean_env')
+    def test_method_does_not_touch_environment_when_export_flag_is_false(self, stub_server, fetcher, config):
+        stub_server.documents['/app.env'] = (b'FOO=bar', 'text/plain')
+        config.load_from_url(f'{stub_server.url}/app.env', fetcher=fetcher, export=False)
+
+        assert {'FOO': 'bar'} == config
+        assert 'FOO' not in os.environ
+
+    def test_method_raises_error_when_file_type_cannot_be_guessed(self, stub_server, fetcher, config):
+        url = f'{stub_server.url}/config'
+        stub_server.documents['/config'] = (b'{"foo": "bar"}', 'text/plain')
+        with pytest.raises(UnknownExtensionError) as exc_info:
+            config.load_from_url(url, fetcher=fetcher)
+
+        assert f'unable to guess the file type of {url}, please provide the file_type argument' == str(exc_info.value)
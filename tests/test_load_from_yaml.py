@@ -45,3 +45,47 @@ def test_method_raises_error_when_file_content_is_not_valid(config, tempdir, fil
         config.load_from_yaml(f'{path}')
 
     assert f'{path} is not well yaml formatted' == str(exc_info.value)
+
+
+def test_method_deduplicates_strings_when_intern_strings_flag_is_true(config):
+    return_value = config.load_from_yaml('dummy.yaml', intern_strings=True)
+
+    assert return_value is True
+    assert config['servers']['alpha']['dc'] is config['servers']['beta']['dc']
+    assert config.interned_bytes > 0
+
+
+def test_method_keeps_aliased_values_shared_when_intern_strings_flag_is_true(config, tmp_path):
+    path = tmp_path / 'aliases.yaml'
+    path.write_text('base: &b {host: localhost}\nA: *b\nB: *b\nloop: &x [1, *x]\n')
+    return_value = config.load_from_yaml(f'{path}', intern_strings=True)
+
+    assert return_value is True
+    assert config['A'] is config['B'] is config['base']
+    assert config['loop'][1] is config['loop']
+
+
+def test_method_only_loads_requested_keys(config):
+    return_value = config.load_from_yaml('dummy.yaml', keys=['title', 'servers'])
+
+    assert return_value is True
+    assert {'title', 'servers'} == set(config)
+    assert 'eqdc10' == config['servers']['beta']['dc']
+
+
+def test_method_resolves_aliases_and_merge_keys_of_skipped_values_when_loading_requested_keys(config, tempdir):
+    path = Path(tempdir) / 'foo.yaml'
+    content = """\
+defaults: &defaults
+  timeout: 3
+  retries: [1, 2]
+<<: {name: app}
+catalog: [{id: 1}, {id: 2}]
+service:
+  <<: *defaults
+  port: 80
+"""
+    path.write_text(content)
+
+    assert config.load_from_yaml(f'{path}', keys=['service', 'name'])
+    assert {'service': {'timeout': 3, 'retries': [1, 2], 'port': 80}, 'name': 'app'} == config
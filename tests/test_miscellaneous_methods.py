@@ -1,10 +1,15 @@
 """Test all config methods which doesn't fit in other test modules"""
+import copy
 import os
+import pickle
+import sys
 
 import pytest
 
+from configuror.columnar import RecordTable
 from configuror.exceptions import UnknownExtensionError
-from configuror.main import AVAILABLE_EXTENSIONS
+from configuror.main import AVAILABLE_EXTENSIONS, Config
+from configuror.utils import deep_size
 
 
 @pytest.fixture()
@@ -87,16 +92,24 @@ class TestLoadFromMappingFiles:
         except UnknownExtensionError:
             pytest.fail(f'Unexpected fail with extension {extension}')
 
-    # I deliberately avoided testing ini and toml methods because they call internally path_files
-    def test_method_calls_filter_paths_intern_method(self, config, mocker):
-        mapping_files = {'env': [], 'python': ['dummy.python'], 'yaml': []}
+    def test_method_does_not_check_existence_of_files_of_builtin_loaders(self, config, mocker):
+        mapping_files = {'env': ['dummy.env'], 'python': ['dummy.python'], 'ini': ['dummy.ini'], 'toml': []}
         filter_paths_mock = mocker.patch('configuror.main.Config._filter_paths')
-        filter_paths_mock.return_value = []
         config.load_from_mapping_files(mapping_files, ignore_file_absence=True)
 
-        assert 3 == len(filter_paths_mock.mock_calls)
-        filter_paths_mock.assert_any_call(['dummy.python'], True)
-        filter_paths_mock.assert_any_call([], True)
+        filter_paths_mock.assert_not_called()
+
+    def test_method_opens_files_of_multiple_files_loaders_once(self, config, mocker):
+        isfile_spy = mocker.spy(os.path, 'isfile')
+        open_spy = mocker.spy(Config, '_open_file')
+        return_value = config.load_from_mapping_files(
+            {'ini': ['dummy.ini', 'foo.ini'], 'toml': ['dummy.toml']}, ignore_file_absence=True
+        )
+
+        assert return_value is True
+        assert 0 == isfile_spy.call_count
+        assert ['dummy.ini', 'foo.ini', 'dummy.toml'] == [call.args[0] for call in open_spy.call_args_list]
+        assert not config.load_from_mapping_files({'ini': ['foo.ini'], 'toml': ['foo.toml']}, ignore_file_absence=True)
 
     def test_method_calls_different_loading_methods(self, config, mocker):
         mapping_files = {
@@ -116,12 +129,12 @@ class TestLoadFromMappingFiles:
 
         config.load_from_mapping_files(mapping_files)
 
-        load_from_json_mock.assert_called_once_with('dummy.json')
-        load_from_toml_mock.assert_called_once_with(['dummy.toml'])
-        load_from_ini_mock.assert_called_once_with(['dummy.ini'])
-        load_from_yaml_mock.assert_called_once_with('dummy.yaml')
-        load_from_python_mock.assert_called_once_with('dummy_module.py')
-        load_from_dotenv_mock.assert_called_once_with('dummy.env')
+        load_from_json_mock.assert_called_once_with('dummy.json', ignore_file_absence=False)
+        load_from_toml_mock.assert_called_once_with(['dummy.toml'], ignore_file_absence=False)
+        load_from_ini_mock.assert_called_once_with(['dummy.ini'], ignore_file_absence=False)
+        load_from_yaml_mock.assert_called_once_with('dummy.yaml', ignore_file_absence=False)
+        load_from_python_mock.assert_called_once_with('dummy_module.py', ignore_file_absence=False)
+        load_from_dotenv_mock.assert_called_once_with('dummy.env', ignore_file_absence=False)
 
     @pytest.mark.usefixtures('clean_env')
     def test_method_updates_correctly_config(self, config):
@@ -152,12 +165,24 @@ class TestLoadFromFiles:
 
         assert f'{filenames} is not a list of files' == str(exc_info.value)
 
-    # this is to avoid to repeating all checks done by _filter_paths
-    def test_method_calls_filter_paths_intern_method(self, config, mocker):
-        filter_paths_mock = mocker.patch('configuror.main.Config._filter_paths')
-        config.load_from_files([])
+    def test_method_opens_files_without_checking_their_existence_first(self, config, mocker):
+        isfile_spy = mocker.spy(os.path, 'isfile')
+
+        assert config.load_from_files(['dummy.json', 'dummy.ini', 'dummy.toml', 'dummy.yaml'])
+        isfile_spy.assert_not_called()
 
-        filter_paths_mock.assert_called_once_with([], False)
+    @pytest.mark.parametrize('filename', [2, None])
+    def test_method_raises_error_when_a_file_is_not_a_string(self, config, filename):
+        with pytest.raises(TypeError) as exc_info:
+            config.load_from_files(['dummy.json', filename])
+
+        assert f'{filename} is not a string representing a path' == str(exc_info.value)
+
+    def test_method_raises_error_when_a_file_does_not_exist(self, config):
+        with pytest.raises(FileNotFoundError) as exc_info:
+            config.load_from_files(['foo.json'])
+
+        assert 'file foo.json not found on the filesystem' == str(exc_info.value)
 
     @pytest.mark.parametrize('filenames', [[], ['foo.txt']])
     def test_method_returns_false_when_file_list_is_empty(self, config, filenames):
@@ -185,12 +210,12 @@ class TestLoadFromFiles:
 
         config.load_from_files(files)
 
-        load_from_json_mock.assert_called_once_with('dummy.json')
-        load_from_toml_mock.assert_called_once_with('dummy.toml')
-        load_from_ini_mock.assert_called_once_with('dummy.ini')
-        load_from_yaml_mock.assert_called_once_with('dummy.yaml')
-        load_from_python_mock.assert_called_once_with('dummy_module.py')
-        load_from_dotenv_mock.assert_called_once_with('dummy.env')
+        load_from_json_mock.assert_called_once_with('dummy.json', ignore_file_absence=False)
+        load_from_toml_mock.assert_called_once_with('dummy.toml', ignore_file_absence=False)
+        load_from_ini_mock.assert_called_once_with('dummy.ini', ignore_file_absence=False)
+        load_from_yaml_mock.assert_called_once_with('dummy.yaml', ignore_file_absence=False)
+        load_from_python_mock.assert_called_once_with('dummy_module.py', ignore_file_absence=False)
+        load_from_dotenv_mock.assert_called_once_with('dummy.env', ignore_file_absence=False)
 
     @pytest.mark.usefixtures('clean_env')
     def test_method_updates_correctly_config(self, config):
@@ -201,3 +226,149 @@ class TestLoadFromFiles:
         assert 'foo' == config['A']
         assert '/home/Kevin T' == config['PERSONAL_DIR'] == os.environ['PERSONAL_DIR']
         assert 'TOML Example' == config['title']
+
+
+class TestDiff:
+    """Tests method diff"""
+
+    def test_method_returns_empty_change_set_when_configurations_are_equal(self, config):
+        config.update({'database': {'host': 'localhost', 'port': 5432}, 'debug': True})
+        change_set = config.diff({'database': {'host': 'localhost', 'port': 5432}, 'debug': True})
+
+        assert not change_set
+        assert ([], [], []) == change_set
+
+    def test_method_returns_added_removed_and_changed_nested_paths(self, config):
+        config.update({'database': {'host': 'localhost', 'pool': {'size': 5}}, 'debug': True, 'workers': 2})
+        new = {'database': {'host': 'db.local', 'pool': {'size': 5, 'timeout': 3}}, 'workers': 2, 'name': 'app'}
+        change_set = config.diff(new)
+
+        assert change_set
+        assert [('database', 'pool', 'timeout'), ('name',)] == change_set.added
+        assert [('debug',)] == change_set.removed
+        assert [('database', 'host')] == change_set.changed
+
+    def test_method_reports_a_change_when_value_type_changes(self, config):
+        config['database'] = {'host': 'localhost'}
+
+        assert [('database',)] == config.diff({'database': 'sqlite://'}).changed
+
+    def test_method_does_not_compare_values_which_are_the_same_object(self, config, mocker):
+        section = mocker.MagicMock()
+        config['section'] = section
+        config.diff({'section': section})
+
+        section.__eq__.assert_not_called()
+        section.__ne__.assert_not_called()
+
+
+class TestMemoryReport:
+    """Tests method memory_report"""
+
+    def test_method_returns_size_of_each_key_and_counts_of_containers_and_strings(self, config):
+        config.update({'name': 'app', 'database': {'hosts': ['a', 'b']}})
+        report = config.memory_report()
+
+        assert ['name', 'database'] == list(report['keys'])
+        assert sys.getsizeof('name') + sys.getsizeof('app') == report['keys']['name']
+        assert report['keys']['database'] > sys.getsizeof({})
+        assert sys.getsizeof(config) + sum(report['keys'].values()) == report['total_bytes']
+        # the config, the database dict and the hosts list
+        assert 3 == report['containers']
+        assert 6 == report['strings']
+
+    def test_method_counts_shared_objects_once_and_supports_cycles(self, config):
+        hosts = ['a', 'b']
+        config['primary'] = {'hosts': hosts}
+        config['replica'] = {'hosts': hosts}
+        config['loop'] = loop = []
+        loop.append(loop)
+        report = config.memory_report()
+
+        # the 'hosts' key is also the same interned string in both dicts
+        assert report['keys']['primary'] - report['keys']['replica'] == deep_size(hosts).bytes + sys.getsizeof('hosts')
+        assert sys.getsizeof(loop) + sys.getsizeof('loop') == report['keys']['loop']
+
+    def test_method_groups_sizes_by_source(self, config, tmp_path):
+        json_file = tmp_path / 'settings.json'
+        json_file.write_text('{"name": "app", "workers": 2}')
+        config.load_from_json(f'{json_file}')
+        config.load_from_object('tests.dummy_module')
+        config['manual'] = 'value'
+        report = config.memory_report()
+
+        keys = report['keys']
+        assert keys['name'] + keys['workers'] == report['sources'][f'{json_file}']
+        assert keys['manual'] == report['sources'][None]
+        assert sum(keys.values()) == sum(report['sources'].values())
+        assert 3 == len(report['sources'])
+
+    def test_method_reports_keys_modified_after_loading_under_none(self, config, tmp_path):
+        json_file = tmp_path / 'settings.json'
+        json_file.write_text('{"name": "app", "workers": 2, "debug": true, "port": 80}')
+        config.load_from_json(f'{json_file}')
+        config['name'] = 'x' * 1000
+        config.update(workers=4)
+        del config['debug']
+        config.pop('port')
+        config['debug'] = False
+        report = config.memory_report()
+
+        assert {None: report['total_bytes'] - sys.getsizeof(config)} == report['sources']
+
+    @pytest.mark.parametrize('copy_config', [copy.copy, copy.deepcopy, lambda item: pickle.loads(pickle.dumps(item))])
+    def test_copies_keep_the_sources_of_the_keys(self, config, copy_config):
+        config.load_from_json('dummy.json')
+        config['manual'] = 'value'
+
+        assert {'dummy.json', None} == copy_config(config).memory_report()['sources'].keys()
+
+    def test_method_reports_keys_under_the_file_which_set_them_last(self, config, tmp_path):
+        for name, content in [('a.toml', 'a = 1\nb = 2'), ('b.toml', 'b = 3\nc = 4')]:
+            (tmp_path / name).write_text(content)
+        for name, content in [('a.ini', '[s]\nx = 1\n[t]\ny = 1'), ('b.ini', '[t]\nz = 2')]:
+            (tmp_path / name).write_text(content)
+        config.load_from_toml([f'{tmp_path / "a.toml"}', f'{tmp_path / "b.toml"}'])
+        config.load_from_ini([f'{tmp_path / "a.ini"}', f'{tmp_path / "b.ini"}'])
+        report = config.memory_report()
+
+        keys, sources = report['keys'], report['sources']
+        assert keys['a'] == sources[f'{tmp_path / "a.toml"}']
+        assert keys['b'] + keys['c'] == sources[f'{tmp_path / "b.toml"}']
+        assert keys['s'] == sources[f'{tmp_path / "a.ini"}']
+        assert keys['t'] + keys['DEFAULT'] == sources[f'{tmp_path / "b.ini"}']
+
+
+class TestColumnarize:
+    """Tests method columnarize"""
+
+    def test_method_converts_long_lists_of_records_found_in_nested_dicts(self, config):
+        routes = [{'path': f'/{i}', 'port': i} for i in range(5)]
+        config.update({'gateway': {'routes': routes, 'ports': [1, 2, 3, 4, 5]}, 'rules': routes[:2], 'name': 'app'})
+
+        assert [('gateway', 'routes')] == config.columnarize(min_records=5)
+        assert isinstance(config['gateway']['routes'], RecordTable)
+        assert routes == config['gateway']['routes']
+        assert [1, 2, 3, 4, 5] == config['gateway']['ports']
+        assert isinstance(config['rules'], list)
+
+    def test_method_converts_given_paths_whatever_their_length(self, config):
+        config.update({'gateway': {'routes': [{'path': '/'}]}, 'rules': [{'limit': 10}]})
+
+        assert [('gateway', 'routes'), ('rules',)] == config.columnarize('gateway.routes', 'rules')
+        assert isinstance(config['gateway']['routes'], RecordTable)
+        assert isinstance(config['rules'], RecordTable)
+
+    def test_method_raises_error_when_given_path_is_not_a_list_of_records(self, config):
+        config['rules'] = [{'limit': 10}, {'burst': 2}]
+
+        with pytest.raises(ValueError):
+            config.columnarize('rules')
+
+    @pytest.mark.parametrize('file_type', ['json', 'yaml'])
+    def test_converted_lists_are_dumped_as_lists_of_dicts(self, config, file_type):
+        config['rules'] = [{'limit': 10, 'name': 'a'}, {'limit': 20, 'name': 'b'}]
+        expected = config.dumps(file_type)
+        config.columnarize('rules')
+
+        assert expected == config.dumps(file_type)
@@ -0,0 +1,96 @@
+"""Tests objects generated from configuration mappings"""
+import sys
+
+import pytest
+
+from configuror import Config, ConfigSection
+from configuror.objects import attribute_name, section_class, to_object
+
+
+class TestAttributeName:
+    """Tests function attribute_name"""
+
+    @pytest.mark.parametrize(
+        ('key', 'name'),
+        [
+            ('port', 'port'),
+            ('max-size', 'max_size'),
+            ('a.b', 'a_b'),
+            ('2fa', '_2fa'),
+            ('class', 'class_'),
+            (1, '_1'),
+            ('_x', '_x'),
+            ('__x', '_x'),
+            ('__dict__', '_dict__'),
+            ('--', '_'),
+        ],
+    )
+    def test_should_return_valid_attribute_name(self, key, name):
+        assert name == attribute_name(key)
+
+
+class TestToObject:
+    """Tests function to_object"""
+
+    def test_should_convert_nested_dicts_and_dicts_in_lists(self):
+        section = to_object({'database': {'port': 5432}, 'hosts': [{'name': 'a'}, 'b'], 'debug': True})
+
+        assert 5432 == section.database.port
+        assert 'a' == section.hosts[0].name
+        assert 'b' == section.hosts[1]
+        assert section.debug is True
+
+    def test_should_share_classes_between_dicts_having_the_same_keys(self):
+        first = to_object({'a': {'host': 'x', 'port': 1}, 'b': {'host': 'y', 'port': 2}})
+        second = to_object({'a': {'host': 'z', 'port': 3}, 'b': {'host': 'w', 'port': 4}})
+
+        assert type(first.a) is type(first.b) is type(second.a) is section_class(('host', 'port'))
+        assert type(first) is type(second)
+
+    def test_objects_have_slots_and_no_dict(self):
+        section = to_object({'host': 'x', 'port': 1})
+
+        assert isinstance(section, ConfigSection)
+        assert ('host', 'port') == type(section).__slots__
+        assert not hasattr(section, '__dict__')
+        assert sys.getsizeof(section) < sys.getsizeof({'host': 'x', 'port': 1})
+
+    def test_objects_can_be_iterated_compared_and_printed(self):
+        section = to_object({'host': 'x', 'port': 1})
+
+        assert {'host': 'x', 'port': 1} == dict(section)
+        assert section == to_object({'host': 'x', 'port': 1})
+        assert section != to_object({'host': 'x', 'port': 2})
+        assert section != to_object({'port': 1, 'host': 'x'})
+        assert "ConfigSection(host='x', port=1)" == repr(section)
+
+    def test_should_convert_keys_starting_with_two_underscores(self):
+        section = to_object({'__x': 1, '__dict__': 2, '__iter__': 3, '__slots__': 4})
+
+        assert (1, 2, 3, 4) == (section._x, section._dict__, section._iter__, section._slots__)
+        assert [('_x', 1), ('_dict__', 2), ('_iter__', 3), ('_slots__', 4)] == list(section)
+
+    def test_should_raise_error_when_keys_give_the_same_attribute_name(self):
+        with pytest.raises(ValueError) as exc_info:
+            to_object({'max-size': 1, 'max_size': 2})
+
+        assert "keys ['max-size', 'max_size'] cannot be converted to distinct attribute names" == str(exc_info.value)
+
+
+class TestAsObject:
+    """Tests method Config.as_object"""
+
+    def test_method_returns_object_with_sections_as_attributes(self, config):
+        config.load_from_yaml('dummy.yaml')
+        settings = config.as_object()
+
+        assert 'YAML Example' == settings.title
+        assert config['owner']['name'] == settings.owner.name
+
+    def test_reloaded_configurations_reuse_generated_classes(self):
+        first = Config(mapping_files={'yaml': ['dummy.yaml']}).as_object()
+        second = Config(mapping_files={'yaml': ['dummy.yaml']}).as_object()
+
+        assert type(first) is type(second)
+        assert type(first.owner) is type(second.owner)
+        assert first == second
@@ -0,0 +1,74 @@
+"""Tests function register_loader"""
+import pytest
+
+from configuror.main import AVAILABLE_EXTENSIONS, EXTENSION_TYPES, EXTENSIONS, LOADERS, register_loader
+
+
+@pytest.fixture()
+def properties_loader():
+    """Registers a loader for java-like properties files and removes it after the test."""
+    saved = dict(LOADERS), dict(EXTENSIONS), dict(EXTENSION_TYPES), list(AVAILABLE_EXTENSIONS)
+
+    @register_loader('Properties', ['properties', 'props'])
+    def load_properties(config, filename):
+        with open(filename) as f:
+            for line in f:
+                key, value = line.strip().split('=', 1)
+                config[key] = value
+        return True
+
+    yield load_properties
+
+    for registry, backup in zip((LOADERS, EXTENSIONS, EXTENSION_TYPES), saved):
+        registry.clear()
+        registry.update(backup)
+    AVAILABLE_EXTENSIONS[:] = saved[3]
+
+
+@pytest.fixture()
+def properties_file(tmp_path):
+    path = tmp_path / 'app.properties'
+    path.write_text('db.host=localhost\ndb.port=5432')
+    return f'{path}'
+
+
+def test_builtin_loaders_are_registered():
+    assert set(EXTENSIONS) == set(LOADERS)
+    assert 'yaml' == EXTENSION_TYPES['yml']
+    assert LOADERS['toml'].multiple_files is True
+    assert LOADERS['json'].multiple_files is False
+    assert LOADERS['json'].checks_existence is True
+
+
+def test_decorator_returns_the_decorated_function_and_updates_extensions(properties_loader):
+    assert callable(properties_loader)
+    assert ['properties', 'props'] == EXTENSIONS['properties']
+    assert 'properties' == EXTENSION_TYPES['props']
+    assert 'props' in AVAILABLE_EXTENSIONS
+
+
+@pytest.mark.usefixtures('properties_loader')
+def test_load_from_files_uses_registered_loader(config, properties_file):
+    assert config.load_from_files(['dummy.json', properties_file]) is True
+    assert 'localhost' == config['db.host']
+    assert 'JSON Example' == config['title']
+
+
+@pytest.mark.usefixtures('properties_loader')
+def test_load_from_mapping_files_uses_registered_loader(config, properties_file):
+    assert config.load_from_mapping_files({'PROPERTIES': [properties_file]}) is True
+    assert '5432' == config['db.port']
+
+
+@pytest.mark.usefixtures('properties_loader')
+def test_load_from_directory_uses_registered_loader(config, properties_file, tmp_path):
+    assert config.load_from_directory(f'{tmp_path}') is True
+    assert 'localhost' == config['db.host']
+
+
+def test_loaders_of_multiple_files_receive_the_whole_list(config, mocker):
+    load_mock = mocker.Mock(return_value=True)
+    mocker.patch.dict(LOADERS, {'toml': LOADERS['toml']._replace(load=load_mock)})
+    config.load_from_mapping_files({'toml': ['dummy.toml', 'dummy.toml']})
+
+    load_mock.assert_called_once_with(config, ['dummy.toml', 'dummy.toml'], ignore_file_absence=False)
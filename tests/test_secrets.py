@@ -0,0 +1,143 @@
+"""Tests secret references resolution"""
+import itertools
+import threading
+
+import pytest
+
+from configuror import Config, FileSecretProvider, SecretError, SecretProvider, SecretResolver
+
+
+class FakeProvider(SecretProvider):
+    """Provider recording its calls"""
+
+    def __init__(self, secrets, event=None):
+        self.secrets = secrets
+        self.calls = []
+        self.event = event
+
+    def fetch(self, names):
+        self.calls.append(names)
+        if self.event is not None:
+            self.event.wait(5)
+        return {name: self.secrets[name] for name in names if name in self.secrets}
+
+
+@pytest.fixture()
+def provider():
+    return FakeProvider({'db': 'db secret', 'api': 'api secret'})
+
+
+@pytest.fixture()
+def resolver(provider):
+    return SecretResolver({'vault': provider}, ttl=60)
+
+
+class TestSecretProvider:
+    """Tests class SecretProvider"""
+
+    def test_should_raise_error_when_instantiating_provider_without_fetch(self):
+        class IncompleteProvider(SecretProvider):
+            pass
+
+        with pytest.raises(TypeError):
+            IncompleteProvider()
+
+
+class TestSecretResolver:
+    """Tests class SecretResolver"""
+
+    def test_should_fetch_all_references_in_one_batch(self, resolver, provider):
+        data = {
+            'database': {'password': 'vault:db', 'host': 'localhost'},
+            'services': [{'token': 'vault:api'}, {'token': 'vault:db'}],
+            'url': 'http://example.com',
+        }
+        services = data['services']
+        database = data['database']
+
+        assert ['vault:db', 'vault:api'] == resolver.resolve(data)
+        assert [['db', 'api']] == provider.calls
+        assert {'password': 'db secret', 'host': 'localhost'} == data['database']
+        assert [{'token': 'api secret'}, {'token': 'db secret'}] == data['services']
+        assert 'http://example.com' == data['url']
+        # containers holding references are copied
+        assert {'password': 'vault:db', 'host': 'localhost'} == database
+        assert [{'token': 'vault:api'}, {'token': 'vault:db'}] == services
+
+    def test_should_leave_containers_without_references_untouched(self, resolver):
+        hosts = ['a', 'b']
+        data = {'hosts': hosts, 'password': 'vault:db'}
+        resolver.resolve(data)
+
+        assert data['hosts'] is hosts
+
+    def test_should_cache_secrets_until_ttl_expires(self, resolver, provider, mocker):
+        mocker.patch('configuror.secrets.time.monotonic', side_effect=itertools.count(step=40))
+
+        assert {'vault:db': 'db secret'} == resolver.resolve_references(['vault:db'])
+        assert {'vault:db': 'db secret'} == resolver.resolve_references(['vault:db'])
+        assert [['db']] == provider.calls
+        # 120 seconds after the first fetch
+        resolver.resolve_references(['vault:db'])
+        assert [['db'], ['db']] == provider.calls
+
+    def test_should_call_providers_of_each_scheme(self, provider, tmp_path):
+        path = tmp_path / 'password'
+        path.write_text('file secret\n')
+        resolver = SecretResolver({'vault': provider, 'file': FileSecretProvider()})
+
+        assert {'vault:api': 'api secret', f'file:{path}': 'file secret'} == resolver.resolve_references(
+            ['vault:api', f'file:{path}']
+        )
+
+    def test_should_raise_error_when_secret_is_not_found(self, resolver):
+        with pytest.raises(SecretError) as exc_info:
+            resolver.resolve({'password': 'vault:unknown'})
+
+        assert 'secret vault:unknown cannot be resolved' == str(exc_info.value)
+
+    def test_should_raise_provider_errors_and_fetch_again_on_next_call(self, resolver, provider, mocker):
+        mocker.patch.object(provider, 'fetch', side_effect=[ConnectionError('unreachable'), {'db': 'db secret'}])
+
+        with pytest.raises(ConnectionError):
+            resolver.resolve_references(['vault:db'])
+        assert {'vault:db': 'db secret'} == resolver.resolve_references(['vault:db'])
+
+    def test_concurrent_resolutions_share_a_single_fetch(self):
+        event = threading.Event()
+        provider = FakeProvider({'db': 'db secret'}, event)
+        resolver = SecretResolver({'vault': provider})
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(resolver.resolve_references(['vault:db']))) for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        while not provider.calls:
+            event.wait(0.01)
+        event.set()
+        for thread in threads:
+            thread.join()
+
+        assert [['db']] == provider.calls
+        assert [{'vault:db': 'db secret'}] * 5 == results
+
+
+class TestResolveSecrets:
+    """Tests secret_resolver parameter and method Config.resolve_secrets"""
+
+    def test_config_resolves_secrets_after_loading_files(self, tmp_path):
+        secret = tmp_path / 'password'
+        secret.write_text('s3cr3t\n')
+        settings = tmp_path / 'settings.json'
+        settings.write_text(f'{{"database": {{"password": "file:{secret}"}}}}')
+
+        config = Config(files=[f'{settings}'], secret_resolver=SecretResolver({'file': FileSecretProvider()}))
+
+        assert {'database': {'password': 's3cr3t'}} == config
+
+    def test_method_returns_resolved_references(self, resolver):
+        config = Config(password='vault:db')
+
+        assert ['vault:db'] == config.resolve_secrets(resolver)
+        assert 'db secret' == config['password']
@@ -0,0 +1,61 @@
+"""Tests selective module"""
+import json
+
+import pytest
+
+from configuror.selective import load_yaml_keys, parse_json_keys
+
+
+class TestParseJsonKeys:
+    """Tests function parse_json_keys"""
+
+    @pytest.mark.parametrize(
+        'skipped',
+        [
+            '"a string with \\\\ \\" ] } brackets"',
+            '{"nested": [1, {"list": ["]", "}"]}, 2.5e3], "flag": true}',
+            '[[], {}, [null]]',
+            '-12.5e-3',
+            'false',
+        ],
+    )
+    def test_should_drop_values_which_are_not_requested(self, skipped):
+        text = f'{{"first": 1, "skipped": {skipped}, "last": {{"name": "caf\\u00e9"}}}}'
+
+        assert json.loads(text)['last'] == parse_json_keys(text, frozenset(['last']))['last']
+        assert {'first': 1, 'last': {'name': 'café'}} == parse_json_keys(text, frozenset(['first', 'last']))
+
+    @pytest.mark.parametrize('text', ['  {  }  ', '{"a": 1}'])
+    def test_should_return_empty_dict_when_requested_keys_are_missing(self, text):
+        assert {} == parse_json_keys(text, frozenset(['b']))
+
+    @pytest.mark.parametrize(
+        'text',
+        [
+            '[1, 2]',
+            '{"a": 1',
+            '{"a" 1}',
+            '{"a": 1 "b": 2}',
+            '{"b": {"c": [1}, "a": 2}',
+            '{"b": "unterminated}',
+            '{"b": , "a": 2}',
+            '{"a": 1} extra',
+            '{a: 1}',
+        ],
+    )
+    def test_should_raise_error_when_document_is_not_valid(self, text):
+        with pytest.raises(json.JSONDecodeError):
+            parse_json_keys(text, frozenset(['a']))
+
+
+class TestLoadYamlKeys:
+    """Tests function load_yaml_keys"""
+
+    def test_should_only_build_requested_keys(self):
+        content = 'a: 1\nb: {c: [1, 2, {d: 3}]}\n? [complex, key]\n: 4\ne: [5]\n'
+
+        assert {'a': 1, 'e': [5]} == load_yaml_keys(content, frozenset(['a', 'e']))
+
+    @pytest.mark.parametrize('content', ['', '- 1\n- 2', 'foo'])
+    def test_should_return_document_when_it_is_not_a_mapping(self, content):
+        assert load_yaml_keys(content, frozenset(['a'])) == load_yaml_keys(content, frozenset())
@@ -0,0 +1,138 @@
+"""Tests class ConfigServer and methods Config.load_from_server and Config.from_server"""
+import os
+import socket
+import stat
+import threading
+from pathlib import Path
+
+import pytest
+
+from configuror.exceptions import DecodeError
+from configuror.main import Config
+from configuror.server import ConfigServer
+
+pytestmark = pytest.mark.skipif(not hasattr(socket, 'AF_UNIX'), reason='unix domain sockets are not available')
+
+
+class ConfigFactory:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return Config(files=['dummy.toml'], CALLS=self.calls)
+
+
+@pytest.fixture()
+def socket_path(tempdir):
+    # unix socket paths are limited to about 100 characters, so the short tempdir is used instead of tmp_path
+    return f'{Path(tempdir) / "config.sock"}'
+
+
+@pytest.fixture()
+def factory():
+    return ConfigFactory()
+
+
+@pytest.fixture()
+def server(socket_path, factory):
+    with ConfigServer(socket_path, factory) as config_server:
+        yield config_server
+
+
+def test_server_raises_error_when_factory_is_not_callable(socket_path):
+    with pytest.raises(TypeError) as exc_info:
+        ConfigServer(socket_path, 'foo')
+
+    assert 'factory must be a callable' == str(exc_info.value)
+
+
+@pytest.mark.usefixtures('server')
+def test_server_creates_a_socket_only_readable_by_its_user(socket_path):
+    assert 0o600 == stat.S_IMODE(os.stat(socket_path).st_mode)
+
+
+@pytest.mark.usefixtures('server')
+def test_clients_receive_the_configuration_parsed_once(socket_path, factory):
+    configs = [Config.from_server(socket_path, files=['dummy.yaml']) for _ in range(3)]
+
+    assert 1 == factory.calls
+    for config in configs:
+        assert 'TOML Example' == config['title']
+        # toml datetimes are sent as iso formatted strings
+        assert '1979-05-27T07:32:00-08:00' == config['owner']['dob']
+
+
+def test_clients_receive_new_snapshot_after_reload(server, socket_path):
+    server.reload()
+    config = Config()
+
+    assert config.load_from_server(socket_path) is True
+    assert 2 == config['CALLS']
+
+
+def test_server_removes_socket_when_closed(socket_path, factory):
+    config_server = ConfigServer(socket_path, factory)
+    config_server.start()
+    config_server.close()
+    config_server.close()
+
+    assert not os.path.exists(socket_path)
+
+
+def test_server_replaces_stale_socket_file(socket_path, factory):
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(socket_path)
+    stale.close()
+    with ConfigServer(socket_path, factory):
+        assert Config().load_from_server(socket_path) is True
+
+
+def test_server_refuses_to_replace_a_file_which_is_not_a_socket(socket_path, factory):
+    Path(socket_path).write_text('important')
+
+    with pytest.raises(FileExistsError) as exc_info:
+        ConfigServer(socket_path, factory).start()
+
+    assert f'{socket_path} already exists and is not a socket' == str(exc_info.value)
+    assert 'important' == Path(socket_path).read_text()
+
+
+@pytest.mark.usefixtures('server')
+def test_server_refuses_to_start_when_another_server_listens(socket_path, factory):
+    with pytest.raises(OSError) as exc_info:
+        ConfigServer(socket_path, factory).start()
+
+    assert f'a server is already listening on {socket_path}' == str(exc_info.value)
+
+
+def test_load_from_server_returns_false_when_no_server_is_available(socket_path):
+    config = Config()
+
+    assert config.load_from_server(socket_path) is False
+    assert {} == config
+
+
+def test_from_server_loads_configuration_locally_when_no_server_is_available(socket_path):
+    config = Config.from_server(socket_path, files=['dummy.yaml'], FOO='bar')
+
+    assert 'YAML Example' == config['title']
+    assert 'bar' == config['FOO']
+
+
+def test_load_from_server_raises_error_when_payload_is_not_valid(socket_path):
+    def serve_garbage():
+        connection, _ = listener.accept()
+        with connection:
+            connection.sendall(b'not json')
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as listener:
+        listener.bind(socket_path)
+        listener.listen()
+        thread = threading.Thread(target=serve_garbage)
+        thread.start()
+        with pytest.raises(DecodeError) as exc_info:
+            Config().load_from_server(socket_path)
+        thread.join()
+
+    assert f'{socket_path} is not well json formatted' == str(exc_info.value)
@@ -0,0 +1,114 @@
+"""Tests module shared"""
+import threading
+
+import pytest
+
+from configuror.history import ConfigHistory
+from configuror.main import Config
+from configuror.shared import ConfigSnapshot, SharedConfig
+
+
+class ConfigFactory:
+    """Builds configurations whose values all contain the number of calls, to detect mixed generations."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return Config(**{f'KEY_{index}': self.calls for index in range(100)})
+
+
+@pytest.fixture()
+def shared_config():
+    return SharedConfig(ConfigFactory())
+
+
+def test_shared_config_raises_error_when_factory_is_not_callable():
+    with pytest.raises(TypeError) as exc_info:
+        SharedConfig('foo')
+
+    assert 'factory must be a callable' == str(exc_info.value)
+
+
+def test_shared_config_builds_first_snapshot_at_initialization(shared_config):
+    assert 0 == shared_config.generation
+    assert 1 == shared_config.config['KEY_0']
+    assert isinstance(shared_config.snapshot, ConfigSnapshot)
+
+
+def test_snapshot_config_is_read_only(shared_config):
+    with pytest.raises(TypeError):
+        shared_config.config['KEY_0'] = 2
+
+
+def test_snapshot_nested_values_are_read_only():
+    shared_config = SharedConfig(lambda: Config(db={'host': 'localhost'}, hosts=['a', 'b']))
+
+    with pytest.raises(TypeError):
+        shared_config.config['db']['host'] = 'example.com'
+    with pytest.raises(AttributeError):
+        shared_config.config['hosts'].append('c')
+    assert {'host': 'localhost'} == shared_config.config['db']
+    assert ('a', 'b') == shared_config.config['hosts']
+
+
+def test_reload_publishes_a_new_snapshot_and_keeps_the_previous_one_intact(shared_config):
+    previous = shared_config.snapshot
+    snapshot = shared_config.reload()
+
+    assert snapshot is shared_config.snapshot
+    assert 1 == snapshot.generation == shared_config.generation
+    assert 2 == snapshot.config['KEY_0']
+    assert 1 == previous.config['KEY_0']
+
+
+def test_reload_keeps_current_snapshot_when_factory_fails(shared_config, mocker):
+    previous = shared_config.snapshot
+    shared_config._factory = mocker.Mock(side_effect=FileNotFoundError)
+    with pytest.raises(FileNotFoundError):
+        shared_config.reload()
+
+    assert previous is shared_config.snapshot
+
+
+def test_readers_always_see_a_consistent_snapshot_during_reloads(shared_config):
+    stop = threading.Event()
+    inconsistencies = []
+
+    def read():
+        while not stop.is_set():
+            config = shared_config.config
+            if len(set(config.values())) != 1:
+                inconsistencies.append(dict(config))
+
+    readers = [threading.Thread(target=read) for _ in range(4)]
+    for reader in readers:
+        reader.start()
+    for _ in range(50):
+        shared_config.reload()
+    stop.set()
+    for reader in readers:
+        reader.join()
+
+    assert [] == inconsistencies
+    assert 50 == shared_config.generation
+
+
+def test_shared_config_records_reloads_in_history_and_rolls_back():
+    history = ConfigHistory()
+    shared_config = SharedConfig(ConfigFactory(), history)
+    shared_config.reload()
+
+    assert [1, 2] == history.versions
+    assert 2 == shared_config.config['KEY_0']
+    snapshot = shared_config.rollback(1)
+    assert 2 == snapshot.generation
+    assert 1 == shared_config.config['KEY_0']
+
+
+def test_rollback_raises_error_without_history(shared_config):
+    with pytest.raises(ValueError) as exc_info:
+        shared_config.rollback(1)
+
+    assert 'a history is needed to roll back' == str(exc_info.value)
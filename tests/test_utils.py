@@ -9,12 +9,16 @@ from configuror.exceptions import DecodeError
 
 # noinspection PyProtectedMember
 from configuror.utils import (
+    ChangeSet,
     _sanitize_key_and_value,
     bool_converter,
     convert_ini_config_to_dict,
     decimal_list,
+    deduplicate_strings,
+    expand_variables,
     float_list,
     get_dict_from_dotenv_file,
+    import_optional,
     int_list,
     path_list,
     string_list,
@@ -47,6 +51,93 @@ class TestConvertIniConfigToDict:
         assert '192.168.1.1' == result_dict['databases']['server']
 
 
+class TestDeduplicateStrings:
+    """Tests function deduplicate_strings"""
+
+    def test_should_return_equal_data_with_shared_string_objects(self):
+        # strings are built at runtime to be sure they are distinct objects
+        data = [{''.join(['reg', 'ion']): ''.join(['eu-', 'west'])} for _ in range(3)]
+        result, saved_bytes = deduplicate_strings(data)
+
+        assert [{'region': 'eu-west'}] * 3 == result
+        keys = [next(iter(item)) for item in result]
+        values = [item['region'] for item in result]
+        assert keys[0] is keys[1] is keys[2]
+        assert values[0] is values[1] is values[2]
+        assert saved_bytes > 0
+
+    def test_should_not_deduplicate_long_string_values(self):
+        data = {'a': ''.join(['x'] * 10), 'b': ''.join(['x'] * 10)}
+        result, saved_bytes = deduplicate_strings(data, max_length=5)
+
+        assert data == result
+        assert result['a'] is not result['b']
+        assert 0 == saved_bytes
+
+    def test_should_update_containers_in_place_and_keep_key_order(self):
+        inner = {''.join(['b']): 1, ''.join(['a']): ''.join(['x', 'y'])}
+        data = {'a': 'xy', 'b': 2, 'items': [inner, ''.join(['x', 'y'])]}
+        result, saved_bytes = deduplicate_strings(data)
+
+        assert result is data
+        assert result['items'][0] is inner
+        assert ['b', 'a'] == list(inner)
+        assert list(inner)[1] is list(data)[0]
+        assert inner['a'] is data['a'] is data['items'][1]
+        assert saved_bytes > 0
+
+    def test_should_visit_shared_containers_once_when_shared_containers_flag_is_true(self):
+        shared = {'region': ''.join(['eu-', 'west'])}
+        loop = ['eu-west']
+        loop.append(loop)
+        data = {'a': shared, 'b': shared, 'loop': loop}
+        result, _ = deduplicate_strings(data, shared_containers=True)
+
+        assert result['a'] is result['b'] is shared
+        assert result['loop'][1] is loop
+        assert shared['region'] is loop[0]
+
+    @pytest.mark.parametrize('data', [2, 'foo', None, {1: 2.5}])
+    def test_should_return_data_unchanged_when_there_is_no_duplicate(self, data):
+        assert (data, 0) == deduplicate_strings(data)
+
+
+class TestChangeSet:
+    """Tests class ChangeSet"""
+
+    @pytest.mark.parametrize(
+        ('path', 'expected'),
+        [
+            (('database',), True),
+            (('database', 'pool'), True),
+            (('database', 'pool', 'size', 'min'), True),
+            (('database', 'host'), False),
+            (('debug',), True),
+            (('workers',), False),
+        ],
+    )
+    def test_affects_returns_true_when_path_or_one_of_its_parents_or_children_changed(self, path, expected):
+        change_set = ChangeSet(added=[('database', 'pool', 'size')], removed=[('debug',)], changed=[])
+
+        assert expected is change_set.affects(*path)
+
+
+class TestImportOptional:
+    """Tests function import_optional"""
+
+    def test_should_return_module_when_it_is_installed(self):
+        assert 'json' == import_optional('json').__name__
+
+    def test_should_raise_error_with_installation_hint_when_module_is_missing(self):
+        with pytest.raises(ImportError) as exc_info:
+            import_optional('configuror_missing_module')
+
+        message = (
+            'configuror_missing_module must be installed to use this file type: pip install configuror_missing_module'
+        )
+        assert message == str(exc_info.value)
+
+
 class TestSanitizeKeyAndValue:
     """Tests function _sanitize_key_and_value"""
 
@@ -68,6 +159,26 @@ class TestSanitizeKeyAndValue:
         assert expected_items == _sanitize_key_and_value(given_items)
 
 
+class TestExpandVariables:
+    """Tests function expand_variables"""
+
+    @pytest.mark.parametrize(
+        ('value', 'expected'),
+        [
+            ('no variable', 'no variable'),
+            ('$FOO/${BAR}', 'foo/bar'),
+            ('${HOME}', '/home/kevin'),
+            ('$UNKNOWN and ${UNKNOWN}', '$UNKNOWN and ${UNKNOWN}'),
+        ],
+    )
+    def test_should_expand_variables_and_environment_variables(self, monkeypatch, value, expected):
+        monkeypatch.setenv('HOME', '/home/kevin')
+        monkeypatch.setenv('FOO', 'environment')
+        monkeypatch.delenv('UNKNOWN', raising=False)
+
+        assert expected == expand_variables(value, {'FOO': 'foo', 'BAR': 'bar'})
+
+
 class TestGetDictFromDotEnvFile:
     """tests function get_dict_from_dotenv_file"""
 
@@ -0,0 +1,151 @@
+"""Tests module views"""
+import pytest
+
+from configuror.views import ConfigOverlay, NamespaceView
+
+
+@pytest.fixture()
+def base_config(config):
+    config.update({'database': {'host': 'localhost', 'pool': {'size': 5, 'timeout': 3}}, 'debug': False, 'name': 'app'})
+    return config
+
+
+class TestConfigOverlay:
+    """Tests class ConfigOverlay and method Config.overlay"""
+
+    def test_overlay_returns_overridden_and_base_values(self, base_config):
+        overlay = base_config.overlay({'debug': True}, tenant='acme')
+
+        assert overlay['debug'] is True
+        assert 'acme' == overlay['tenant']
+        assert 'app' == overlay['name']
+        assert 'acme' == overlay.get('tenant')
+        assert overlay.get('unknown') is None
+        with pytest.raises(KeyError):
+            overlay['unknown']  # noqa: B018
+
+    def test_overlay_merges_nested_overrides(self, base_config):
+        overlay = base_config.overlay({'database': {'pool': {'size': 10}}})
+
+        assert isinstance(overlay['database'], ConfigOverlay)
+        assert {'host': 'localhost', 'pool': {'size': 10, 'timeout': 3}} == overlay['database']
+        assert 5 == base_config['database']['pool']['size']
+
+    def test_overlay_replaces_base_value_when_it_is_not_a_mapping(self, base_config):
+        overlay = base_config.overlay(name={'first': 'app'})
+
+        assert {'first': 'app'} == overlay['name']
+
+    def test_overlay_supports_mapping_protocol(self, base_config):
+        overlay = base_config.overlay(debug=True, tenant='acme')
+
+        assert ['database', 'debug', 'name', 'tenant'] == list(overlay)
+        assert 4 == len(overlay)
+        assert 'tenant' in overlay
+        assert 'name' in overlay
+        assert 'unknown' not in overlay
+        assert {**base_config, 'debug': True, 'tenant': 'acme'} == dict(overlay)
+
+    def test_overlay_reflects_later_changes_of_the_base(self, base_config):
+        overlay = base_config.overlay(debug=True)
+        base_config['name'] = 'other'
+
+        assert 'other' == overlay['name']
+
+    def test_overlays_can_be_stacked(self, base_config):
+        overlay = base_config.overlay(debug=True).overlay({'name': 'request'})
+
+        assert overlay['debug'] is True
+        assert 'request' == overlay['name']
+        assert 'localhost' == overlay['database']['host']
+
+    def test_overlay_does_not_store_a_reference_to_given_overrides(self, base_config):
+        overrides = {'debug': True}
+        overlay = base_config.overlay(overrides)
+        overrides['debug'] = 'changed'
+
+        assert overlay['debug'] is True
+
+    def test_overlay_does_not_have_a_dict(self, base_config):
+        assert not hasattr(base_config.overlay(), '__dict__')
+
+
+@pytest.fixture()
+def namespace_config(config):
+    config.update({'IMAGE_STORE_TYPE': 'fs', 'IMAGE_STORE_PATH': '/var/app/images', 'WORKERS': 2, 4: 'foo'})
+    return config
+
+
+class TestNamespaceView:
+    """Tests class NamespaceView and method Config.namespace_view"""
+
+    @pytest.mark.parametrize(
+        ('lowercase', 'trim_namespace', 'key'),
+        [
+            (True, True, 'type'),
+            (False, True, 'TYPE'),
+            (True, False, 'image_store_type'),
+            (False, False, 'IMAGE_STORE_TYPE'),
+        ],
+    )
+    def test_view_is_equal_to_dict_from_namespace(self, namespace_config, lowercase, trim_namespace, key):
+        view = namespace_config.namespace_view('IMAGE_STORE_', lowercase, trim_namespace)
+
+        assert isinstance(view, NamespaceView)
+        assert namespace_config.get_dict_from_namespace('IMAGE_STORE_', lowercase, trim_namespace) == dict(view)
+        assert 'fs' == view[key]
+        assert key in view
+        assert 2 == len(view)
+
+    def test_view_does_not_copy_values(self, namespace_config):
+        namespace_config['IMAGE_STORE_SIZES'] = sizes = [1, 2]
+
+        assert namespace_config.namespace_view('IMAGE_STORE_')['sizes'] is sizes
+
+    def test_view_reflects_mutations_of_the_config(self, namespace_config):
+        view = namespace_config.namespace_view('IMAGE_STORE_')
+        assert 'fs' == view['type']
+
+        namespace_config['IMAGE_STORE_TYPE'] = 's3'
+        namespace_config.update(IMAGE_STORE_BUCKET='images')
+        del namespace_config['IMAGE_STORE_PATH']
+
+        assert {'type': 's3', 'bucket': 'images'} == dict(view)
+        with pytest.raises(KeyError):
+            view['path']  # noqa: B018
+
+    def test_view_only_builds_key_map_again_after_a_mutation(self, namespace_config):
+        view = namespace_config.namespace_view('IMAGE_STORE_')
+        view['type']  # noqa: B018
+        keys = view._keys
+
+        assert 'fs' == view['type']
+        assert keys is view._keys
+        namespace_config['OTHER'] = 1
+        assert 'fs' == view['type']
+        assert keys is not view._keys
+
+    @pytest.mark.parametrize(
+        'mutate',
+        [
+            lambda config: config.__setitem__('a', 1),
+            lambda config: config.__delitem__('WORKERS'),
+            lambda config: config.update(a=1),
+            lambda config: config.__ior__({'a': 1}),
+            lambda config: config.setdefault('a', 1),
+            lambda config: config.pop('WORKERS'),
+            lambda config: config.popitem(),
+            lambda config: config.clear(),
+        ],
+    )
+    def test_config_mutators_increment_mutation_counter(self, namespace_config, mutate):
+        mutations = namespace_config._mutations
+        mutate(namespace_config)
+
+        assert mutations + 1 == namespace_config._mutations
+
+    def test_config_setdefault_on_existing_key_does_not_increment_mutation_counter(self, namespace_config):
+        mutations = namespace_config._mutations
+
+        assert 2 == namespace_config.setdefault('WORKERS', 3)
+        assert mutations == namespace_config._mutations